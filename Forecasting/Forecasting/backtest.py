@@ -0,0 +1,124 @@
+import numpy as np
+import pandas as pd
+from statsmodels.tsa.holtwinters import ExponentialSmoothing
+from statsmodels.tsa.holtwinters.results import HoltWintersResultsWrapper
+
+
+# Forecast origins of a rolling-origin backtest: `folds` origins `stride` points
+# apart (by default `steps`, so the evaluated windows tile the end of the series),
+# the last one leaving exactly `steps` points to forecast
+def rolling_origins(n, steps, folds, stride=None):
+    stride = steps if stride is None else stride
+    origins = n - steps - stride * np.arange(folds - 1, -1, -1)
+    if origins[0] < 2:
+        raise ValueError(f"Series of length {n} is too short for {folds} folds of {steps} steps.")
+    return origins
+
+# Holt-Winters with the fitted smoothing parameters and initial states held fixed
+# over the whole series, so its level/trend/season arrays hold the states after
+# every observation
+def _apply_holt_winters(model_fit, series):
+    model = model_fit.model
+    params = model_fit.params
+    return ExponentialSmoothing(
+        series,
+        trend=model.trend,
+        seasonal=model.seasonal,
+        seasonal_periods=model.seasonal_periods,
+        damped_trend=model.damped_trend,
+        initialization_method='known',
+        initial_level=params['initial_level'],
+        initial_trend=params['initial_trend'] if model.has_trend else None,
+        initial_seasonal=params['initial_seasons'] if model.has_seasonal else None,
+    ).fit(
+        smoothing_level=params['smoothing_level'],
+        smoothing_trend=params['smoothing_trend'] if model.has_trend else None,
+        smoothing_seasonal=params['smoothing_seasonal'] if model.has_seasonal else None,
+        damping_trend=params['damping_trend'] if model.damped_trend else None,
+        optimized=False,
+    )
+
+def _holt_winters_forecasts(model_fit, series, origins, steps):
+    model = model_fit.model
+    params = model_fit.params
+    applied = _apply_holt_winters(model_fit, series)
+
+    # Prepend the initial states so that index t holds the states before observation t
+    levels = np.r_[params['initial_level'], np.asarray(applied.level)]
+    h = np.arange(1, steps + 1)
+    phi = params['damping_trend'] if model.damped_trend else 1.0
+    forecasts = np.repeat(levels[origins][:, None], steps, axis=1)
+    if model.has_trend:
+        trends = np.r_[params['initial_trend'], np.asarray(applied.trend)]
+        forecasts = forecasts + np.cumsum(phi ** h)[None, :] * trends[origins][:, None]
+    if model.has_seasonal:
+        m = model.seasonal_periods
+        seasons = np.r_[params['initial_seasons'], np.asarray(applied.season)]
+        index = origins[:, None] - 1 + h[None, :] - m * ((h[None, :] - 1) // m + 1) + m
+        if model.seasonal == 'mul':
+            forecasts = forecasts * seasons[index]
+        else:
+            forecasts = forecasts + seasons[index]
+    return forecasts
+
+# State space models are filtered once over the whole series with their fitted
+# parameters; the forecasts from every origin are then propagated together from
+# the one-step predicted states, one matrix product per horizon step
+def _state_space_forecasts(model_fit, series, origins, steps):
+    results = model_fit.apply(series).filter_results
+    design = results.design[:, :, 0]
+    transition = results.transition[:, :, 0]
+    obs_intercept = results.obs_intercept[:, 0]
+    state_intercept = results.state_intercept[:, 0]
+
+    states = results.predicted_state[:, origins]
+    forecasts = np.empty((len(origins), steps))
+    for h in range(steps):
+        forecasts[:, h] = obs_intercept[0] + design[0] @ states
+        states = state_intercept[:, None] + transition @ states
+    return forecasts
+
+# Forecasts of `steps` points from each origin, as a (folds, steps) array, from a
+# model fitted on the data before the first origin
+def origin_forecasts(model_fit, series, origins, steps):
+    origins = np.asarray(origins)
+    if isinstance(model_fit, HoltWintersResultsWrapper):
+        return _holt_winters_forecasts(model_fit, series, origins, steps)
+    return _state_space_forecasts(model_fit, series, origins, steps)
+
+def fold_metrics(actual, forecasts, origins):
+    errors = forecasts - actual
+    with np.errstate(divide='ignore', invalid='ignore'):
+        mape = np.mean(np.abs(errors) / np.abs(actual), axis=1) * 100
+    return pd.DataFrame({
+        'fold': np.arange(len(origins)),
+        'origin': origins,
+        'mse': np.mean(errors ** 2, axis=1),
+        'mae': np.mean(np.abs(errors), axis=1),
+        'mape': mape,
+    })
+
+# Evaluates a fitted model over the rolling origins of `series` without refitting,
+# returning one row of metrics per fold
+def evaluate_origins(model_fit, series, origins, steps):
+    values = np.asarray(series, dtype=np.float64)
+    origins = np.asarray(origins)
+    actual = values[origins[:, None] + np.arange(steps)[None, :]]
+    return fold_metrics(actual, origin_forecasts(model_fit, series, origins, steps), origins)
+
+# Rolling-origin backtest of one model: the parameters are estimated once on the
+# data before the first origin, then every fold is forecast from the filtered
+# state at its origin
+def backtest(series, model_type='arima', params=None, steps=1, folds=5, stride=None):
+    # Imported here since the optimizers in forecast use this module for scoring
+    from .forecast import _SEARCH_SPACES, _default_params
+
+    if model_type not in _SEARCH_SPACES:
+        raise ValueError(f"Unknown model_type: {model_type}. Choose from 'arima', 'sarima', or 'exponential_smoothing'.")
+    series = pd.Series(np.asarray(series, dtype=np.float64))
+    origins = rolling_origins(len(series), steps, folds, stride)
+    if params is None:
+        params = _default_params(model_type, series[:origins[0]])
+
+    model_fit = _SEARCH_SPACES[model_type][1](series[:origins[0]], params)
+    return evaluate_origins(model_fit, series, origins, steps)
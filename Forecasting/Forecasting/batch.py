@@ -0,0 +1,174 @@
+import json
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+import pandas as pd
+
+from .dataset import read_dataset
+from .forecast import (
+    forecast_arima,
+    forecast_sarima,
+    forecast_exponential_smoothing,
+    forecast_auto,
+    fit_model,
+    _default_seasonal_period,
+    _resolve_n_jobs,
+)
+from .holt_winters import _check_engine, fit_holt_winters
+from .preprocess import regularize
+from .results import DETAIL_COLUMNS, fit_details, _NO_DETAILS
+from .series_store import SeriesStore
+
+_FORECASTERS = {
+    'arima': forecast_arima,
+    'sarima': forecast_sarima,
+    'exponential_smoothing': forecast_exponential_smoothing,
+    'auto': forecast_auto,
+}
+
+DEFAULT_GROUP_BY = ('vm_id', 'name')
+
+# Forecasts one group; runs in the main process or in a pool worker. Failures are
+# returned rather than raised so that one bad series does not abort the batch.
+# With `details` the model is fitted through fit_model, so that its fit_details
+# are returned too, and a model that cannot be fitted is reported as an error.
+def _forecast_group(key, values, model_type, steps, optimize, optimize_kwargs, details=False):
+    series = pd.Series(values)
+    try:
+        if details:
+            started = time.perf_counter()
+            model_fit = fit_model(series, model_type, steps, optimize, **optimize_kwargs)
+            info = fit_details(model_fit, time.perf_counter() - started)
+            return key, np.asarray(model_fit.forecast(steps), dtype=float), None, info
+        forecast = _FORECASTERS[model_type](series, steps=steps, optimize=optimize, **optimize_kwargs)
+        return key, np.asarray(forecast, dtype=float), None, None
+    except Exception as e:
+        return key, np.full(steps, np.nan), str(e), None
+
+# Pool workers attach to the parent's shared series store once, through the
+# initializer, and then receive only the position of each series to forecast
+_worker_store = None
+
+def _attach_store(handle):
+    global _worker_store
+    _worker_store = SeriesStore.attach(handle)
+
+def _forecast_stored_group(i, model_type, steps, optimize, optimize_kwargs, details=False):
+    return _forecast_group(i, _worker_store[i], model_type, steps, optimize, optimize_kwargs, details)
+
+# The numpy engine fits every group sharing a length and seasonal period in one
+# vectorized Holt-Winters fit, instead of one statsmodels fit per group
+def _forecast_groups_vectorized(groups, steps):
+    results = [None] * len(groups)
+    buckets = {}
+    for i, (key, values) in enumerate(groups):
+        period = _default_seasonal_period(pd.Series(values))
+        if len(values) < 2 * period:
+            results[i] = (key, np.full(steps, np.nan), "Insufficient data for seasonal Exponential Smoothing.", None)
+            continue
+        buckets.setdefault((len(values), period), []).append(i)
+
+    for (length, period), indices in buckets.items():
+        started = time.perf_counter()
+        try:
+            fit = fit_holt_winters(np.vstack([groups[i][1] for i in indices]), 'add', period)
+            forecasts, errors = fit.forecast(steps), [None] * len(indices)
+        except Exception as e:
+            forecasts, errors = np.full((len(indices), steps), np.nan), [str(e)] * len(indices)
+        # The fit time of a bucket is shared evenly between its groups
+        order = json.dumps({'seasonal': 'add', 'seasonal_periods': period}, sort_keys=True)
+        seconds = (time.perf_counter() - started) / len(indices)
+        for row, (i, forecast, error) in enumerate(zip(indices, forecasts, errors)):
+            info = None
+            if error is None:
+                info = {'model_type': 'exponential_smoothing', 'order': order, 'mse': float(fit.sse[row]) / length,
+                        'aic': np.nan, 'fit_seconds': seconds}
+            results[i] = (groups[i][0], forecast, error, info)
+    return results
+
+# Streams only the key, value and time columns, with the keys as categoricals, so
+# that memory follows the number of rows rather than the width of the export, and
+# gathers the values into a series store with one series per group. With a time
+# column the rows of each group are put in time order, and with `freq` every
+# group is regularized to that interval in one vectorized pass.
+def _read_store(file_path, column_name, group_by, filters=None, shared=False, time_column=None, freq=None,
+                aggregation='mean', fill='interpolate'):
+    df = read_dataset(file_path, [column_name], key_columns=group_by, time_column=time_column, filters=filters)
+    if freq is not None and not df.empty:
+        df = regularize(df, column_name, time_column, group_by, freq, aggregation, fill)
+    elif time_column is not None and not df.empty:
+        df = df.sort_values(time_column, kind='stable')
+    return SeriesStore.from_frame(df, column_name, group_by, shared)
+
+# Batch forecasting: reads the file once, splits it into one series per group of
+# key columns and forecasts every group, optionally across a process pool. Pool
+# workers read their series from one shared-memory store instead of each being
+# sent a copy. With engine='numpy', default exponential smoothing fits run
+# vectorized in-process. `time_column` orders each group by time, and `freq`
+# resamples every group to a regular interval first (see preprocess.regularize).
+#
+# `details` adds the results.DETAIL_COLUMNS of every group's model to the frame:
+# its family, order, in-sample scores and fit time. A `sink` (a ResultWriter)
+# is also sent the frame, with details, to append to its dataset.
+def batch_forecasting(file_path, column_name, group_by=DEFAULT_GROUP_BY, model_type='arima', steps=1,
+                      optimize=False, n_jobs=1, seed=None, cache=None, filters=None, engine='statsmodels',
+                      time_column=None, freq=None, aggregation='mean', fill='interpolate', details=False, sink=None,
+                      **optimize_kwargs):
+    if model_type not in _FORECASTERS:
+        raise ValueError(f"Unknown model_type: {model_type}. "
+                         "Choose from 'arima', 'sarima', 'exponential_smoothing', or 'auto'.")
+    _check_engine(engine)
+    if engine != 'statsmodels' and (model_type != 'exponential_smoothing' or optimize):
+        raise ValueError(f"engine='{engine}' only supports exponential_smoothing without optimize.")
+    if freq is not None and time_column is None:
+        raise ValueError("Resampling to freq requires a time_column.")
+
+    group_by = list(group_by or [])
+    details = details or sink is not None
+    n_jobs = _resolve_n_jobs(n_jobs)
+    optimize_kwargs = dict(optimize_kwargs, seed=seed, cache=cache)
+
+    shared = n_jobs > 1 and engine == 'statsmodels'
+    with _read_store(file_path, column_name, group_by, filters, shared, time_column, freq, aggregation,
+                     fill) as store:
+        if engine == 'numpy':
+            results = _forecast_groups_vectorized(store.items(), steps)
+        elif n_jobs == 1 or len(store) <= 1:
+            # Copies, so that no model fitted here still refers to the store once it is closed
+            results = [_forecast_group(key, np.array(values), model_type, steps, optimize, optimize_kwargs,
+                                       details)
+                       for key, values in store.items()]
+        else:
+            with ProcessPoolExecutor(max_workers=min(n_jobs, len(store)), initializer=_attach_store,
+                                     initargs=(store.handle,)) as executor:
+                futures = [executor.submit(_forecast_stored_group, i, model_type, steps, optimize, optimize_kwargs,
+                                           details)
+                           for i in range(len(store))]
+                results = [(key, *future.result()[1:]) for key, future in zip(store.keys, futures)]
+
+    columns = [*group_by, 'step', 'forecast', 'error', *(DETAIL_COLUMNS if details else ())]
+    frames = []
+    for key, forecast, error, info in results:
+        frame = pd.DataFrame({'step': np.arange(1, steps + 1), 'forecast': forecast, 'error': error})
+        for column, value in zip(group_by, key):
+            frame.insert(len(frame.columns) - 3, column, value)
+        if details:
+            for column in DETAIL_COLUMNS:
+                frame[column] = (_NO_DETAILS if info is None else info)[column]
+        frames.append(frame)
+    forecasts = pd.concat(frames, ignore_index=True) if frames else pd.DataFrame(columns=columns)
+    if sink is not None:
+        sink.write(forecasts)
+    return forecasts
+
+# `python -m Forecasting.batch` is the forecasting command (see cli.main) with
+# --group-by defaulting to DEFAULT_GROUP_BY. cli imports this module, so it is
+# imported here when the command runs.
+def main(argv=None):
+    from .cli import main as cli_main
+    return cli_main(argv, group_by=list(DEFAULT_GROUP_BY))
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,122 @@
+import hashlib
+import json
+import os
+import pickle
+import tempfile
+import time
+
+import numpy as np
+import pandas as pd
+
+
+# On-disk cache of optimization results. Each entry is one pickle file named by
+# its key holding the best params and the fitted model. Hits refresh the file's
+# modification time, and eviction removes the least recently used files once the
+# entry count or total size exceeds the configured bounds.
+class ModelCache:
+
+    def __init__(self, directory, max_entries=256, max_bytes=None):
+        self.directory = directory
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        os.makedirs(directory, exist_ok=True)
+
+    # Hash of a series' values and, for a pandas series, its index and frequency:
+    # a cached model forecasts from the index it was fitted on, so the same values
+    # at other times or without timestamps need their own entry
+    @staticmethod
+    def fingerprint(series):
+        values = np.ascontiguousarray(np.asarray(series, dtype=np.float64))
+        digest = hashlib.sha256(values.tobytes())
+        index = getattr(series, 'index', None)
+        if index is not None:
+            digest.update(f"{type(index).__name__}:{getattr(index, 'freqstr', None)}".encode())
+            digest.update(pd.util.hash_pandas_object(index, index=False).to_numpy().tobytes())
+        return digest.hexdigest()
+
+    def key(self, series, model_type, steps, search_space, **options):
+        description = json.dumps({'model_type': model_type, 'steps': steps, 'search_space': search_space, **options},
+                                 sort_keys=True, default=str)
+        digest = hashlib.sha256(self.fingerprint(series).encode())
+        digest.update(description.encode())
+        return digest.hexdigest()
+
+    def _path(self, key):
+        return os.path.join(self.directory, f"{key}.pkl")
+
+    def get(self, key):
+        path = self._path(key)
+        try:
+            with open(path, 'rb') as f:
+                entry = pickle.load(f)
+        except OSError:
+            return None
+        except (EOFError, pickle.UnpicklingError, AttributeError, ImportError):
+            # A truncated entry, or one pickled by a version whose classes or
+            # modules no longer exist, will never load again, so it is dropped
+            self._remove(path)
+            return None
+        self._touch(path)
+        return entry
+
+    @staticmethod
+    def _touch(path):
+        # File systems stamp writes with a coarse clock, so recency is recorded
+        # explicitly with a nanosecond wall-clock time
+        now = time.time_ns()
+        try:
+            os.utime(path, ns=(now, now))
+        except OSError:
+            pass
+
+    @staticmethod
+    def _remove(path):
+        try:
+            os.remove(path)
+        except OSError:
+            pass
+
+    def put(self, key, entry):
+        # Write to a temporary file and rename so that concurrent readers in other
+        # processes never see a partially written entry
+        fd, temp_path = tempfile.mkstemp(dir=self.directory, suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                pickle.dump(entry, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(temp_path, self._path(key))
+            self._touch(self._path(key))
+        except BaseException:
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+            raise
+        self.evict()
+
+    def evict(self):
+        entries = []
+        for name in os.listdir(self.directory):
+            if not name.endswith('.pkl'):
+                continue
+            try:
+                stat = os.stat(os.path.join(self.directory, name))
+            except OSError:
+                continue
+            entries.append((stat.st_mtime_ns, stat.st_size, name))
+        entries.sort()
+
+        total_bytes = sum(size for _, size, _ in entries)
+        while entries and ((self.max_entries is not None and len(entries) > self.max_entries)
+                           or (self.max_bytes is not None and total_bytes > self.max_bytes)):
+            _, size, name = entries.pop(0)
+            try:
+                os.remove(os.path.join(self.directory, name))
+            except OSError:
+                pass
+            total_bytes -= size
+
+    def clear(self):
+        for name in os.listdir(self.directory):
+            if name.endswith('.pkl'):
+                os.remove(os.path.join(self.directory, name))
+
+    def __len__(self):
+        return sum(1 for name in os.listdir(self.directory) if name.endswith('.pkl'))
@@ -0,0 +1,176 @@
+import argparse
+import glob
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+import pandas as pd
+
+from .batch import batch_forecasting
+from .cache import ModelCache
+from .forecast import SEARCHES, main_forecasting, _resolve_n_jobs
+from .holt_winters import ENGINES
+from .preprocess import AGGREGATIONS
+from .results import DEFAULT_PARTITIONS, ResultWriter
+
+MODEL_TYPES = ('arima', 'sarima', 'exponential_smoothing', 'auto')
+OUTPUT_FORMATS = ('csv', 'json', 'parquet')
+
+# Expands the glob patterns among the inputs, keeping the order they were given in
+# and dropping repeats; a pattern that matches nothing is an error rather than an
+# empty run, so that a scheduled job fails loudly when its input is missing
+def expand_inputs(patterns):
+    files = []
+    for pattern in patterns:
+        matches = sorted(glob.glob(pattern)) if glob.has_magic(pattern) else [pattern]
+        if not matches:
+            raise FileNotFoundError(f"No files match '{pattern}'.")
+        files.extend(matches)
+    return list(dict.fromkeys(files))
+
+def _parse_filters(filters):
+    parsed = {}
+    for item in filters or []:
+        column, sep, value = item.partition('=')
+        if not sep:
+            raise ValueError(f"Filter '{item}' must be given as COLUMN=VALUE.")
+        parsed.setdefault(column, []).append(value)
+    return parsed
+
+def _output_format(output, output_format):
+    if output_format is not None:
+        return output_format
+    extension = os.path.splitext(output or '')[1].lower().lstrip('.')
+    if extension == 'pq':
+        return 'parquet'
+    return extension if extension in OUTPUT_FORMATS else 'csv'
+
+def _plot_path(plot_dir, file_path):
+    if plot_dir is None:
+        return None
+    return os.path.join(plot_dir, os.path.splitext(os.path.basename(file_path))[0] + '_forecast.png')
+
+# Forecasts one input file; runs in the main process or in a pool worker. Like the
+# batch groups, a failing file is reported in the error column instead of
+# aborting the other files. `details` adds each model's details, as in
+# batch_forecasting; a file without groups is then forecast as a single group,
+# unless it is plotted.
+def forecast_file(file_path, column_name, model_type='arima', steps=1, optimize=False, group_by=None,
+                  time_column=None, filters=None, plot_dir=None, n_jobs=1, details=False, **optimize_kwargs):
+    if group_by or (details and plot_dir is None):
+        frame = batch_forecasting(file_path, column_name, group_by=group_by, model_type=model_type, steps=steps,
+                                  optimize=optimize, n_jobs=n_jobs, filters=filters, time_column=time_column,
+                                  details=details, **optimize_kwargs)
+    else:
+        try:
+            forecast = main_forecasting(file_path, column_name, model_type=model_type, steps=steps,
+                                        optimize=optimize, plot=plot_dir is not None,
+                                        plot_path=_plot_path(plot_dir, file_path), time_column=time_column,
+                                        filters=filters, n_jobs=n_jobs, **optimize_kwargs)
+            forecast, error = np.asarray(forecast, dtype=float), None
+        except Exception as e:
+            forecast, error = np.full(steps, np.nan), str(e)
+        frame = pd.DataFrame({'step': np.arange(1, steps + 1), 'forecast': forecast, 'error': error})
+    frame.insert(0, 'file', file_path)
+    return frame
+
+# Forecasts every input file. Several files are spread over `n_jobs` processes,
+# one file per task; a single file gets the processes for its own optimization.
+def forecast_files(files, column_name, n_jobs=1, **kwargs):
+    n_jobs = _resolve_n_jobs(n_jobs)
+    if n_jobs == 1 or len(files) == 1:
+        frames = [forecast_file(file_path, column_name, n_jobs=n_jobs, **kwargs) for file_path in files]
+    else:
+        with ProcessPoolExecutor(max_workers=min(n_jobs, len(files))) as executor:
+            futures = [executor.submit(forecast_file, file_path, column_name, **kwargs) for file_path in files]
+            frames = [future.result() for future in futures]
+    return pd.concat(frames, ignore_index=True)
+
+def write_forecasts(forecasts, output=None, output_format='csv'):
+    if output_format == 'parquet':
+        forecasts.to_parquet(output if output else sys.stdout.buffer, index=False)
+    elif output_format == 'json':
+        text = forecasts.to_json(orient='records')
+        if output:
+            with open(output, 'w') as f:
+                f.write(text + '\n')
+        else:
+            sys.stdout.write(text + '\n')
+    else:
+        forecasts.to_csv(output if output else sys.stdout, index=False)
+
+def _parser(group_by=None):
+    parser = argparse.ArgumentParser(
+        prog='forecasting',
+        description='Forecast one column of one or more CSV, Parquet or Arrow files.')
+    parser.add_argument('files', nargs='+', help='input files or glob patterns')
+    parser.add_argument('--column', default='value')
+    parser.add_argument('--model', default='arima', choices=MODEL_TYPES)
+    parser.add_argument('--steps', type=int, default=1)
+    parser.add_argument('--optimize', action='store_true')
+    parser.add_argument('--trials', type=int, default=30, help='optimization trials per series')
+    parser.add_argument('--timeout', type=float, default=None,
+                        help='seconds after which optimization keeps the best model found so far')
+    parser.add_argument('--fit-timeout', type=float, default=None, help='seconds after which a single fit is abandoned')
+    parser.add_argument('--fit-maxiter', type=int, default=None, help='optimizer iterations allowed per fit')
+    parser.add_argument('--search', default='tpe', choices=SEARCHES)
+    parser.add_argument('--seed', type=int, default=None)
+    parser.add_argument('--cache-dir', default=None, help='directory of the optimized model cache')
+    parser.add_argument('--engine', default='statsmodels', choices=ENGINES,
+                        help="'numpy' fits default exponential smoothing models vectorized")
+    parser.add_argument('--jobs', type=int, default=1, help='worker processes; -1 uses every CPU')
+    parser.add_argument('--group-by', nargs='*', default=group_by,
+                        help='forecast one series per group of these key columns')
+    parser.add_argument('--time-column', default=None)
+    parser.add_argument('--freq', default=None,
+                        help="resample each series to this interval (e.g. 15min, h), or 'auto' for its own")
+    parser.add_argument('--aggregation', default='mean', choices=AGGREGATIONS,
+                        help='how values within one interval are combined when resampling')
+    parser.add_argument('--fill', default='interpolate', choices=('interpolate', 'ffill', 'zero', 'none'),
+                        help='how intervals without values are filled when resampling')
+    parser.add_argument('--filter', action='append', default=None, metavar='COLUMN=VALUE',
+                        help='keep only the rows where COLUMN equals VALUE; may be repeated')
+    parser.add_argument('--plot-dir', default=None, help='save one forecast plot per file in this directory')
+    parser.add_argument('--format', default=None, choices=OUTPUT_FORMATS,
+                        help='output format; inferred from --output, CSV by default')
+    parser.add_argument('--output', default=None, help='file to write; defaults to stdout')
+    parser.add_argument('--results', default=None,
+                        help='also append the forecasts and model details to this Parquet dataset directory')
+    parser.add_argument('--partition-by', nargs='*', default=list(DEFAULT_PARTITIONS),
+                        help='hive partition columns of the --results dataset')
+    return parser
+
+# Console entry point. Plots are only ever saved to files, so the command never
+# blocks on a window and can run from cron or a pipeline. Exits with status 1
+# when any series failed to forecast. `group_by` is the default of --group-by.
+def main(argv=None, group_by=None):
+    parser = _parser(group_by)
+    args = parser.parse_args(argv)
+    if args.engine != 'statsmodels' and (args.model != 'exponential_smoothing' or args.optimize):
+        parser.error(f"--engine {args.engine} only supports --model exponential_smoothing without --optimize")
+    files = expand_inputs(args.files)
+
+    kwargs = {'model_type': args.model, 'steps': args.steps, 'optimize': args.optimize,
+              'group_by': args.group_by, 'time_column': args.time_column, 'filters': _parse_filters(args.filter),
+              'plot_dir': args.plot_dir, 'details': args.results is not None}
+    if args.optimize:
+        kwargs.update(n_trials=args.trials, search=args.search, seed=args.seed, timeout=args.timeout,
+                      fit_timeout=args.fit_timeout, fit_maxiter=args.fit_maxiter,
+                      cache=ModelCache(args.cache_dir) if args.cache_dir else None)
+    if args.freq is not None:
+        kwargs.update(freq=args.freq, aggregation=args.aggregation, fill=None if args.fill == 'none' else args.fill)
+    if args.engine != 'statsmodels':
+        kwargs['engine'] = args.engine
+    if args.plot_dir:
+        os.makedirs(args.plot_dir, exist_ok=True)
+
+    forecasts = forecast_files(files, args.column, n_jobs=args.jobs, **kwargs)
+    if args.results is not None:
+        with ResultWriter(args.results, partition_by=args.partition_by) as sink:
+            sink.write(forecasts)
+    write_forecasts(forecasts, args.output, _output_format(args.output, args.format))
+    return 1 if forecasts['error'].notna().any() else 0
+
+if __name__ == '__main__':
+    sys.exit(main())
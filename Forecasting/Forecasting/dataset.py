@@ -0,0 +1,119 @@
+import os
+
+import numpy as np
+import pandas as pd
+
+_PARQUET_EXTENSIONS = ('.parquet', '.pq')
+_ARROW_EXTENSIONS = ('.arrow', '.feather', '.ipc')
+
+DEFAULT_CHUNKSIZE = 100_000
+
+def _file_format(file_path):
+    name = file_path.lower()
+    if name.endswith(_PARQUET_EXTENSIONS):
+        return 'parquet'
+    if name.endswith(_ARROW_EXTENSIONS):
+        return 'arrow'
+    return 'csv'
+
+def _require_pyarrow(purpose='Reading Parquet or Arrow files'):
+    try:
+        import pyarrow  # noqa: F401
+    except ImportError as e:
+        raise ImportError(f"{purpose} requires pyarrow: pip install pyarrow") from e
+
+def read_columns(file_path):
+    if not os.path.exists(file_path):
+        raise FileNotFoundError(f"File '{file_path}' not found.")
+
+    file_format = _file_format(file_path)
+    if file_format == 'csv':
+        return list(pd.read_csv(file_path, nrows=0).columns)
+    _require_pyarrow()
+    if file_format == 'parquet':
+        import pyarrow.parquet as pq
+        return list(pq.read_schema(file_path).names)
+    import pyarrow.ipc as ipc
+    with ipc.open_file(file_path) as reader:
+        return list(reader.schema.names)
+
+def _filter_mask(chunk, filters):
+    mask = np.ones(len(chunk), dtype=bool)
+    for column, value in filters.items():
+        values = value if isinstance(value, (list, tuple, set)) else [value]
+        mask &= chunk[column].isin(values).to_numpy()
+    return mask
+
+# Values are read as float64 and key columns as categoricals, so that the
+# repeated ids of long exports are stored once per chunk rather than per row
+def _dtypes(value_columns, key_columns):
+    dtypes = {column: 'float64' for column in value_columns}
+    dtypes.update({column: 'category' for column in key_columns})
+    return dtypes
+
+def _record_batches(file_path, file_format, columns, chunksize):
+    _require_pyarrow()
+    if file_format == 'parquet':
+        import pyarrow.parquet as pq
+        yield from pq.ParquetFile(file_path).iter_batches(batch_size=chunksize, columns=columns)
+        return
+    import pyarrow.ipc as ipc
+    with ipc.open_file(file_path) as reader:
+        for index in range(reader.num_record_batches):
+            yield reader.get_batch(index).select(columns)
+
+# Streams a file in chunks holding only the requested columns. `value_columns`
+# are parsed as float64, `key_columns` as categoricals and `time_column` into
+# datetimes; `filters` maps key columns to the value, or list of values, to keep,
+# and chunks are filtered as they are read so memory follows the selected rows.
+def iter_dataset(file_path, value_columns, key_columns=(), time_column=None, filters=None,
+                 chunksize=DEFAULT_CHUNKSIZE, time_format=None):
+    value_columns = [value_columns] if isinstance(value_columns, str) else list(value_columns)
+    filters = dict(filters or {})
+    key_columns = list(dict.fromkeys([*key_columns, *filters]))
+    columns = [*key_columns, *value_columns] + ([time_column] if time_column else [])
+
+    available = read_columns(file_path)
+    missing = [column for column in columns if column not in available]
+    if missing:
+        raise ValueError(f"Column(s) {missing} not found in the dataset.")
+
+    file_format = _file_format(file_path)
+    if file_format == 'csv':
+        chunks = pd.read_csv(file_path, usecols=columns, dtype=_dtypes(value_columns, key_columns),
+                             chunksize=chunksize)
+    else:
+        chunks = (batch.to_pandas() for batch in _record_batches(file_path, file_format, columns, chunksize))
+
+    for chunk in chunks:
+        if filters:
+            chunk = chunk[_filter_mask(chunk, filters)]
+        if time_column:
+            chunk[time_column] = pd.to_datetime(chunk[time_column], format=time_format)
+        yield chunk[columns]
+
+def read_dataset(file_path, value_columns, key_columns=(), time_column=None, filters=None,
+                 chunksize=DEFAULT_CHUNKSIZE, time_format=None):
+    chunks = list(iter_dataset(file_path, value_columns, key_columns=key_columns, time_column=time_column,
+                               filters=filters, chunksize=chunksize, time_format=time_format))
+    if not chunks:
+        return pd.DataFrame()
+    df = pd.concat(chunks, ignore_index=True)
+    # Categories can differ between chunks, which concat turns back into objects
+    for column in df.columns:
+        if column in key_columns or column in (filters or {}):
+            df[column] = df[column].astype('category')
+    return df
+
+# One column as a series, indexed by `time_column` parsed into a DatetimeIndex
+# when given and by position otherwise
+def load_series(file_path, column_name, time_column=None, filters=None, chunksize=DEFAULT_CHUNKSIZE,
+                time_format=None):
+    df = read_dataset(file_path, [column_name], time_column=time_column, filters=filters, chunksize=chunksize,
+                      time_format=time_format)
+    if df.empty:
+        return pd.Series([], dtype='float64', name=column_name)
+    series = df[column_name]
+    if time_column:
+        series.index = pd.DatetimeIndex(df[time_column], name=time_column)
+    return series
@@ -1,75 +1,667 @@
 import pandas as pd
-import optuna
 from statsmodels.tsa.arima.model import ARIMA
 from statsmodels.tsa.statespace.sarimax import SARIMAX
 from statsmodels.tsa.holtwinters import ExponentialSmoothing
-from sklearn.metrics import mean_squared_error
+from statsmodels.tools.sm_exceptions import ConvergenceWarning
+from statsmodels.tsa.holtwinters.results import HoltWintersResultsWrapper
+from .backtest import evaluate_origins, rolling_origins
+from .dataset import DEFAULT_CHUNKSIZE, load_series
+from .holt_winters import _check_engine, fit_holt_winters
+from .instrumentation import fit_event, fit_statistics, recording
+from .plotting import FIGSIZE, NON_INTERACTIVE_BACKENDS, draw_forecast, new_figure
+from .preprocess import regularize_series, with_frequency
+from .seasonality import detect_seasonality, seasonal_candidates
+import math
 import numpy as np
 import os
-import matplotlib.pyplot as plt
+import sys
+import time
+import warnings
+from concurrent.futures import ProcessPoolExecutor
 
-def load_dataset(file_path, column_name):
+# Loads one column of a CSV, Parquet or Arrow file. Only the needed columns are
+# read, in chunks of `chunksize` rows; `filters` keeps the rows whose key columns
+# hold the given value(s), e.g. {'vm_id': 'vm-1', 'name': 'Percentage CPU'}, and
+# `time_column` indexes the series by its parsed timestamps, with the index's
+# frequency set when they are regular. `freq` ('auto' for the data's own
+# interval) puts the series on a regular grid of that interval first, combining
+# the values in each interval by `aggregation` and filling gaps by `fill`.
+def load_dataset(file_path, column_name, time_column=None, filters=None, chunksize=DEFAULT_CHUNKSIZE,
+                 time_format=None, freq=None, aggregation='mean', fill='interpolate'):
     if not os.path.exists(file_path):
         raise FileNotFoundError(f"File '{file_path}' not found.")
+    if freq is not None and time_column is None:
+        raise ValueError("Resampling to freq requires a time_column.")
 
     try:
-        df = pd.read_csv(file_path)
-        if column_name not in df.columns:
-            raise ValueError(f"Column '{column_name}' not found in the dataset.")
-        
-        series = df[column_name]
-        return series
+        series = load_series(file_path, column_name, time_column=time_column, filters=filters, chunksize=chunksize,
+                             time_format=time_format)
     except Exception as e:
         raise ValueError(f"Error loading the dataset: {e}")
+    if time_column is None:
+        return series
+    if freq is not None:
+        return regularize_series(series, freq, aggregation, fill)
+    return with_frequency(series)
 
-import matplotlib.pyplot as plt
-
-import matplotlib.pyplot as plt
+# optuna and matplotlib are imported by the functions that use them, so that
+# importing this module for fitting alone (CLI runs, pool workers) stays cheap.
+# pyplot defaults to the headless Agg backend unless a backend was chosen through
+# MPLBACKEND or pyplot was already imported by the caller.
+def _pyplot():
+    if 'matplotlib.pyplot' not in sys.modules and not os.environ.get('MPLBACKEND'):
+        import matplotlib
+        matplotlib.use('Agg')
+    import matplotlib.pyplot as plt
+    return plt
 
+# Plots a series and its forecast. With `save_path` the plot is drawn on its own
+# Agg figure and saved without going through pyplot. Otherwise it is shown through
+# pyplot, which only opens a window on an interactive backend. The figure is
+# closed either way and returned. For many plots, or to keep plotting off the
+# forecasting path, use the plotting module's PlotRenderer, render_pdf and
+# render_grid.
 def plot_forecast(series, forecast_series, title='Forecast', forecast_label='Forecast', save_path=None):
-    plt.figure(figsize=(10, 6))
-    plt.plot(series, label='Actual Data')
-    plt.plot(forecast_series.index, forecast_series, label=forecast_label, color='red')
-    plt.title(title)
-    plt.xlabel('Time')
-    plt.ylabel('Value')
-    plt.legend()
-    
     if save_path:
-        plt.savefig(save_path)  
-        plt.close()  
-    if not save_path or not os.path.exists(save_path):
-        plt.show()  
+        figure = new_figure()
+        draw_forecast(figure.add_subplot(), series, forecast_series, title, forecast_label)
+        figure.savefig(save_path)
+        return figure
 
+    plt = _pyplot()
+    figure = plt.figure(figsize=FIGSIZE)
+    draw_forecast(figure.add_subplot(), series, forecast_series, title, forecast_label)
+    if plt.get_backend().lower() not in NON_INTERACTIVE_BACKENDS:
+        plt.show()
+    plt.close(figure)
+    return figure
 
-# ARIMA forecasting function with optimization using Optuna
-def optimize_arima(series, steps=1):
-    def objective(trial):
-        p = trial.suggest_int('p', 0, 5)
-        d = trial.suggest_int('d', 0, 2)
-        q = trial.suggest_int('q', 0, 5)
-        order = (p, d, q)
-        train = series[:-steps]
-        test = series[-steps:]
-        try:
-            model = ARIMA(train, order=order)
-            model_fit = model.fit()
-            forecast = model_fit.forecast(steps=steps)
-            return mean_squared_error(test, forecast)
-        except Exception as e:
-            return float('inf')  
-    
-    study = optuna.create_study(direction='minimize')
-    study.optimize(objective, n_trials=30)
-    best_params = study.best_params
-    best_order = (best_params['p'], best_params['d'], best_params['q'])
-    return ARIMA(series, order=best_order).fit()
 
-def forecast_arima(series, steps=1, optimize=False, plot=False, plot_path=None):
-    if optimize:
-        model_fit = optimize_arima(series, steps)
+# Search spaces: (low, high) tuples are integer ranges, lists are categorical choices
+ARIMA_SEARCH_SPACE = {'p': (0, 5), 'd': (0, 2), 'q': (0, 5)}
+SARIMA_SEARCH_SPACE = {'p': (0, 5), 'd': (0, 2), 'q': (0, 5), 'P': (0, 5), 'D': (0, 2), 'Q': (0, 5), 's': (4, 12)}
+EXPONENTIAL_SMOOTHING_SEARCH_SPACE = {'seasonal': ['add', 'mul'], 'seasonal_periods': (2, 12)}
+
+# Draws one candidate from an Optuna trial, returning None for combinations that
+# must not be fitted: overlapping MA lags (q == Q), seasonal lags that collide with
+# the non-seasonal ones, more differencing than the training data allows, and
+# multiplicative seasonality on non-positive data. Overlapping MA lags only
+# narrow the search, so warm-start candidates such as the default params, which
+# fit without trouble, are exempt from that rule (search=False in _is_valid).
+def _suggest(model_type, trial, space, series, steps, folds=1):
+    params = {}
+    for name, bounds in space.items():
+        if isinstance(bounds, list):
+            params[name] = trial.suggest_categorical(name, bounds)
+        else:
+            params[name] = trial.suggest_int(name, *bounds)
+
+    if not _is_valid(model_type, params, series, steps, folds, search=not trial.user_attrs.get('warm_start')):
+        trial.set_user_attr("invalid", True)
+        return None
+    return params
+
+def _is_valid(model_type, params, series, steps, folds=1, search=True):
+    n_train = len(series) - steps * folds
+    if model_type == 'arima':
+        return params['d'] < n_train
+    if model_type == 'sarima':
+        s = params['s']
+        if search and params['q'] == params['Q']:
+            return False
+        if (params['p'] >= s and params['P'] > 0) or (params['q'] >= s and params['Q'] > 0):
+            return False
+        return params['d'] + params['D'] * s < n_train
+    if params['seasonal'] == 'mul' and np.min(series) <= 0:
+        return False
+    return True
+
+# Optimizer callback that raises TimeoutError once `timeout` seconds have passed
+# since it was made. The optimizers call it between iterations, so a fit stops at
+# the end of the iteration that runs past the deadline.
+def _deadline(timeout):
+    if timeout is None:
+        return None
+    deadline = time.perf_counter() + timeout
+
+    def check(*args):
+        if time.perf_counter() > deadline:
+            raise TimeoutError(f"Fit exceeded the fit timeout of {timeout} seconds.")
+    return check
+
+# Fits one candidate. With `maxiter` the fit is cut short to give a cheap
+# intermediate score for pruning, and `start_params` resumes a fit from the
+# parameters such a partial fit reached. With `timeout` the fit is abandoned
+# with a TimeoutError once it has run that many seconds. `start_params` may also
+# be a dict of parameters by name, such as a smaller order fitted on the same
+# data; parameters it lacks start at zero.
+def _start_params(model, start_params):
+    if isinstance(start_params, dict):
+        return np.array([start_params.get(name, 0.0) for name in model.param_names])
+    return start_params
+
+def _fit_arima(train, params, maxiter=None, start_params=None, timeout=None):
+    model = ARIMA(train, order=(params['p'], params['d'], params['q']))
+    method_kwargs = {}
+    if maxiter is not None:
+        method_kwargs['maxiter'] = maxiter
+    if timeout is not None:
+        method_kwargs['callback'] = _deadline(timeout)
+    with warnings.catch_warnings():
+        if maxiter is not None:
+            warnings.simplefilter('ignore', ConvergenceWarning)
+        return model.fit(start_params=_start_params(model, start_params), method_kwargs=method_kwargs or None)
+
+def _fit_sarima(train, params, maxiter=None, start_params=None, timeout=None):
+    order = (params['p'], params['d'], params['q'])
+    seasonal_order = (params['P'], params['D'], params['Q'], params['s'])
+    model = SARIMAX(train, order=order, seasonal_order=seasonal_order)
+    with warnings.catch_warnings():
+        if maxiter is not None:
+            warnings.simplefilter('ignore', ConvergenceWarning)
+        return model.fit(start_params=_start_params(model, start_params), maxiter=50 if maxiter is None else maxiter,
+                         disp=False, callback=_deadline(timeout))
+
+def _fit_exponential_smoothing(train, params, maxiter=None, start_params=None, timeout=None):
+    model = ExponentialSmoothing(train, seasonal=params['seasonal'],
+                                 seasonal_periods=params['seasonal_periods'])
+    minimize_kwargs = {}
+    if maxiter is not None:
+        minimize_kwargs['options'] = {'maxiter': maxiter}
+    if timeout is not None:
+        minimize_kwargs['callback'] = _deadline(timeout)
+    with warnings.catch_warnings():
+        if maxiter is not None:
+            warnings.simplefilter('ignore', ConvergenceWarning)
+        return model.fit(minimize_kwargs=minimize_kwargs or None)
+
+# Search space, fit function and whether the fit supports a partial first fit
+_SEARCH_SPACES = {
+    'arima': (ARIMA_SEARCH_SPACE, _fit_arima, True),
+    'sarima': (SARIMA_SEARCH_SPACE, _fit_sarima, True),
+    'exponential_smoothing': (EXPONENTIAL_SMOOTHING_SEARCH_SPACE, _fit_exponential_smoothing, False),
+}
+
+# The data every trial of a study is scored on, prepared once per study rather
+# than per trial: the values as one contiguous float64 array, the training and
+# holdout slices of a single-holdout score, or the training slice and rolling
+# origins of a backtest. Slices are views of the values, so trials fit on plain
+# arrays without copying or going through the series' index. `fitted` keeps the
+# parameters fitted so far for each ARIMA or SARIMA order, by _order_key.
+class _StudyData:
+
+    def __init__(self, series, steps, folds=1):
+        self.values = np.ascontiguousarray(series, dtype=np.float64)
+        self.steps = steps
+        self.folds = folds
+        if folds == 1:
+            self.origins = None
+            self.train = self.values[:-steps]
+            self.test = self.values[-steps:]
+        else:
+            self.origins = rolling_origins(len(self.values), steps, folds)
+            self.train = self.values[:self.origins[0]]
+            self.test = None
+        self.fitted = {}
+        self._windows = {}
+
+    # The study data of the most recent `length` points, whose values are a view
+    # of these values; it is scored on the same holdout or origins at the end
+    def window(self, length):
+        if length >= len(self.values):
+            return self
+        if length not in self._windows:
+            self._windows[length] = _StudyData(self.values[-length:], self.steps, self.folds)
+        return self._windows[length]
+
+# Scores one candidate by its MSE. With folds=1 that is a single holdout of the
+# last `steps` points; with more folds the candidate is fitted once on the data
+# before the first origin and backtested over `folds` rolling origins. `series`
+# may be the _StudyData of a study. Returns the score and the fitted model.
+def _score(model_type, series, params, steps, maxiter=None, start_params=None, folds=1, fit_timeout=None):
+    data = series if isinstance(series, _StudyData) else _StudyData(series, steps, folds)
+    fit = _SEARCH_SPACES[model_type][1]
+    model_fit = fit(data.train, params, maxiter, start_params, fit_timeout)
+    if folds == 1:
+        value = np.mean((data.test - np.asarray(model_fit.forecast(steps=steps))) ** 2)
+    else:
+        value = evaluate_origins(model_fit, data.values, data.origins, steps)['mse'].mean()
+    return value, model_fit
+
+# Orders with the same differencing and seasonal period are fitted on the same
+# differenced data and differ only in their ARMA lags, so a smaller order's
+# fitted parameters, padded with zeros, are a valid start for a larger one:
+# the padded model is the smaller model itself. Keys are (differencing, lags).
+def _order_key(model_type, params):
+    if model_type == 'arima':
+        return (params['d'],), (params['p'], params['q'])
+    if model_type == 'sarima':
+        return (params['d'], params['D'], params['s']), (params['p'], params['q'], params['P'], params['Q'])
+    return None
+
+# Start parameters for `params` from the largest fitted order it nests, or None
+def _nested_start(model_type, params, fitted):
+    key = _order_key(model_type, params)
+    if key is None:
+        return None
+    differencing, lags = key
+    nested = [(sum(other_lags), start) for (other_differencing, other_lags), start in fitted.items()
+              if other_differencing == differencing and all(a <= b for a, b in zip(other_lags, lags))]
+    return max(nested, key=lambda item: item[0])[1] if nested else None
+
+def _default_params(model_type, series):
+    if model_type == 'arima':
+        return {'p': 1, 'd': 1, 'q': 1}
+    period = _default_seasonal_period(series)
+    if model_type == 'sarima':
+        return {'p': 1, 'd': 1, 'q': 1, 'P': 1, 'D': 1, 'Q': 1, 's': period}
+    return {'seasonal': 'add', 'seasonal_periods': period}
+
+# Optimizer iterations of the partial fit whose score is reported to the pruner
+_PRUNING_MAXITER = 10
+# Trials without improvement after which a pruned search stops early
+_DEFAULT_PATIENCE = 15
+# Trials after which a study that cannot beat `abandon_above` is abandoned
+_ABANDON_AFTER = 5
+
+# Returns the score, the error message of a failed fit, the fitted parameters
+# and, when instrumented, the record of the fit for its event
+def _evaluate(model_type, series, params, steps, maxiter=None, start_params=None, folds=1, instrumented=False,
+              fit_timeout=None):
+    record = {} if instrumented else None
+    try:
+        with recording(record):
+            value, model_fit = _score(model_type, series, params, steps, maxiter, start_params, folds, fit_timeout)
+            if record is not None:
+                record.update(fit_statistics(model_fit))
+        fitted_params = None
+        if not isinstance(model_fit, HoltWintersResultsWrapper):
+            fitted_params = dict(zip(model_fit.model.param_names, np.asarray(model_fit.params).tolist()))
+        return value, None, fitted_params, record
+    except Exception as e:
+        return float('inf'), str(e), None, record
+
+# Pool workers receive the study's data once through the initializer instead of
+# per trial
+_worker_series = None
+
+def _init_worker(series):
+    global _worker_series
+    _worker_series = series
+
+def _evaluate_in_worker(model_type, params, steps, maxiter=None, start_params=None, folds=1, instrumented=False,
+                        fit_timeout=None, window=None):
+    series = _worker_series if window is None else _worker_series.window(window)
+    return _evaluate(model_type, series, params, steps, maxiter, start_params, folds, instrumented, fit_timeout)
+
+def _resolve_n_jobs(n_jobs):
+    if n_jobs is None or n_jobs == 0:
+        return 1
+    if n_jobs < 0:
+        return max(1, (os.cpu_count() or 1) + 1 + n_jobs)
+    return n_jobs
+
+# Evaluates (params, maxiter, start_params) calls on the study's data, or on its
+# most recent `window` points
+def _evaluate_all(executor, model_type, series, steps, folds, calls, instrumented=False, fit_timeout=None,
+                  window=None):
+    if executor is None:
+        series = series if window is None else series.window(window)
+        return [_evaluate(model_type, series, params, steps, maxiter, start_params, folds, instrumented, fit_timeout)
+                for params, maxiter, start_params in calls]
+    futures = [executor.submit(_evaluate_in_worker, model_type, params, steps, maxiter, start_params, folds,
+                               instrumented, fit_timeout, window)
+               for params, maxiter, start_params in calls]
+    return [future.result() for future in futures]
+
+def _warm_start_trials(warm_start, space):
+    if warm_start is None:
+        return []
+    if isinstance(warm_start, dict):
+        warm_start = [warm_start]
+
+    trials = []
+    for params in warm_start:
+        params = {name: value for name, value in params.items() if name in space}
+        if len(params) != len(space):
+            continue
+        in_space = all(value in bounds if isinstance(bounds, list) else bounds[0] <= value <= bounds[1]
+                       for value, bounds in ((params[name], space[name]) for name in space))
+        if in_space:
+            trials.append(params)
+    return trials
+
+# Ways to search the candidates of a study, see _run_study
+SEARCHES = ('tpe', 'pruned', 'halving')
+
+# Successive halving (search='halving'): every rung fits the surviving
+# candidates on the most recent points of the series, in a window _HALVING_ETA
+# times longer than the previous rung's, and promotes the best 1 / _HALVING_ETA of
+# them; the last rung fits on the whole series. The shortest window holds at
+# least _HALVING_MIN_TRAIN training points and _HALVING_SEASONS of the longest
+# seasonal period searched.
+_HALVING_ETA = 3
+_HALVING_MIN_TRAIN = 48
+_HALVING_SEASONS = 4
+
+def _longest_period(space):
+    bounds = space.get('s', space.get('seasonal_periods'))
+    return 0 if bounds is None else max(bounds)
+
+# Window lengths of the rungs, shortest first
+def _halving_windows(space, n, steps, folds=1):
+    shortest = steps * folds + max(_HALVING_MIN_TRAIN, _HALVING_SEASONS * _longest_period(space))
+    windows = [n]
+    while windows[-1] // _HALVING_ETA >= shortest:
+        windows.append(windows[-1] // _HALVING_ETA)
+    return windows[::-1]
+
+# Runs a halving study on the study's data: all n_trials candidates are asked up
+# front, scored on the shortest window, and pruned rung by rung; the survivors of
+# the last rung are told with their score on the whole series. Promoted ARIMA and
+# SARIMA candidates resume from their fit on the previous window. Once `timeout`
+# has passed, only the best candidate so far is promoted, straight to the whole
+# series. Returns the best score.
+def _successive_halving(study, model_type, series, data, steps, n_trials, space, folds, executor, emit_fit,
+                        emit_trial, instrumented=False, fit_timeout=None, fit_maxiter=None, timeout=None,
+                        started=None):
+    import optuna
+    staged = _SEARCH_SPACES[model_type][2]
+    candidates = []
+    asked = 0
+    while len(candidates) < n_trials and asked < 10 * n_trials:
+        trial = study.ask()
+        asked += 1
+        params = _suggest(model_type, trial, space, series, steps, folds)
+        if params is None:
+            study.tell(trial, float('inf'))
+            emit_trial(trial, 'invalid', None)
+            continue
+        candidates.append((trial, params, None))
+
+    windows = _halving_windows(space, len(series), steps, folds)
+    best_value = float('inf')
+    rung = 0
+    while True:
+        final = windows[rung] == len(series)
+        calls = [(params, fit_maxiter, start if staged else None) for _, params, start in candidates]
+        results = _evaluate_all(executor, model_type, data, steps, folds, calls, instrumented, fit_timeout,
+                                windows[rung])
+        survivors = []
+        for (trial, params, _), (value, error, fitted_params, record) in zip(candidates, results):
+            emit_fit(trial, params, 'full' if final else 'partial', record)
+            if error is not None:
+                trial.set_user_attr("exception", error)
+                study.tell(trial, float('inf'))
+                emit_trial(trial, 'failed', None)
+            elif final:
+                study.tell(trial, value)
+                emit_trial(trial, 'complete', value)
+                best_value = min(best_value, value)
+            else:
+                trial.report(value, rung)
+                survivors.append((value, trial, params, fitted_params))
+        if final:
+            return best_value
+
+        survivors.sort(key=lambda survivor: survivor[0])
+        keep = max(1, math.ceil(len(survivors) / _HALVING_ETA))
+        rung += 1
+        if timeout is not None and time.perf_counter() - started >= timeout:
+            study.set_user_attr('timed_out', True)
+            keep = 1
+            rung = len(windows) - 1
+        for value, trial, _, _ in survivors[keep:]:
+            study.tell(trial, state=optuna.trial.TrialState.PRUNED)
+            emit_trial(trial, 'pruned', value)
+        candidates = [(trial, params, fitted_params) for _, trial, params, fitted_params in survivors[:keep]]
+
+# Runs the Optuna study with the ask/tell interface. Trials are asked in waves of
+# n_jobs and told back in ask order, so a fixed seed reproduces the same study for
+# a given n_jobs whether the fits run in-process or in a process pool.
+#
+# Invalid candidates are told as failed without fitting and do not count towards
+# n_trials. With search='pruned', ARIMA and SARIMA candidates are first fitted for
+# a few optimizer iterations and the resulting holdout score is reported to a
+# median pruner; survivors resume from the partial fit. The pruned search also
+# stops once the best score has not improved for `patience` trials. `warm_start`
+# params (a dict or a list of dicts) are evaluated first. `folds` > 1 scores each
+# candidate with a rolling-origin backtest instead of a single holdout.
+#
+# The series is prepared once as a _StudyData shared by every trial. ARIMA and
+# SARIMA fits start from the parameters of the largest order already fitted that
+# they nest (see _order_key), which usually needs fewer optimizer iterations
+# than statsmodels' own starting values.
+#
+# With an `instrumentation`, every fit, trial and the study itself are reported
+# to it as events; fits in pool workers send their records back with the score.
+# With `abandon_above`, the study is abandoned once _ABANDON_AFTER trials have been
+# evaluated without any scoring below it, and marked with the 'abandoned' attr.
+#
+# `timeout` caps the wall time of the whole study: no new trials start once it has
+# passed, and the study is marked with the 'timed_out' attr and keeps the best
+# result found so far. The first wave of trials always runs. `fit_timeout` (in
+# seconds) and `fit_maxiter` cap every single fit; a fit that runs out of time
+# fails its trial instead of stalling the study.
+#
+# search='halving' runs _successive_halving instead of asking in waves, for long
+# series where fitting every candidate on the whole series is too slow; it has
+# no patience and is never abandoned.
+def _run_study(model_type, series, steps, n_trials=30, n_jobs=1, seed=None, search='tpe', warm_start=None,
+               patience=None, space=None, folds=1, instrumentation=None, abandon_above=None, timeout=None,
+               fit_timeout=None, fit_maxiter=None):
+    if search not in SEARCHES:
+        raise ValueError(f"Unknown search: {search}. Choose from {', '.join(SEARCHES)}.")
+    default_space, _, staged = _SEARCH_SPACES[model_type]
+    space = default_space if space is None else space
+    pruned = search == 'pruned'
+    if pruned and patience is None:
+        patience = _DEFAULT_PATIENCE
+    n_jobs = _resolve_n_jobs(n_jobs)
+    partial_maxiter = _PRUNING_MAXITER if fit_maxiter is None else min(_PRUNING_MAXITER, fit_maxiter)
+
+    import optuna
+    pruner = optuna.pruners.MedianPruner(n_startup_trials=5) if pruned else optuna.pruners.NopPruner()
+    study = optuna.create_study(direction='minimize', sampler=optuna.samplers.TPESampler(seed=seed), pruner=pruner)
+    for params in _warm_start_trials(warm_start, space):
+        study.enqueue_trial(params, user_attrs={'warm_start': True})
+
+    instrumented = instrumentation is not None
+    started = time.perf_counter()
+    trial_seconds = {}
+
+    def emit_fit(trial, params, stage, record):
+        if instrumented:
+            trial_seconds[trial.number] = trial_seconds.get(trial.number, 0.0) + (record.get('duration') or 0.0)
+            instrumentation.emit(fit_event(model_type, params, stage, trial.number, record))
+
+    def emit_trial(trial, state, value):
+        if instrumented:
+            instrumentation.emit({'event': 'trial', 'model_type': model_type, 'trial': trial.number, 'state': state,
+                                  'value': value, 'duration': trial_seconds.pop(trial.number, 0.0)})
+
+    data = _StudyData(series, steps, folds)
+    executor = None
+    if n_jobs > 1:
+        executor = ProcessPoolExecutor(max_workers=n_jobs, initializer=_init_worker, initargs=(data,))
+    try:
+        evaluated = 0
+        asked = 0
+        max_asks = 10 * n_trials
+        best_value = float('inf')
+        since_best = 0
+        if search == 'halving':
+            best_value = _successive_halving(study, model_type, series, data, steps, n_trials, space, folds, executor,
+                                             emit_fit, emit_trial, instrumented, fit_timeout, fit_maxiter, timeout,
+                                             started)
+        while search != 'halving' and evaluated < n_trials and asked < max_asks:
+            wave = []
+            while len(wave) < min(n_jobs, n_trials - evaluated) and asked < max_asks:
+                trial = study.ask()
+                asked += 1
+                params = _suggest(model_type, trial, space, series, steps, folds)
+                if params is None:
+                    study.tell(trial, float('inf'))
+                    emit_trial(trial, 'invalid', None)
+                    continue
+                wave.append((trial, params))
+            if not wave:
+                break
+            evaluated += len(wave)
+
+            start_params = [_nested_start(model_type, params, data.fitted) for _, params in wave]
+            if pruned and staged:
+                calls = [(params, partial_maxiter, start) for (_, params), start in zip(wave, start_params)]
+                partial = _evaluate_all(executor, model_type, data, steps, folds, calls, instrumented, fit_timeout)
+                survivors = []
+                for (trial, params), (value, error, fitted_params, record) in zip(wave, partial):
+                    emit_fit(trial, params, 'partial', record)
+                    if error is not None:
+                        trial.set_user_attr("exception", error)
+                        study.tell(trial, float('inf'))
+                        emit_trial(trial, 'failed', None)
+                        continue
+                    trial.report(value, 0)
+                    if trial.should_prune():
+                        study.tell(trial, state=optuna.trial.TrialState.PRUNED)
+                        emit_trial(trial, 'pruned', value)
+                        since_best += 1
+                        continue
+                    survivors.append((trial, params, fitted_params))
+                wave = [(trial, params) for trial, params, _ in survivors]
+                start_params = [fitted_params for _, _, fitted_params in survivors]
+
+            results = _evaluate_all(executor, model_type, data, steps, folds,
+                                    [(params, fit_maxiter, start) for (_, params), start in zip(wave, start_params)],
+                                    instrumented, fit_timeout)
+            for (trial, params), (value, error, fitted_params, record) in zip(wave, results):
+                emit_fit(trial, params, 'full', record)
+                if error is not None:
+                    trial.set_user_attr("exception", error)
+                elif staged:
+                    data.fitted[_order_key(model_type, params)] = fitted_params
+                study.tell(trial, value)
+                emit_trial(trial, 'complete' if error is None else 'failed', value)
+                if value < best_value:
+                    best_value = value
+                    since_best = 0
+                else:
+                    since_best += 1
+
+            if patience is not None and since_best >= patience:
+                break
+            if abandon_above is not None and evaluated >= _ABANDON_AFTER and not best_value < abandon_above:
+                study.set_user_attr('abandoned', True)
+                break
+            if timeout is not None and time.perf_counter() - started >= timeout:
+                study.set_user_attr('timed_out', True)
+                break
+    finally:
+        if executor is not None:
+            executor.shutdown()
+    if instrumented:
+        instrumentation.emit({'event': 'study', 'model_type': model_type, 'search': search, 'trials': len(study.trials),
+                              'best_value': best_value, 'duration': time.perf_counter() - started})
+    return study
+
+# Refit of the best params on the whole series, reported as a 'final' fit event.
+# `fit_maxiter` and `fit_timeout` cap it like every fit of the search, so a
+# refit that runs out of time raises the TimeoutError instead of stalling.
+def _final_fit(instrumentation, model_type, series, params, fit_maxiter=None, fit_timeout=None):
+    def fit():
+        return _SEARCH_SPACES[model_type][1](series, params, fit_maxiter, None, fit_timeout)
+
+    if instrumentation is None:
+        return fit()
+    record = {}
+    try:
+        with recording(record):
+            model_fit = fit()
+            record.update(fit_statistics(model_fit))
+    finally:
+        instrumentation.emit(fit_event(model_type, params, 'final', None, record))
+    return model_fit
+
+def _best_trial(study):
+    import optuna
+    completed = [trial for trial in study.trials
+                 if trial.state == optuna.trial.TrialState.COMPLETE and not trial.user_attrs.get("invalid", False)]
+    if not completed:
+        return None
+    return min(completed, key=lambda t: t.value)
+
+# Fallback seasonal period when none is detected in the series
+_DEFAULT_SEASONAL_PERIOD = 12
+
+def _default_seasonal_period(series):
+    period = detect_seasonality(series)
+    return period if period is not None else _DEFAULT_SEASONAL_PERIOD
+
+# Search space with the seasonal period narrowed down. 'auto' replaces the integer
+# range with the periods detected in the series, keeping the range when none is
+# found; an int or a list of ints fixes the candidates and None keeps the range.
+def _search_space(model_type, series, seasonal_period):
+    space = dict(_SEARCH_SPACES[model_type][0])
+    name = {'sarima': 's', 'exponential_smoothing': 'seasonal_periods'}.get(model_type)
+    if name is None or seasonal_period is None:
+        return space
+
+    if seasonal_period == 'auto':
+        candidates = seasonal_candidates(series)
+    elif isinstance(seasonal_period, int):
+        candidates = [seasonal_period]
     else:
-        model_fit = ARIMA(series, order=(1, 1, 1)).fit()
+        candidates = [int(period) for period in seasonal_period]
+    if candidates:
+        space[name] = candidates
+    return space
+
+# Looks the optimized model up in the cache, running `optimize` and storing its
+# result on a miss. A miss is warm-started from the best params last found for the
+# same series values under any steps or search space. `optimize` returns the best
+# params, the fitted model and its study; a study that ran out of its timeout is
+# not cached, so that a later search with more time is not served its result.
+def _cached_optimization(cache, model_type, series, steps, space, optimize, warm_start, **options):
+    if cache is None:
+        return optimize(warm_start)[1]
+
+    key = cache.key(series, model_type, steps, space, **options)
+    entry = cache.get(key)
+    if entry is not None:
+        return entry['model_fit']
+
+    params_key = cache.key(series, model_type, None, None)
+    if warm_start is None:
+        previous = cache.get(params_key)
+        warm_start = previous['params'] if previous is not None else None
+
+    best_params, model_fit, study = optimize(warm_start)
+    if not study.user_attrs.get('timed_out'):
+        cache.put(key, {'params': best_params, 'model_fit': model_fit})
+    cache.put(params_key, {'params': best_params})
+    return model_fit
+
+# Options that change the result of a search, and so belong in its cache key
+def _search_options(n_trials, search, folds, fit_timeout, fit_maxiter):
+    return {'n_trials': n_trials, 'search': search, 'folds': folds, 'fit_timeout': fit_timeout,
+            'fit_maxiter': fit_maxiter}
+
+# ARIMA forecasting function with optimization using Optuna
+def optimize_arima(series, steps=1, n_trials=30, n_jobs=1, seed=None, cache=None, search='tpe', warm_start=None,
+                   patience=None, folds=1, instrumentation=None, timeout=None, fit_timeout=None, fit_maxiter=None):
+    def optimize(warm_start):
+        study = _run_study('arima', series, steps, n_trials=n_trials, n_jobs=n_jobs, seed=seed, search=search,
+                           warm_start=warm_start, patience=patience, folds=folds, instrumentation=instrumentation,
+                           timeout=timeout, fit_timeout=fit_timeout, fit_maxiter=fit_maxiter)
+        best_params = study.best_params
+        model_fit = _final_fit(instrumentation, 'arima', series, best_params, fit_maxiter, fit_timeout)
+        return best_params, model_fit, study
+
+    return _cached_optimization(cache, 'arima', series, steps, _SEARCH_SPACES['arima'][0], optimize, warm_start,
+                                **_search_options(n_trials, search, folds, fit_timeout, fit_maxiter))
+
+def forecast_arima(series, steps=1, optimize=False, plot=False, plot_path=None, **optimize_kwargs):
+    model_fit = fit_model(series, 'arima', steps, optimize=optimize, **optimize_kwargs)
     
     forecast = model_fit.forecast(steps=steps)
     forecast_series = pd.Series(forecast, name='Forecast')
@@ -80,56 +672,34 @@ def forecast_arima(series, steps=1, optimize=False, plot=False, plot_path=None):
     return forecast_series
 
 # SARIMA forecasting function with optimization
-def optimize_sarima(series, steps=1):
-    def objective(trial):
-        p = trial.suggest_int('p', 0, 5)
-        d = trial.suggest_int('d', 0, 2)
-        q = trial.suggest_int('q', 0, 5)
-        P = trial.suggest_int('P', 0, 5)
-        D = trial.suggest_int('D', 0, 2)
-        Q = trial.suggest_int('Q', 0, 5)
-        s = trial.suggest_int('s', 4, 12)
-
-        if q == Q:
-            trial.set_user_attr("invalid", True)
-            return float('inf') 
-        
-        order = (p, d, q)
-        seasonal_order = (P, D, Q, s)
-        train = series[:-steps]
-        test = series[-steps:]
-        try:
-            model = SARIMAX(train, order=order, seasonal_order=seasonal_order)
-            model_fit = model.fit(disp=False)
-            forecast = model_fit.forecast(steps=steps)
-            return mean_squared_error(test, forecast)
-        except Exception as e:
-            trial.set_user_attr("exception", str(e))
-            return float('inf')
-    
-    study = optuna.create_study(direction='minimize')
-    study.optimize(objective, n_trials=30)
-    
-    valid_trials = [trial for trial in study.trials if not trial.user_attrs.get("invalid", False)]
-    if not valid_trials:
-        raise ValueError("All trials were invalid due to overlapping MA lags.")
-    
-    best_trial = min(valid_trials, key=lambda t: t.value)
-    best_params = best_trial.params
-    best_order = (best_params['p'], best_params['d'], best_params['q'])
-    best_seasonal_order = (best_params['P'], best_params['D'], best_params['Q'], best_params['s'])
-    
-    return SARIMAX(series, order=best_order, seasonal_order=best_seasonal_order).fit()
+def optimize_sarima(series, steps=1, n_trials=30, n_jobs=1, seed=None, cache=None, search='tpe', warm_start=None,
+                    patience=None, seasonal_period='auto', folds=1, instrumentation=None, timeout=None,
+                    fit_timeout=None, fit_maxiter=None):
+    space = _search_space('sarima', series[:-steps], seasonal_period)
 
-def forecast_sarima(series, steps=1, optimize=False, plot=False, plot_path=None):
-    if optimize:
-        model_fit = optimize_sarima(series, steps)
-    else:
-        try:
-            model_fit = SARIMAX(series, order=(1, 1, 1), seasonal_order=(1, 1, 1, 12)).fit(disp=False)
-        except np.linalg.LinAlgError:
-            print("SARIMA fitting error: Schur decomposition solver failed.")
-            return pd.Series([None] * steps, name='Forecast')
+    def optimize(warm_start):
+        study = _run_study('sarima', series, steps, n_trials=n_trials, n_jobs=n_jobs, seed=seed, search=search,
+                           warm_start=warm_start, patience=patience, space=space, folds=folds,
+                           instrumentation=instrumentation, timeout=timeout, fit_timeout=fit_timeout,
+                           fit_maxiter=fit_maxiter)
+
+        best_trial = _best_trial(study)
+        if best_trial is None:
+            raise ValueError("All trials were invalid due to overlapping MA lags.")
+
+        best_params = best_trial.params
+        model_fit = _final_fit(instrumentation, 'sarima', series, best_params, fit_maxiter, fit_timeout)
+        return best_params, model_fit, study
+
+    return _cached_optimization(cache, 'sarima', series, steps, space, optimize, warm_start,
+                                **_search_options(n_trials, search, folds, fit_timeout, fit_maxiter))
+
+def forecast_sarima(series, steps=1, optimize=False, plot=False, plot_path=None, **optimize_kwargs):
+    try:
+        model_fit = fit_model(series, 'sarima', steps, optimize=optimize, **optimize_kwargs)
+    except np.linalg.LinAlgError:
+        print("SARIMA fitting error: Schur decomposition solver failed.")
+        return pd.Series([None] * steps, name='Forecast')
     
     try:
         forecast = model_fit.forecast(steps=steps)
@@ -144,34 +714,34 @@ def forecast_sarima(series, steps=1, optimize=False, plot=False, plot_path=None)
         return pd.Series([None] * steps, name='Forecast')
 
 # Exponential Smoothing forecasting function with optimization
-def optimize_exponential_smoothing(series, steps=1):
-    def objective(trial):
-        seasonal = trial.suggest_categorical('seasonal', ['add', 'mul'])
-        seasonal_periods = trial.suggest_int('seasonal_periods', 2, 12)
-        train = series[:-steps]
-        test = series[-steps:]
-        try:
-            model = ExponentialSmoothing(train, seasonal=seasonal, seasonal_periods=seasonal_periods)
-            model_fit = model.fit()
-            forecast = model_fit.forecast(steps=steps)
-            return mean_squared_error(test, forecast)
-        except ValueError:
-            return float('inf')
-    
-    study = optuna.create_study(direction='minimize')
-    study.optimize(objective, n_trials=30)
-    best_params = study.best_params
-    return ExponentialSmoothing(series, seasonal=best_params['seasonal'], 
-                                seasonal_periods=best_params['seasonal_periods']).fit()
+def optimize_exponential_smoothing(series, steps=1, n_trials=30, n_jobs=1, seed=None, cache=None, search='tpe',
+                                   warm_start=None, patience=None, seasonal_period='auto', folds=1,
+                                   instrumentation=None, timeout=None, fit_timeout=None, fit_maxiter=None):
+    space = _search_space('exponential_smoothing', series[:-steps], seasonal_period)
 
-def forecast_exponential_smoothing(series, steps=1, optimize=False, plot=False, plot_path=None):
-    if optimize:
-        model_fit = optimize_exponential_smoothing(series, steps)
-    else:
-        if len(series) < 24:
-            print("Insufficient data for seasonal Exponential Smoothing.")
-            return pd.Series([None] * steps, name='Forecast')
-        model_fit = ExponentialSmoothing(series, seasonal='add', seasonal_periods=12).fit()
+    def optimize(warm_start):
+        study = _run_study('exponential_smoothing', series, steps, n_trials=n_trials, n_jobs=n_jobs, seed=seed,
+                           search=search, warm_start=warm_start, patience=patience, space=space, folds=folds,
+                           instrumentation=instrumentation, timeout=timeout, fit_timeout=fit_timeout,
+                           fit_maxiter=fit_maxiter)
+        best_params = study.best_params
+        model_fit = _final_fit(instrumentation, 'exponential_smoothing', series, best_params, fit_maxiter,
+                               fit_timeout)
+        return best_params, model_fit, study
+
+    return _cached_optimization(cache, 'exponential_smoothing', series, steps, space, optimize, warm_start,
+                                **_search_options(n_trials, search, folds, fit_timeout, fit_maxiter))
+
+# engine='numpy' fits the default model with the vectorized Holt-Winters engine
+# and returns its forecasts through equivalent statsmodels results
+def forecast_exponential_smoothing(series, steps=1, optimize=False, plot=False, plot_path=None, engine='statsmodels',
+                                   **optimize_kwargs):
+    try:
+        model_fit = fit_model(series, 'exponential_smoothing', steps, optimize=optimize, engine=engine,
+                              **optimize_kwargs)
+    except _InsufficientData as e:
+        print(e)
+        return pd.Series([None] * steps, name='Forecast')
     
     forecast = model_fit.forecast(steps=steps)
     forecast_series = pd.Series(forecast, name='Forecast')
@@ -181,15 +751,227 @@ def forecast_exponential_smoothing(series, steps=1, optimize=False, plot=False,
 
     return forecast_series
 
+# Model families tried by model_type='auto', cheapest to fit first
+AUTO_MODEL_TYPES = ('exponential_smoothing', 'arima', 'sarima')
+
+def _evaluated_trials(study):
+    return sum(1 for trial in study.trials if not trial.user_attrs.get("invalid", False))
+
+# Picks the model family and params with the lowest holdout (or backtest) MSE.
+# Without optimization every family is scored with its default params. With
+# optimization the families share `n_trials` and `timeout` seconds, cheapest
+# first: each family's study starts from its default params, gets an equal share
+# of the trials left and hands unused ones on, runs for at most the time left,
+# and is abandoned once it has had a few trials without getting below the best
+# score so far. Once some family has been fitted, families reached after
+# `timeout` seconds are skipped. `fit_timeout` and `fit_maxiter` cap every fit.
+# Returns the winning model type, params and model fitted on the whole series,
+# and a leaderboard with one row per family.
+def select_model(series, steps=1, optimize=False, n_trials=30, timeout=None, model_types=AUTO_MODEL_TYPES, n_jobs=1,
+                 seed=None, cache=None, search='tpe', folds=1, instrumentation=None, fit_timeout=None,
+                 fit_maxiter=None):
+    for model_type in model_types:
+        if model_type not in _SEARCH_SPACES:
+            raise ValueError(f"Unknown model_type: {model_type}. "
+                             "Choose from 'arima', 'sarima', or 'exponential_smoothing'.")
+
+    key = None
+    if cache is not None:
+        key = cache.key(series, 'auto', steps, None, model_types=list(model_types), optimize=optimize,
+                        **_search_options(n_trials if optimize else None, search if optimize else None, folds,
+                                          fit_timeout, fit_maxiter))
+        entry = cache.get(key)
+        if entry is not None:
+            return entry['model_type'], entry['params'], entry['model_fit'], entry['leaderboard']
+
+    started = time.perf_counter()
+    rows = []
+    best_value = float('inf')
+    remaining = n_trials
+    for i, model_type in enumerate(model_types):
+        family_started = time.perf_counter()
+        params = _default_params(model_type, series)
+        row = {'model_type': model_type, 'status': 'complete', 'score': float('inf'), 'params': params,
+               'trials': 0, 'seconds': 0.0, 'error': None}
+        time_left = None if timeout is None else max(0.0, timeout - (family_started - started))
+        if time_left == 0.0 and best_value < float('inf'):
+            row['status'] = 'skipped'
+        elif optimize:
+            study = _run_study(model_type, series, steps, n_trials=max(1, remaining // (len(model_types) - i)),
+                               n_jobs=n_jobs, seed=seed, search=search, warm_start=params,
+                               space=_search_space(model_type, series[:-steps], 'auto'), folds=folds,
+                               instrumentation=instrumentation,
+                               abandon_above=best_value if best_value < float('inf') else None,
+                               timeout=time_left, fit_timeout=fit_timeout, fit_maxiter=fit_maxiter)
+            row['trials'] = _evaluated_trials(study)
+            remaining = max(0, remaining - row['trials'])
+            best_trial = _best_trial(study)
+            if best_trial is not None and best_trial.value < float('inf'):
+                row['score'], row['params'] = best_trial.value, best_trial.params
+            else:
+                row['status'] = 'failed'
+            if study.user_attrs.get('abandoned'):
+                row['status'] = 'abandoned'
+            elif study.user_attrs.get('timed_out') and row['status'] == 'complete':
+                row['status'] = 'timed_out'
+        else:
+            row['trials'] = 1
+            if _is_valid(model_type, params, series, steps, folds, search=False):
+                row['score'], row['error'] = _evaluate(model_type, series, params, steps, folds=folds,
+                                                       fit_timeout=fit_timeout)[:2]
+            else:
+                row['error'] = 'Invalid default params for this series.'
+            if row['error'] is not None:
+                row['status'] = 'failed'
+        row['seconds'] = time.perf_counter() - family_started
+        best_value = min(best_value, row['score'])
+        rows.append(row)
+
+    leaderboard = pd.DataFrame(rows).sort_values('score', kind='stable').reset_index(drop=True)
+    winner = leaderboard.iloc[0]
+    if not winner['score'] < float('inf'):
+        raise ValueError("No model family could be fitted to the series.")
+    model_type, params = winner['model_type'], winner['params']
+    model_fit = _final_fit(instrumentation, model_type, series, params, fit_maxiter, fit_timeout)
+
+    # A selection cut short by the timeout is not cached, like a timed out study
+    truncated = leaderboard['status'].isin(['skipped', 'timed_out']).any()
+    if key is not None and not truncated:
+        cache.put(key, {'model_type': model_type, 'params': params, 'model_fit': model_fit,
+                        'leaderboard': leaderboard})
+    return model_type, params, model_fit, leaderboard
+
+# Forecast of the family select_model picks; the forecast's attrs hold the
+# winning model type and the leaderboard
+def forecast_auto(series, steps=1, optimize=False, plot=False, plot_path=None, **optimize_kwargs):
+    model_type, _, model_fit, leaderboard = select_model(series, steps, optimize=optimize, **optimize_kwargs)
+
+    forecast_series = pd.Series(model_fit.forecast(steps=steps), name='Forecast')
+    forecast_series.attrs['model_type'] = model_type
+    forecast_series.attrs['leaderboard'] = leaderboard
+
+    if plot:
+        title = f"Auto Forecast ({model_type.replace('_', ' ').title()})"
+        plot_forecast(series, forecast_series, title=title, save_path=plot_path)
+
+    return forecast_series
+
+# Optimizer of each model family
+_OPTIMIZERS = {
+    'arima': optimize_arima,
+    'sarima': optimize_sarima,
+    'exponential_smoothing': optimize_exponential_smoothing,
+}
+
+# Series too short for the seasonal model; forecast_exponential_smoothing reports
+# it and returns an empty forecast instead of raising
+class _InsufficientData(ValueError):
+    pass
+
+# The model each forecast function fits, without forecasting from it: the
+# optimized model with `optimize`, otherwise the family's default params
+def fit_model(series, model_type='arima', steps=1, optimize=False, engine='statsmodels', **optimize_kwargs):
+    if model_type == 'auto':
+        return select_model(series, steps, optimize=optimize, **optimize_kwargs)[2]
+    if model_type not in _OPTIMIZERS:
+        raise ValueError(f"Unknown model_type: {model_type}. "
+                         "Choose from 'arima', 'sarima', 'exponential_smoothing', or 'auto'.")
+    if model_type == 'exponential_smoothing':
+        _check_engine(engine)
+        if optimize and engine != 'statsmodels':
+            raise ValueError(f"engine='{engine}' does not support optimize=True.")
+    if optimize:
+        return _OPTIMIZERS[model_type](series, steps, **optimize_kwargs)
+
+    params = _default_params(model_type, series)
+    if model_type == 'exponential_smoothing':
+        if len(series) < 2 * params['seasonal_periods']:
+            raise _InsufficientData("Insufficient data for seasonal Exponential Smoothing.")
+        if engine == 'numpy':
+            return fit_holt_winters(series, 'add', params['seasonal_periods']).to_statsmodels(0, index=series.index)
+    return _SEARCH_SPACES[model_type][1](series, params)
+
+# Interval levels used when none are given
+DEFAULT_LEVELS = (0.8, 0.95)
+# Simulated paths behind Holt-Winters intervals
+_SIMULATIONS = 1000
+
+def _horizons(horizons):
+    horizons = list(range(1, horizons + 1)) if isinstance(horizons, (int, np.integer)) else sorted(set(horizons))
+    if not horizons or min(horizons) < 1:
+        raise ValueError("Horizons must be positive numbers of steps.")
+    return [int(h) for h in horizons]
+
+def _level_name(level):
+    return f"{100 * level:g}"
+
+# Point forecasts and prediction intervals of a fitted model at each horizon,
+# from one forecast out to the longest horizon: `horizons` is a number of steps
+# (every step up to it) or a list of steps ahead, e.g. [1, 24, 168]. State space
+# models (ARIMA, SARIMA) give analytic intervals through get_forecast;
+# Holt-Winters intervals are the quantiles of `simulations` simulated paths.
+# Returns one row per horizon, indexed like model_fit.forecast, with a horizon
+# column, the forecast and lower_<level>/upper_<level> columns per level.
+def prediction_frame(model_fit, horizons, levels=DEFAULT_LEVELS, simulations=_SIMULATIONS, random_state=None):
+    horizons = _horizons(horizons)
+    levels = list(levels)
+    if any(not 0 < level < 1 for level in levels):
+        raise ValueError("Interval levels must be between 0 and 1.")
+    steps = horizons[-1]
+
+    bounds = {}
+    if isinstance(model_fit, HoltWintersResultsWrapper):
+        forecast = model_fit.forecast(steps)
+        paths = np.asarray(model_fit.simulate(steps, repetitions=simulations, anchor='end', random_state=random_state))
+        paths = paths.reshape(steps, -1)
+        for level in levels:
+            bounds[level] = np.quantile(paths, [(1 - level) / 2, (1 + level) / 2], axis=1).T
+    else:
+        prediction = model_fit.get_forecast(steps)
+        forecast = prediction.predicted_mean
+        for level in levels:
+            bounds[level] = np.asarray(prediction.conf_int(alpha=1 - level))
+
+    rows = np.array(horizons) - 1
+    frame = pd.DataFrame({'horizon': horizons, 'forecast': np.asarray(forecast)[rows]}, index=forecast.index[rows])
+    for level in levels:
+        frame[f"lower_{_level_name(level)}"] = bounds[level][rows, 0]
+        frame[f"upper_{_level_name(level)}"] = bounds[level][rows, 1]
+    return frame
+
+# Forecast frame with prediction intervals at several horizons from one fit of
+# the series; optimization scores candidates on the longest horizon
+def forecast_intervals(series, model_type='arima', horizons=1, levels=DEFAULT_LEVELS, optimize=False,
+                       random_state=None, **optimize_kwargs):
+    steps = _horizons(horizons)[-1]
+    model_fit = fit_model(series, model_type, steps, optimize=optimize, **optimize_kwargs)
+    return prediction_frame(model_fit, horizons, levels, random_state=random_state)
+
 # Main function for forecasting
-def main_forecasting(file_path, column_name, model_type='arima', steps=1, optimize=False, plot=False, plot_path=None):
-    series = load_dataset(file_path, column_name)
+def main_forecasting(file_path, column_name, model_type='arima', steps=1, optimize=False, plot=False, plot_path=None,
+                     time_column=None, filters=None, levels=None, horizons=None, freq=None, aggregation='mean',
+                     fill='interpolate', **optimize_kwargs):
+    series = load_dataset(file_path, column_name, time_column=time_column, filters=filters, freq=freq,
+                          aggregation=aggregation, fill=fill)
+
+    # With interval levels or horizons, returns the forecast frame of forecast_intervals instead
+    if levels is not None or horizons is not None:
+        frame = forecast_intervals(series, model_type, horizons=steps if horizons is None else horizons,
+                                   levels=DEFAULT_LEVELS if levels is None else levels, optimize=optimize,
+                                   **optimize_kwargs)
+        if plot:
+            plot_forecast(series, frame['forecast'], title='Forecast', save_path=plot_path)
+        return frame
 
     if model_type == 'arima':
-        return forecast_arima(series, steps=steps, optimize=optimize, plot=plot, plot_path=plot_path)
+        return forecast_arima(series, steps=steps, optimize=optimize, plot=plot, plot_path=plot_path, **optimize_kwargs)
     elif model_type == 'sarima':
-        return forecast_sarima(series, steps=steps, optimize=optimize, plot=plot, plot_path=plot_path)
+        return forecast_sarima(series, steps=steps, optimize=optimize, plot=plot, plot_path=plot_path, **optimize_kwargs)
     elif model_type == 'exponential_smoothing':
-        return forecast_exponential_smoothing(series, steps=steps, optimize=optimize, plot=plot, plot_path=plot_path)
+        return forecast_exponential_smoothing(series, steps=steps, optimize=optimize, plot=plot,
+                                              plot_path=plot_path, **optimize_kwargs)
+    elif model_type == 'auto':
+        return forecast_auto(series, steps=steps, optimize=optimize, plot=plot, plot_path=plot_path, **optimize_kwargs)
     else:
-        raise ValueError(f"Unknown model_type: {model_type}. Choose from 'arima', 'sarima', or 'exponential_smoothing'.")
+        raise ValueError(f"Unknown model_type: {model_type}. "
+                         "Choose from 'arima', 'sarima', 'exponential_smoothing', or 'auto'.")
@@ -0,0 +1,217 @@
+import numpy as np
+import pandas as pd
+from statsmodels.tsa.holtwinters import ExponentialSmoothing
+
+ENGINES = ('statsmodels', 'numpy')
+
+# Points per smoothing parameter in each round of the grid search, and the number
+# of rounds; every round after the first searches a box a fifth the size of the
+# previous one, centred on each series' best point so far
+_GRID_SIZE = 7
+_TREND_GRID_SIZE = 5
+_ROUNDS = 3
+_SHRINK = 0.2
+
+def _check_engine(engine):
+    if engine not in ENGINES:
+        raise ValueError(f"Unknown engine: {engine}. Choose from 'statsmodels' or 'numpy'.")
+
+# Initial states from the first two seasonal cycles: the level is the mean of the
+# first cycle, the trend the change in mean between the two cycles per step, and
+# the seasonal states the first cycle's deviations from its mean
+def _initial_states(values, seasonal, m, trend):
+    first = values[:, :m]
+    level = first.mean(axis=1)
+    slope = (values[:, m:2 * m].mean(axis=1) - level) / m if trend else np.zeros(len(values))
+    seasons = first / level[:, None] if seasonal == 'mul' else first - level[:, None]
+    return level, slope, seasons
+
+# The Holt-Winters recursion in the form statsmodels uses, run over every series
+# and every candidate at once: `values` is (series, n), the smoothing parameters
+# and initial states broadcast to (series, candidates[, m]). Returns the sum of
+# squared one-step errors and the states after the last observation; `fitted`,
+# when given as a (series, n, candidates) array, receives the one-step predictions.
+def _recursion(values, seasonal, m, alpha, beta, gamma, level, slope, seasons, fitted=None):
+    shape = np.broadcast_shapes(alpha.shape, level.shape)
+    level = np.broadcast_to(level, shape).copy()
+    slope = np.broadcast_to(slope, shape).copy()
+    seasons = np.broadcast_to(seasons, (*shape, m)).copy()
+    sse = np.zeros(shape)
+    multiplicative = seasonal == 'mul'
+
+    for t in range(values.shape[1]):
+        y = values[:, t, None]
+        season = seasons[:, :, t % m]
+        base = level + slope
+        prediction = base * season if multiplicative else base + season
+        sse += (y - prediction) ** 2
+        if fitted is not None:
+            fitted[:, t] = prediction
+        if multiplicative:
+            new_level = alpha * y / season + (1 - alpha) * base
+            seasons[:, :, t % m] = gamma * y / base + (1 - gamma) * season
+        else:
+            new_level = alpha * (y - season) + (1 - alpha) * base
+            seasons[:, :, t % m] = gamma * (y - base) + (1 - gamma) * season
+        slope = beta * (new_level - level) + (1 - beta) * slope
+        level = new_level
+    return sse, level, slope, seasons
+
+# Smoothing parameters from points of the unit cube, so that every point respects
+# the bounds statsmodels fits within: beta <= alpha and gamma <= 1 - alpha
+def _smoothing(unit):
+    alpha = unit[..., 0]
+    return alpha, unit[..., 1] * alpha, unit[..., 2] * (1 - alpha)
+
+def _grid(size, trend):
+    axis = np.linspace(0, 1, size)
+    trend_axis = axis if trend else np.zeros(1)
+    return np.stack(np.meshgrid(axis, trend_axis, axis, indexing='ij'), axis=-1).reshape(-1, 3) - 0.5
+
+# Grid search over the smoothing parameters of every series at once, starting
+# from a box of side `width` around `best_unit` and shrinking it each round
+def _search(values, seasonal, m, states, offsets, rounds, best_unit, width):
+    level, slope, seasons = (state[:, None] for state in states)
+    rows = np.arange(len(values))
+    best_sse = np.full(len(values), np.inf)
+    for _ in range(rounds):
+        unit = np.clip(best_unit[:, None, :] + width * offsets[None, :, :], 0, 1)
+        with np.errstate(divide='ignore', invalid='ignore', over='ignore'):
+            sse = _recursion(values, seasonal, m, *_smoothing(unit), level, slope, seasons)[0]
+        sse = np.where(np.isfinite(sse), sse, np.inf)
+        index = sse.argmin(axis=1)
+        improved = sse[rows, index] < best_sse
+        best_unit = np.where(improved[:, None], unit[rows, index], best_unit)
+        best_sse = np.where(improved, sse[rows, index], best_sse)
+        width *= _SHRINK
+    return best_unit
+
+# Initial states minimising the squared one-step errors for fixed smoothing
+# parameters. With additive seasonality the predictions are affine in the initial
+# states, so one run from zero states and one per unit state give the columns of
+# a least-squares problem per series, solved for all series together.
+def _fitted_initial_states(values, m, has_trend, unit):
+    n_series = len(values)
+    k = m + 2
+    basis = np.eye(k)[None, :, :].repeat(n_series, axis=0)
+    starts = np.concatenate([np.zeros((n_series, 1, k)), basis], axis=1)
+    alpha, beta, gamma = (param[:, None] for param in _smoothing(unit))
+
+    fitted = np.empty((n_series, values.shape[1], k + 1))
+    _recursion(values, 'add', m, alpha, beta, gamma, starts[:, :, 0], starts[:, :, 1], starts[:, :, 2:], fitted)
+    columns = fitted[:, :, 1:] - fitted[:, :, :1]
+    if not has_trend:
+        columns[:, :, 1] = 0
+    solution = np.linalg.pinv(columns, rcond=1e-10) @ (values - fitted[:, :, 0])[:, :, None]
+    solution = solution[:, :, 0]
+    return solution[:, 0], solution[:, 1], solution[:, 2:]
+
+# Holt-Winters fitted to a batch of equal-length series at once, minimising each
+# series' sum of squared one-step errors. The smoothing parameters are found by a
+# grid search refined over `rounds` rounds, from initial states taken from the
+# first two seasonal cycles. With additive seasonality the initial states are then
+# re-estimated by least squares and the search refined once more around the best
+# parameters; multiplicative models keep the heuristic initial states.
+def fit_holt_winters(values, seasonal='add', seasonal_periods=12, trend=None, rounds=_ROUNDS, grid_size=None):
+    values = np.atleast_2d(np.asarray(values, dtype=np.float64))
+    m = seasonal_periods
+    if seasonal not in ('add', 'mul'):
+        raise ValueError(f"Unknown seasonal: {seasonal}. Choose from 'add' or 'mul'.")
+    if trend not in (None, 'add'):
+        raise ValueError(f"Unknown trend: {trend}. Choose from None or 'add'.")
+    if values.shape[1] < 2 * m:
+        raise ValueError(f"Series of length {values.shape[1]} are too short for seasonal period {m}.")
+    if not np.isfinite(values).all():
+        raise ValueError("Series must not contain missing or infinite values.")
+    if seasonal == 'mul' and (values <= 0).any():
+        raise ValueError("Multiplicative seasonality requires strictly positive series.")
+
+    has_trend = trend is not None
+    offsets = _grid(grid_size or (_TREND_GRID_SIZE if has_trend else _GRID_SIZE), has_trend)
+    states = _initial_states(values, seasonal, m, has_trend)
+    unit = _search(values, seasonal, m, states, offsets, rounds, np.full((len(values), 3), 0.5), 1.0)
+    if seasonal == 'add':
+        states = _fitted_initial_states(values, m, has_trend, unit)
+        unit = _search(values, seasonal, m, states, offsets, rounds, unit, _SHRINK)
+        states = _fitted_initial_states(values, m, has_trend, unit)
+
+    alpha, beta, gamma = (param[:, None] for param in _smoothing(unit))
+    level, slope, seasons = states
+    fitted = np.empty((*values.shape, 1))
+    sse, final_level, final_slope, final_seasons = _recursion(values, seasonal, m, alpha, beta, gamma,
+                                                              level[:, None], slope[:, None], seasons[:, None],
+                                                              fitted)
+    return HoltWintersBatch(values, seasonal, m, trend, {
+        'smoothing_level': alpha[:, 0],
+        'smoothing_trend': beta[:, 0] if has_trend else None,
+        'smoothing_seasonal': gamma[:, 0],
+        'initial_level': level,
+        'initial_trend': slope if has_trend else None,
+        'initial_seasons': seasons,
+    }, sse[:, 0], fitted[:, :, 0], final_level[:, 0], final_slope[:, 0], final_seasons[:, 0])
+
+# Fitted Holt-Winters models of a batch of series, one row per series
+class HoltWintersBatch:
+
+    def __init__(self, values, seasonal, seasonal_periods, trend, params, sse, fittedvalues, level, slope, seasons):
+        self.values = values
+        self.seasonal = seasonal
+        self.seasonal_periods = seasonal_periods
+        self.trend = trend
+        self.params = params
+        self.sse = sse
+        self.fittedvalues = fittedvalues
+        self.level = level
+        self.slope = slope
+        self.seasons = seasons
+
+    def __len__(self):
+        return len(self.values)
+
+    # Season of the last observation's phase before the last observation updated
+    # it, recovered from that update and the last one-step prediction
+    def _previous_season(self):
+        n = self.values.shape[1]
+        gamma = self.params['smoothing_seasonal']
+        y, prediction = self.values[:, -1], self.fittedvalues[:, -1]
+        season = self.seasons[:, (n - 1) % self.seasonal_periods]
+        if self.seasonal == 'mul':
+            return season / (gamma * y / prediction + 1 - gamma)
+        return season - gamma * (y - prediction)
+
+    # Forecasts of every series, as a (series, steps) array, equal to statsmodels'
+    # forecasts of the same fit: they use the seasonal states after the last
+    # observation, except at horizons that are multiples of m, where statsmodels
+    # uses the season of the last observation's phase before its last update
+    def forecast(self, steps=1):
+        n = self.values.shape[1]
+        m = self.seasonal_periods
+        h = np.arange(1, steps + 1)
+        base = self.level[:, None] + h[None, :] * self.slope[:, None]
+        season = self.seasons[:, (n + h - 1) % m]
+        season[:, h % m == 0] = self._previous_season()[:, None]
+        return base * season if self.seasonal == 'mul' else base + season
+
+    # The fit of one series as statsmodels Holt-Winters results, with the same
+    # parameters and initial states held fixed, for use wherever statsmodels
+    # results are expected and to compare the two engines
+    def to_statsmodels(self, i, index=None):
+        params = self.params
+        has_trend = self.trend is not None
+        series = pd.Series(self.values[i], index=index)
+        model = ExponentialSmoothing(
+            series,
+            trend=self.trend,
+            seasonal=self.seasonal,
+            seasonal_periods=self.seasonal_periods,
+            initialization_method='known',
+            initial_level=params['initial_level'][i],
+            initial_trend=params['initial_trend'][i] if has_trend else None,
+            initial_seasonal=params['initial_seasons'][i],
+        )
+        return model.fit(
+            smoothing_level=params['smoothing_level'][i],
+            smoothing_trend=params['smoothing_trend'][i] if has_trend else None,
+            smoothing_seasonal=params['smoothing_seasonal'][i],
+            optimized=False,
+        )
@@ -0,0 +1,183 @@
+import numpy as np
+import pandas as pd
+from statsmodels.tsa.arima.model import ARIMA
+from statsmodels.tsa.holtwinters import ExponentialSmoothing
+from statsmodels.tsa.holtwinters.results import HoltWintersResultsWrapper
+
+from .forecast import fit_model, _OPTIMIZERS
+from .preprocess import with_frequency
+
+def _as_series(new_observations, model_fit):
+    if isinstance(new_observations, pd.Series):
+        return new_observations
+    # Continue the integer index of the data the model was last updated with
+    endog = model_fit.model.data.row_labels
+    start = endog[-1] + 1 if isinstance(endog, pd.RangeIndex) and len(endog) else 0
+    values = np.asarray(new_observations, dtype=float)
+    return pd.Series(values, index=pd.RangeIndex(start, start + len(values)))
+
+# statsmodels' Holt-Winters has no state extension and cannot fit a single
+# observation, so the update restarts the recursion one step back, from the states
+# before the last known observation, with the smoothing parameters held fixed
+def _update_holt_winters(model_fit, new_observations):
+    model = model_fit.model
+    params = model_fit.params
+    m = model.seasonal_periods
+    levels = np.r_[params['initial_level'], np.asarray(model_fit.level)]
+    trends = np.r_[params['initial_trend'], np.asarray(model_fit.trend)] if model.has_trend else None
+    seasons = np.r_[params['initial_seasons'], np.asarray(model_fit.season)] if model.has_seasonal else None
+
+    index = model.data.row_labels[-1:].append(new_observations.index)
+    updated = ExponentialSmoothing(
+        pd.Series(np.r_[model.endog[-1], new_observations.to_numpy(dtype=float)], index=index),
+        trend=model.trend,
+        seasonal=model.seasonal,
+        seasonal_periods=m,
+        damped_trend=model.damped_trend,
+        initialization_method='known',
+        initial_level=levels[-2],
+        initial_trend=trends[-2] if model.has_trend else None,
+        initial_seasonal=seasons[-m - 1:-1] if model.has_seasonal else None,
+    )
+    return updated.fit(
+        smoothing_level=params['smoothing_level'],
+        smoothing_trend=params['smoothing_trend'] if model.has_trend else None,
+        smoothing_seasonal=params['smoothing_seasonal'] if model.has_seasonal else None,
+        damping_trend=params['damping_trend'] if model.damped_trend else None,
+        optimized=False,
+    )
+
+# Filters the new observations through a fitted model with its parameters held
+# fixed, starting from the model's final state. The returned results only hold
+# the new observations, so the cost is proportional to their count rather than
+# to the length of the history.
+def update_model(model_fit, new_observations):
+    new_observations = _as_series(new_observations, model_fit)
+    if len(new_observations) == 0:
+        return model_fit
+
+    if isinstance(model_fit, HoltWintersResultsWrapper):
+        return _update_holt_winters(model_fit, new_observations)
+    return model_fit.extend(new_observations)
+
+# Start values of a Holt-Winters refit, in statsmodels' order: the current
+# smoothing parameters, then the initial states. The initial states come from
+# statsmodels' heuristic for the new series, because those of an updated model
+# are the states at the start of its last update, not of the series.
+def _holt_winters_start(model_fit, refit):
+    model = model_fit.model
+    params = model_fit.params
+    level, trend, seasons = refit.initial_values()
+    start = [params['smoothing_level']]
+    if model.has_trend:
+        start.append(params['smoothing_trend'])
+    if model.has_seasonal:
+        start.append(params['smoothing_seasonal'])
+    start.append(level)
+    if model.has_trend:
+        start.append(trend)
+    if model.damped_trend:
+        start.append(params['damping_trend'])
+    if model.has_seasonal:
+        start.extend(seasons)
+    return np.asarray(start, dtype=float)
+
+# Re-estimates the parameters of a fitted model's specification on a new series,
+# starting the optimizer from the current parameters; Holt-Winters models start
+# from the current smoothing parameters (see _holt_winters_start)
+def refit_model(model_fit, series):
+    model = model_fit.model
+    if isinstance(model_fit, HoltWintersResultsWrapper):
+        refit = ExponentialSmoothing(series, trend=model.trend, seasonal=model.seasonal,
+                                     seasonal_periods=model.seasonal_periods, damped_trend=model.damped_trend)
+        return refit.fit(start_params=_holt_winters_start(model_fit, refit), use_brute=False)
+    if isinstance(model, ARIMA):
+        return model.clone(series).fit(start_params=model_fit.params)
+    return model.clone(series).fit(start_params=model_fit.params, disp=False)
+
+# Decides when an incremental update has drifted far enough from the last full fit
+# that the parameters must be re-estimated: after `max_appended` new points, or
+# once the appended points exceed `max_ratio` of the history at the last full fit.
+class RefitPolicy:
+
+    def __init__(self, max_appended=None, max_ratio=None):
+        self.max_appended = max_appended
+        self.max_ratio = max_ratio
+
+    def should_refit(self, appended, fitted_nobs):
+        if self.max_appended is not None and appended >= self.max_appended:
+            return True
+        if self.max_ratio is not None and appended >= self.max_ratio * fitted_nobs:
+            return True
+        return False
+
+# Keeps a fitted model current as observations arrive. `update` extends the
+# model's state with the new points and only re-estimates the parameters on the
+# full history when the refit policy asks for it. The series' index is kept: new
+# observations given without an index continue it, at the frequency of a
+# DatetimeIndex or one by one for an integer index.
+class IncrementalForecaster:
+
+    def __init__(self, model_type='arima', optimize=False, policy=None, **optimize_kwargs):
+        if model_type not in _OPTIMIZERS:
+            raise ValueError(f"Unknown model_type: {model_type}. Choose from 'arima', 'sarima', or 'exponential_smoothing'.")
+        self.model_type = model_type
+        self.optimize = optimize
+        self.policy = policy if policy is not None else RefitPolicy()
+        self.optimize_kwargs = optimize_kwargs
+        self.model_fit = None
+        self.history = None
+        self.appended = 0
+        self.fitted_nobs = 0
+        self.refits = 0
+        self.freq = None
+
+    def fit(self, series):
+        series = with_frequency(series) if isinstance(series, pd.Series) else pd.Series(series, dtype=float)
+        self.freq = series.index.freq if isinstance(series.index, pd.DatetimeIndex) else None
+        self.model_fit = fit_model(series, self.model_type, optimize=self.optimize, **self.optimize_kwargs)
+        self.history = series
+        self.appended = 0
+        self.fitted_nobs = len(series)
+        return self
+
+    def update(self, new_observations):
+        if self.model_fit is None:
+            raise ValueError("IncrementalForecaster must be fitted before it can be updated.")
+
+        new_series = self._as_series(new_observations)
+        self.history = pd.concat([self.history, new_series])
+        if self.freq is not None:
+            self.history.index = pd.DatetimeIndex(self.history.index, freq=self.freq)
+        self.appended += len(new_series)
+
+        if self.policy.should_refit(self.appended, self.fitted_nobs):
+            self.model_fit = refit_model(self.model_fit, self.history)
+            self.appended = 0
+            self.fitted_nobs = len(self.history)
+            self.refits += 1
+        else:
+            self.model_fit = update_model(self.model_fit, new_series)
+        return self
+
+    def _as_series(self, new_observations):
+        if isinstance(new_observations, pd.Series):
+            series = new_observations.astype(float)
+            if self.freq is not None:
+                series.index = pd.DatetimeIndex(series.index, freq=self.freq)
+            return series
+        values = np.asarray(new_observations, dtype=float)
+        index = self.history.index
+        if isinstance(index, pd.DatetimeIndex):
+            if self.freq is None:
+                raise ValueError("New observations need their own index when the series' timestamps are irregular.")
+            new_index = pd.date_range(index[-1] + self.freq, periods=len(values), freq=self.freq, name=index.name)
+        else:
+            start = index[-1] + 1 if len(index) else 0
+            new_index = pd.RangeIndex(start, start + len(values))
+        return pd.Series(values, index=new_index, name=self.history.name)
+
+    def forecast(self, steps=1):
+        if self.model_fit is None:
+            raise ValueError("IncrementalForecaster must be fitted before forecasting.")
+        return pd.Series(self.model_fit.forecast(steps=steps), name='Forecast')
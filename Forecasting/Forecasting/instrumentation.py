@@ -0,0 +1,127 @@
+import time
+import warnings
+from collections import Counter
+from contextlib import contextmanager
+
+# Trial outcomes, in the order they are exported
+TRIAL_STATES = ('complete', 'pruned', 'invalid', 'failed')
+
+# Optimizer statistics of a fitted model: the iteration count and convergence
+# flag statsmodels keeps in mle_retvals, a dict for state space models and a
+# scipy OptimizeResult for Holt-Winters
+def fit_statistics(model_fit):
+    retvals = getattr(model_fit, 'mle_retvals', None)
+    if retvals is None:
+        return {'iterations': None, 'converged': None}
+    if isinstance(retvals, dict):
+        return {'iterations': retvals.get('iterations'), 'converged': retvals.get('converged')}
+    return {'iterations': getattr(retvals, 'nit', None), 'converged': getattr(retvals, 'success', None)}
+
+# Records the wall time, warnings and error of the fit run inside it into
+# `record`; the warnings are kept there instead of being printed. With record=None
+# it does nothing, which is what keeps uninstrumented fits at their usual cost.
+@contextmanager
+def recording(record):
+    if record is None:
+        yield
+        return
+    with warnings.catch_warnings(record=True) as caught:
+        warnings.simplefilter('always')
+        start = time.perf_counter()
+        try:
+            yield
+        except Exception as e:
+            record['error'] = str(e)
+            raise
+        finally:
+            record['duration'] = time.perf_counter() - start
+            record['warnings'] = [f"{w.category.__name__}: {w.message}" for w in caught]
+
+def fit_event(model_type, params, stage, trial, record):
+    return {'event': 'fit', 'model_type': model_type, 'params': params, 'stage': stage, 'trial': trial,
+            'duration': None, 'iterations': None, 'converged': None, 'warnings': [], 'error': None, **record}
+
+def _is_convergence_warning(message):
+    return message.startswith('ConvergenceWarning')
+
+# Collects what the optimizers do: one event per model fit, per trial and per
+# study, passed to every callback and kept in `events` when `keep_events` is set,
+# with running totals for the summary and the Prometheus export.
+#
+# Fit events hold the model type, params, stage ('partial' for the first fit of a
+# pruned search, 'full', or 'final' for the refit of the best params), trial
+# number, duration, iterations, convergence flag, warnings and error. Trial events
+# hold the trial number, state, value and the time spent fitting it; study events
+# the trial counts, best value and total duration.
+class Instrumentation:
+
+    def __init__(self, callbacks=(), keep_events=True):
+        self.callbacks = list(callbacks)
+        self.keep_events = keep_events
+        self.events = []
+        self.fits = Counter()
+        self.failed_fits = Counter()
+        self.convergence_warnings = Counter()
+        self.fit_seconds = Counter()
+        self.fit_iterations = Counter()
+        self.trials = Counter()
+        self.studies = Counter()
+
+    def emit(self, event):
+        kind = event['event']
+        model_type = event.get('model_type')
+        if kind == 'fit':
+            self.fits[model_type] += 1
+            self.fit_seconds[model_type] += event.get('duration') or 0.0
+            self.fit_iterations[model_type] += event.get('iterations') or 0
+            self.convergence_warnings[model_type] += any(map(_is_convergence_warning, event.get('warnings', ())))
+            if event.get('error') is not None:
+                self.failed_fits[model_type] += 1
+        elif kind == 'trial':
+            self.trials[model_type, event['state']] += 1
+        elif kind == 'study':
+            self.studies[model_type] += 1
+
+        if self.keep_events:
+            self.events.append(event)
+        for callback in self.callbacks:
+            callback(event)
+
+    def summary(self):
+        model_types = sorted(set(self.fits) | set(self.studies))
+        return {
+            model_type: {
+                'studies': self.studies[model_type],
+                'fits': self.fits[model_type],
+                'failed_fits': self.failed_fits[model_type],
+                'convergence_warnings': self.convergence_warnings[model_type],
+                'fit_seconds': self.fit_seconds[model_type],
+                'fit_iterations': self.fit_iterations[model_type],
+                'trials': {state: self.trials[model_type, state] for state in TRIAL_STATES},
+            }
+            for model_type in model_types
+        }
+
+    # Totals in the Prometheus text exposition format, labelled by model type
+    def to_prometheus(self, prefix='forecasting'):
+        metrics = [
+            ('fits_total', 'counter', 'Model fits.', self.fits),
+            ('failed_fits_total', 'counter', 'Model fits that raised an exception.', self.failed_fits),
+            ('convergence_warnings_total', 'counter', 'Fits that raised a ConvergenceWarning.',
+             self.convergence_warnings),
+            ('fit_seconds_total', 'counter', 'Wall time spent fitting models.', self.fit_seconds),
+            ('fit_iterations_total', 'counter', 'Optimizer iterations used by model fits.', self.fit_iterations),
+            ('studies_total', 'counter', 'Optimization studies run.', self.studies),
+        ]
+        lines = []
+        for name, kind, description, counter in metrics:
+            lines.append(f"# HELP {prefix}_{name} {description}")
+            lines.append(f"# TYPE {prefix}_{name} {kind}")
+            for model_type in sorted(counter):
+                lines.append(f'{prefix}_{name}{{model_type="{model_type}"}} {counter[model_type]}')
+        lines.append(f"# HELP {prefix}_trials_total Optimization trials by outcome.")
+        lines.append(f"# TYPE {prefix}_trials_total counter")
+        for model_type, state in sorted(self.trials):
+            lines.append(f'{prefix}_trials_total{{model_type="{model_type}",state="{state}"}} '
+                         f'{self.trials[model_type, state]}')
+        return '\n'.join(lines) + '\n'
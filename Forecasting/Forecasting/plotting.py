@@ -0,0 +1,116 @@
+import math
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import pandas as pd
+
+# Size of a single forecast plot, and of one cell of a grid, in inches
+FIGSIZE = (10, 6)
+GRID_CELL_SIZE = (5, 3)
+
+# Backends that cannot open a window, on which showing a figure does nothing
+NON_INTERACTIVE_BACKENDS = ('agg', 'cairo', 'pdf', 'pgf', 'ps', 'svg', 'template')
+
+# A figure on an Agg canvas, made without pyplot: it is never registered with a
+# GUI or pyplot's figure manager, so it is freed once no longer referenced.
+# matplotlib is imported here rather than at the top for the same import-time
+# reasons as in the forecast module.
+def new_figure(figsize=FIGSIZE):
+    from matplotlib.backends.backend_agg import FigureCanvasAgg
+    from matplotlib.figure import Figure
+    figure = Figure(figsize=figsize)
+    FigureCanvasAgg(figure)
+    return figure
+
+# Draws a series and its forecast on an Axes. The forecast is a Series, or a frame
+# from prediction_frame whose interval bounds are shaded around the forecast.
+def draw_forecast(ax, series, forecast, title='Forecast', forecast_label='Forecast'):
+    ax.plot(series.index, series.to_numpy(), label='Actual Data')
+    if isinstance(forecast, pd.DataFrame):
+        levels = sorted((column[len('lower_'):] for column in forecast if column.startswith('lower_')), key=float)
+        for level in reversed(levels):
+            ax.fill_between(forecast.index, forecast[f"lower_{level}"], forecast[f"upper_{level}"], color='red',
+                            alpha=0.15, label=f"{level}% interval")
+        forecast = forecast['forecast']
+    ax.plot(forecast.index, forecast.to_numpy(), label=forecast_label, color='red')
+    ax.set_title(title)
+    ax.set_xlabel('Time')
+    ax.set_ylabel('Value')
+    ax.legend()
+
+def _pages(plots, per_page):
+    plots = list(plots)
+    return [plots[i:i + per_page] for i in range(0, len(plots), per_page)]
+
+def _draw_grid(figure, plots, rows, columns):
+    for i, (title, series, forecast) in enumerate(plots):
+        draw_forecast(figure.add_subplot(rows, columns, i + 1), series, forecast, title)
+
+# Saves many plots, each a (title, series, forecast) triple, as one multi-page
+# PDF with a grid of rows x columns plots per page, reusing one figure for every
+# page
+def render_pdf(plots, path, rows=1, columns=1):
+    from matplotlib.backends.backend_pdf import PdfPages
+    figure = new_figure(FIGSIZE if rows * columns == 1 else (columns * GRID_CELL_SIZE[0], rows * GRID_CELL_SIZE[1]))
+    with PdfPages(path) as pdf:
+        for page in _pages(plots, rows * columns):
+            figure.clear()
+            _draw_grid(figure, page, rows, columns)
+            figure.tight_layout()
+            pdf.savefig(figure)
+    return path
+
+# Saves many plots, each a (title, series, forecast) triple, as one image with a
+# grid of `columns` plots per row
+def render_grid(plots, path, columns=3):
+    plots = list(plots)
+    rows = max(1, math.ceil(len(plots) / columns))
+    figure = new_figure((columns * GRID_CELL_SIZE[0], rows * GRID_CELL_SIZE[1]))
+    _draw_grid(figure, plots, rows, columns)
+    figure.tight_layout()
+    figure.savefig(path)
+    return path
+
+# Renders plots in background threads, so that forecasting code hands a plot
+# over and carries on. Every call returns a future of the saved path. Each
+# thread keeps one figure and clears it between single plots instead of making a
+# new one, as render_pdf does between pages; figures are never shared between
+# threads, so several workers can render at once.
+class PlotRenderer:
+
+    def __init__(self, max_workers=1, figsize=FIGSIZE):
+        self.figsize = figsize
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='plot')
+        self._local = threading.local()
+
+    def _figure(self):
+        figure = getattr(self._local, 'figure', None)
+        if figure is None:
+            figure = self._local.figure = new_figure(self.figsize)
+        figure.clear()
+        return figure
+
+    def _render(self, series, forecast, path, title, forecast_label):
+        figure = self._figure()
+        draw_forecast(figure.add_subplot(), series, forecast, title, forecast_label)
+        figure.savefig(path)
+        return path
+
+    def submit(self, series, forecast, path, title='Forecast', forecast_label='Forecast'):
+        return self._executor.submit(self._render, series, forecast, path, title, forecast_label)
+
+    def submit_pdf(self, plots, path, rows=1, columns=1):
+        return self._executor.submit(render_pdf, list(plots), path, rows, columns)
+
+    def submit_grid(self, plots, path, columns=3):
+        return self._executor.submit(render_grid, list(plots), path, columns)
+
+    # Waits for the queued plots unless `wait` is False
+    def close(self, wait=True):
+        self._executor.shutdown(wait=wait)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
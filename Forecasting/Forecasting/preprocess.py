@@ -0,0 +1,120 @@
+import numpy as np
+import pandas as pd
+from pandas.tseries.frequencies import to_offset
+
+# Ways to combine the observations falling in one interval, and to fill intervals
+# without any
+AGGREGATIONS = ('mean', 'sum', 'min', 'max', 'median', 'first', 'last')
+FILL_METHODS = ('interpolate', 'ffill', 'zero', None)
+
+def _step(freq):
+    try:
+        return pd.Timedelta(to_offset(freq))
+    except ValueError as e:
+        raise ValueError(f"Frequency {freq} must be a fixed interval such as '15min', 'h' or 'D'.") from e
+
+def _nanoseconds(times):
+    return pd.DatetimeIndex(times).as_unit('ns').asi8
+
+def _group_codes(df, group_by):
+    if not group_by:
+        return np.zeros(len(df), dtype=np.int64), pd.DataFrame(index=range(1))
+    grouped = df.groupby(group_by, sort=True, observed=True)
+    return grouped.ngroup().to_numpy(), grouped.size().index.to_frame(index=False)
+
+# Most common interval between consecutive timestamps of the same group, which
+# gaps and duplicate timestamps do not change
+def infer_interval(df, time_column, group_by=()):
+    codes, _ = _group_codes(df, list(group_by))
+    times = _nanoseconds(df[time_column])
+    order = np.lexsort((times, codes))
+    deltas = np.diff(times[order])
+    deltas = deltas[(np.diff(codes[order]) == 0) & (deltas > 0)]
+    if not len(deltas):
+        raise ValueError("Cannot infer an interval from fewer than two distinct timestamps per group.")
+    values, counts = np.unique(deltas, return_counts=True)
+    return pd.Timedelta(int(values[counts.argmax()]), unit='ns')
+
+# Fills missing values in place. Every series starts and ends with an observation,
+# so filling across the whole array never carries values from one series into
+# the next one.
+def _fill(values, fill):
+    missing = np.isnan(values)
+    if fill is None or not missing.any():
+        return
+    if fill == 'zero':
+        values[missing] = 0.0
+    elif fill == 'ffill':
+        last = np.maximum.accumulate(np.where(missing, 0, np.arange(len(values))))
+        values[:] = values[last]
+    else:
+        values[missing] = np.interp(np.flatnonzero(missing), np.flatnonzero(~missing), values[~missing])
+
+# Puts every group of a long frame on a regular time grid in one pass over all
+# groups. Timestamps are floored to intervals of `freq` ('auto' infers the data's
+# own interval with infer_interval), the values in each interval are combined
+# with `aggregation`, and the intervals between a group's first and last
+# observation that hold none are filled by `fill`. Rows with a missing value or
+# timestamp are dropped first. Returns the group, time and value columns with one
+# row per interval, sorted by group and time.
+def regularize(df, value_column, time_column, group_by=(), freq='auto', aggregation='mean', fill='interpolate'):
+    group_by = list(group_by)
+    if aggregation not in AGGREGATIONS:
+        raise ValueError(f"Unknown aggregation: {aggregation}. Choose from {', '.join(AGGREGATIONS)}.")
+    if fill not in FILL_METHODS:
+        raise ValueError(f"Unknown fill: {fill}. Choose from 'interpolate', 'ffill', 'zero' or None.")
+    df = df.dropna(subset=[value_column, time_column])
+    columns = [*group_by, time_column, value_column]
+    if df.empty:
+        return df[columns].reset_index(drop=True)
+
+    step = infer_interval(df, time_column, group_by) if freq == 'auto' else _step(freq)
+    step_ns = step.value
+    tz = pd.DatetimeIndex(df[time_column]).tz
+    codes, keys = _group_codes(df, group_by)
+    buckets = _nanoseconds(df[time_column]) // step_ns
+    aggregated = df[value_column].astype(np.float64).groupby([codes, buckets], sort=True).agg(aggregation)
+    agg_codes = aggregated.index.get_level_values(0).to_numpy()
+    agg_buckets = aggregated.index.get_level_values(1).to_numpy()
+
+    groups, first, counts = np.unique(agg_codes, return_index=True, return_counts=True)
+    start = agg_buckets[first]
+    lengths = agg_buckets[first + counts - 1] - start + 1
+    offsets = np.concatenate([[0], np.cumsum(lengths)])
+    group_index = np.repeat(np.arange(len(groups)), lengths)
+    grid = start[group_index] + np.arange(offsets[-1]) - offsets[group_index]
+
+    values = np.full(offsets[-1], np.nan)
+    rows = np.repeat(np.arange(len(groups)), counts)
+    values[offsets[rows] + agg_buckets - start[rows]] = aggregated.to_numpy()
+    _fill(values, fill)
+
+    times = pd.DatetimeIndex(grid * step_ns)
+    if tz is not None:
+        times = times.tz_localize('UTC').tz_convert(tz)
+    result = keys.iloc[groups[group_index]].reset_index(drop=True) if group_by else pd.DataFrame()
+    result[time_column] = times
+    result[value_column] = values
+    return result
+
+# One regular series indexed by its timestamps, with the index's frequency set so
+# that statsmodels dates its forecasts instead of warning
+def regularize_series(series, freq='auto', aggregation='mean', fill='interpolate'):
+    time_column = series.index.name or 'time'
+    value_column = series.name if series.name is not None else 'value'
+    frame = regularize(pd.DataFrame({time_column: series.index, value_column: series.to_numpy()}), value_column,
+                       time_column, freq=freq, aggregation=aggregation, fill=fill)
+    index = pd.DatetimeIndex(frame[time_column], name=series.index.name)
+    return with_frequency(pd.Series(frame[value_column].to_numpy(), index=index, name=series.name))
+
+# Sets the frequency of a series' DatetimeIndex when its timestamps are already
+# regular, leaving the series unchanged otherwise
+def with_frequency(series):
+    index = series.index
+    regular = isinstance(index, pd.DatetimeIndex) and index.freq is None and len(index) >= 3
+    if regular and index.is_monotonic_increasing:
+        freq = pd.infer_freq(index)
+        if freq is not None:
+            series = series.copy()
+            series.index = pd.DatetimeIndex(index, freq=freq)
+    return series
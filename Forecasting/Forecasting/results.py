@@ -0,0 +1,144 @@
+import datetime
+import json
+import uuid
+
+import numpy as np
+import pandas as pd
+
+from .dataset import _require_pyarrow
+
+# Columns that describe how each forecast was made, beside the forecast itself
+DETAIL_COLUMNS = ('model_type', 'order', 'mse', 'aic', 'fit_seconds')
+
+# Hive partitions of a result dataset, and the rows buffered before a write
+DEFAULT_PARTITIONS = ('run_date',)
+DEFAULT_BATCH_ROWS = 100_000
+
+_FLOAT_COLUMNS = ('forecast', 'mse', 'aic', 'fit_seconds')
+
+# Details of a forecast whose model could not be fitted
+_NO_DETAILS = {'model_type': None, 'order': None, 'mse': np.nan, 'aic': np.nan, 'fit_seconds': np.nan}
+
+# The family and order of a fitted model, with the order in the params format of
+# the optimizers, e.g. ('arima', {'p': 1, 'd': 1, 'q': 1})
+def describe_fit(model_fit):
+    from statsmodels.tsa.arima.model import ARIMA
+    from statsmodels.tsa.holtwinters.results import HoltWintersResultsWrapper
+    model = model_fit.model
+    if isinstance(model_fit, HoltWintersResultsWrapper):
+        return 'exponential_smoothing', {'seasonal': model.seasonal, 'seasonal_periods': model.seasonal_periods}
+    p, d, q = model.order
+    if isinstance(model, ARIMA) and not any(model.seasonal_order):
+        return 'arima', {'p': p, 'd': d, 'q': q}
+    P, D, Q, s = model.seasonal_order
+    return 'sarima', {'p': p, 'd': d, 'q': q, 'P': P, 'D': D, 'Q': Q, 's': s}
+
+# The DETAIL_COLUMNS of one fitted model: its family, its order as JSON, its
+# in-sample mean squared error and AIC, and the seconds its fit took
+def fit_details(model_fit, fit_seconds=None):
+    model_type, order = describe_fit(model_fit)
+    mse = float(model_fit.sse) / len(model_fit.model.endog)
+    aic = float(getattr(model_fit, 'aic', np.nan))
+    return {'model_type': model_type, 'order': json.dumps(order, sort_keys=True), 'mse': mse, 'aic': aic,
+            'fit_seconds': np.nan if fit_seconds is None else fit_seconds}
+
+# Arrow columns of a forecast frame with compact types: repeated strings such as
+# keys, model types, orders and errors are dictionary encoded, steps are int16,
+# the forecast and detail floats are float32 and timestamps are UTC milliseconds
+def _compact_table(frame):
+    import pyarrow as pa
+    arrays = {}
+    for name in frame.columns:
+        column = frame[name]
+        if name == 'step':
+            arrays[name] = pa.array(column.to_numpy(), type=pa.int16())
+        elif name in _FLOAT_COLUMNS:
+            arrays[name] = pa.array(column.to_numpy(dtype=np.float32), type=pa.float32())
+        elif name == 'time':
+            times = pd.to_datetime(column)
+            times = times.dt.tz_convert('UTC') if times.dt.tz is not None else times.dt.tz_localize('UTC')
+            arrays[name] = pa.array(times, type=pa.timestamp('ms', tz='UTC'))
+        elif pd.api.types.is_numeric_dtype(column) and not pd.api.types.is_bool_dtype(column):
+            arrays[name] = pa.array(column.to_numpy())
+        else:
+            arrays[name] = pa.array(column.astype('string'), type=pa.string(), from_pandas=True).dictionary_encode()
+    return pa.table(arrays)
+
+# Appends forecast frames, such as those of batch_forecasting(details=True), to a
+# Parquet dataset under `path` that dashboards can query without loading any
+# Python objects. Every row is tagged with the writer's `run_id` and `run_date`
+# (today by default), and the dataset is hive-partitioned by `partition_by`,
+# e.g. ('run_date', 'vm_id'). Frames are buffered and written together once
+# `batch_rows` rows are waiting, and on flush() or close(). Each write adds new
+# files named after the run, so later runs append to the dataset instead of
+# replacing it. Frames are expected to share their columns within one writer.
+class ResultWriter:
+
+    def __init__(self, path, partition_by=DEFAULT_PARTITIONS, batch_rows=DEFAULT_BATCH_ROWS, run_id=None,
+                 run_date=None, compression='zstd'):
+        _require_pyarrow('Writing forecast results')
+        self.path = path
+        self.partition_by = list(partition_by)
+        self.batch_rows = batch_rows
+        self.run_id = uuid.uuid4().hex if run_id is None else run_id
+        self.run_date = (datetime.date.today() if run_date is None else pd.Timestamp(run_date).date()).isoformat()
+        self.compression = compression
+        self._tables = []
+        self._rows = 0
+        self._batches = 0
+
+    def write(self, frame):
+        if frame.empty:
+            return
+        frame = frame.assign(run_id=self.run_id, run_date=self.run_date)
+        missing = [column for column in self.partition_by if column not in frame.columns]
+        if missing:
+            raise ValueError(f"Partition columns {missing} are not in the forecast frame.")
+        self._tables.append(_compact_table(frame))
+        self._rows += len(frame)
+        if self._rows >= self.batch_rows:
+            self.flush()
+
+    def flush(self):
+        if not self._tables:
+            return
+        import pyarrow as pa
+        import pyarrow.dataset as ds
+        table = pa.concat_tables(self._tables)
+        file_options = ds.ParquetFileFormat().make_write_options(compression=self.compression)
+        ds.write_dataset(table, self.path, format='parquet', partitioning=self.partition_by,
+                         partitioning_flavor='hive', file_options=file_options,
+                         basename_template=f"{self.run_id}-{self._batches:05d}-{{i}}.parquet",
+                         existing_data_behavior='overwrite_or_ignore')
+        self._tables = []
+        self._rows = 0
+        self._batches += 1
+
+    def close(self):
+        self.flush()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+# Reads a result dataset back as a frame. `filters` maps columns, including the
+# partition columns, to the value or list of values to keep, and only the rows
+# and `columns` selected are read. Runs that wrote different columns, e.g. with
+# and without group keys, are read together with the union of their columns;
+# every run should partition the dataset by the same columns.
+def read_results(path, filters=None, columns=None):
+    _require_pyarrow('Reading forecast results')
+    import pyarrow as pa
+    import pyarrow.dataset as ds
+    partitioning = ds.HivePartitioning.discover(infer_dictionary=True)
+    dataset = ds.dataset(path, format='parquet', partitioning=partitioning)
+    schema = pa.unify_schemas([dataset.schema, *(fragment.physical_schema for fragment in dataset.get_fragments())])
+    dataset = ds.dataset(path, schema=schema, format='parquet', partitioning=partitioning)
+    expression = None
+    for column, value in (filters or {}).items():
+        values = value if isinstance(value, (list, tuple, set)) else [value]
+        condition = ds.field(column).isin(list(values))
+        expression = condition if expression is None else expression & condition
+    return dataset.to_table(columns=columns, filter=expression).to_pandas()
@@ -0,0 +1,93 @@
+import numpy as np
+
+
+# Autocorrelation of a series at lags 0..n-1, computed with one FFT instead of a
+# pass over the data per lag
+def autocorrelation(values):
+    values = np.asarray(values, dtype=np.float64)
+    values = values[~np.isnan(values)]
+    n = len(values)
+    if n < 2:
+        return np.ones(n)
+
+    centered = values - values.mean()
+    size = 1 << (2 * n - 1).bit_length()
+    spectrum = np.fft.rfft(centered, size)
+    acf = np.fft.irfft(spectrum * np.conj(spectrum), size)[:n]
+    if acf[0] == 0:
+        return np.zeros(n)
+    return acf / acf[0]
+
+def _is_harmonic(lag, period):
+    multiple = round(lag / period)
+    return multiple >= 1 and abs(lag - multiple * period) <= max(1, period // 5)
+
+# Mean profile over one period, repeated along the series
+def _profile(values, period):
+    phase = np.arange(len(values)) % period
+    profile = np.bincount(phase, weights=values, minlength=period) / np.bincount(phase, minlength=period)
+    return profile[phase]
+
+# Share of the variance explained by the mean profile over one period, less the
+# share a profile of that many free means explains in pure noise
+def _seasonal_strength(values, period):
+    return _profile(values, period).var() / values.var() - period / len(values)
+
+# Seasonal periods of a series, strongest first. A least-squares line is removed
+# first, since a trend would otherwise dominate both spectrum and autocorrelation.
+# Candidate periods come from the peaks of the FFT periodogram, which ranks the
+# fundamental frequencies of overlapping seasons by their power. The periodogram
+# only resolves periods n / k, so each peak is refined to the period between its
+# neighbouring frequencies whose mean profile explains the most variance.
+#
+# A candidate is kept when its profile explains at least `min_strength` of the
+# variance left by stronger candidates, its autocorrelation is significant and
+# rises at least `prominence` above the trough in the preceding half period, and
+# it is not a repeat or harmonic of a stronger candidate.
+def seasonal_candidates(series, top_k=2, min_period=2, max_period=None, prominence=0.1, min_strength=0.1):
+    values = np.asarray(series, dtype=np.float64)
+    values = values[~np.isnan(values)]
+    n = len(values)
+    if max_period is None:
+        max_period = n // 3
+    max_period = min(max_period, n // 2 - 1)
+    if n < 8 or max_period < min_period:
+        return []
+
+    t = np.arange(n)
+    detrended = values - np.polyval(np.polyfit(t, values, 1), t)
+    if not detrended.var() > 0:
+        return []
+    acf = autocorrelation(detrended)
+    power = np.abs(np.fft.rfft(detrended)) ** 2
+
+    frequencies = np.arange(1, len(power) - 1)
+    peaks = frequencies[(power[frequencies] > power[frequencies - 1]) & (power[frequencies] >= power[frequencies + 1])]
+    peaks = peaks[(n / peaks >= min_period) & (n / peaks <= max_period) & (power[peaks] >= 5 * np.median(power[1:]))]
+
+    significance = 3 / np.sqrt(n)
+    candidates = []
+    residual = detrended
+    for k in peaks[np.argsort(-power[peaks], kind='stable')]:
+        low = max(min_period, int(np.floor(n / (k + 1))) + 1)
+        high = min(max_period, int(np.ceil(n / (k - 1))) - 1 if k > 1 else max_period)
+        if low > high:
+            continue
+        strengths = {candidate: _seasonal_strength(residual, candidate) for candidate in range(low, high + 1)}
+        lag = max(strengths, key=strengths.get)
+        if strengths[lag] < min_strength:
+            continue
+        if acf[lag] < significance or acf[lag] - acf[lag // 2:lag].min() < prominence:
+            continue
+        if any(_is_harmonic(lag, chosen) for chosen in candidates):
+            continue
+        candidates.append(lag)
+        residual = residual - _profile(residual, lag)
+        if len(candidates) == top_k:
+            break
+    return candidates
+
+def detect_seasonality(series, min_period=2, max_period=None, prominence=0.1, min_strength=0.1):
+    candidates = seasonal_candidates(series, top_k=1, min_period=min_period, max_period=max_period,
+                                     prominence=prominence, min_strength=min_strength)
+    return candidates[0] if candidates else None
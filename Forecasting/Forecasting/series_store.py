@@ -0,0 +1,109 @@
+from multiprocessing import shared_memory
+
+import numpy as np
+
+# Many series in one columnar layout: the values of every series back to back in
+# one float64 array, and an int64 array of n + 1 offsets so that series i is
+# values[offsets[i]:offsets[i + 1]]. Series are read as views, without copying.
+#
+# A shared store keeps both arrays in one block of shared memory. Pool workers
+# attach to it by `handle` and read their series in place, so the data is held
+# once however many processes use it; only the process that created the block
+# frees it, on close() or on leaving the `with` block. The group keys stay with
+# that process; workers only see series by position.
+class SeriesStore:
+
+    def __init__(self, keys, offsets, values, shm=None, owner=False):
+        self.keys = keys
+        self.offsets = offsets
+        self.values = values
+        self._shm = shm
+        self._owner = owner
+
+    @classmethod
+    def _allocate(cls, keys, n_values, shared):
+        n_groups = len(keys)
+        if not shared:
+            return cls(keys, np.empty(n_groups + 1, dtype=np.int64), np.empty(n_values, dtype=np.float64))
+        shm = shared_memory.SharedMemory(create=True, size=8 * (n_groups + 1 + n_values))
+        offsets, values = cls._views(shm, n_groups, n_values)
+        return cls(keys, offsets, values, shm, owner=True)
+
+    @staticmethod
+    def _views(shm, n_groups, n_values):
+        offsets = np.ndarray(n_groups + 1, dtype=np.int64, buffer=shm.buf)
+        values = np.ndarray(n_values, dtype=np.float64, buffer=shm.buf, offset=8 * (n_groups + 1))
+        return offsets, values
+
+    # Store of (key, values) pairs, in their order
+    @classmethod
+    def from_groups(cls, groups, shared=False):
+        lengths = np.array([len(values) for _, values in groups], dtype=np.int64)
+        store = cls._allocate([key for key, _ in groups], int(lengths.sum()), shared)
+        store.offsets[0] = 0
+        np.cumsum(lengths, out=store.offsets[1:])
+        for i, (_, values) in enumerate(groups):
+            store.values[store.offsets[i]:store.offsets[i + 1]] = values
+        return store
+
+    # Store of one series per group of `group_by` in a frame, sorted by key and
+    # keeping the row order within each group; the values are gathered straight
+    # into the store instead of into one array per group
+    @classmethod
+    def from_frame(cls, df, column_name, group_by=(), shared=False):
+        group_by = list(group_by)
+        column = df[column_name].to_numpy(dtype=np.float64)
+        if not group_by:
+            return cls.from_groups([((), column)], shared) if len(df) else cls.from_groups([], shared)
+
+        grouped = df.groupby(group_by, sort=True, observed=True)
+        sizes = grouped.size()
+        keys = [key if isinstance(key, tuple) else (key,) for key in sizes.index]
+        store = cls._allocate(keys, len(column), shared)
+        store.offsets[0] = 0
+        np.cumsum(sizes.to_numpy(dtype=np.int64), out=store.offsets[1:])
+        order = np.argsort(grouped.ngroup().to_numpy(), kind='stable')
+        np.take(column, order, out=store.values)
+        return store
+
+    # What a worker needs to attach to a shared store
+    @property
+    def handle(self):
+        if self._shm is None:
+            raise ValueError("Only a shared store can be attached to from another process.")
+        return self._shm.name, len(self), len(self.values)
+
+    # Attaches to a shared store created by another process, normally a pool
+    # worker attaching to its parent's store
+    @classmethod
+    def attach(cls, handle):
+        name, n_groups, n_values = handle
+        shm = shared_memory.SharedMemory(name=name)
+        offsets, values = cls._views(shm, n_groups, n_values)
+        return cls(None, offsets, values, shm)
+
+    def __len__(self):
+        return len(self.offsets) - 1
+
+    def __getitem__(self, i):
+        return self.values[self.offsets[i]:self.offsets[i + 1]]
+
+    def items(self):
+        return [(key, self[i]) for i, key in enumerate(self.keys)]
+
+    # Releases the shared memory; the store and any series read from it must not
+    # be used afterwards
+    def close(self):
+        if self._shm is None:
+            return
+        self.offsets = self.values = None
+        self._shm.close()
+        if self._owner:
+            self._shm.unlink()
+        self._shm = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
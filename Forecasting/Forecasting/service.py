@@ -0,0 +1,125 @@
+import asyncio
+import atexit
+import functools
+import json
+import os
+import threading
+import weakref
+from concurrent.futures import ProcessPoolExecutor
+
+from .forecast import _resolve_n_jobs, main_forecasting
+
+# Asyncio front end for main_forecasting, for use from a web service. Fits run in
+# a process pool so they never block the event loop. At most `max_concurrency`
+# forecasts are submitted to the pool at once; further requests wait their turn
+# in the loop, which keeps the pool's queue short and lets waiting requests be
+# cancelled. Identical requests made while one is in flight share its result
+# instead of fitting again.
+#
+# `executor` replaces the process pool, and is then left for the caller to shut
+# down. One service belongs to one event loop.
+class ForecastService:
+
+    def __init__(self, max_workers=None, max_concurrency=None, executor=None):
+        max_workers = _resolve_n_jobs(-1 if max_workers is None else max_workers)
+        self._owns_executor = executor is None
+        self._executor = ProcessPoolExecutor(max_workers=max_workers) if executor is None else executor
+        self._semaphore = asyncio.Semaphore(max_workers if max_concurrency is None else max_concurrency)
+        self._in_flight = {}
+
+    # Requests for the same file contents, column, model, steps and options are
+    # duplicates; the file's size and modification time stand in for its contents
+    @staticmethod
+    def _key(file_path, column_name, model_type, steps, optimize, kwargs):
+        stat = os.stat(file_path)
+        return json.dumps([os.path.abspath(file_path), stat.st_size, stat.st_mtime_ns, column_name, model_type, steps,
+                           optimize, kwargs], sort_keys=True, default=str)
+
+    async def _run(self, call):
+        async with self._semaphore:
+            return await asyncio.get_running_loop().run_in_executor(self._executor, call)
+
+    # Same arguments as main_forecasting, without plotting
+    async def forecast(self, file_path, column_name, model_type='arima', steps=1, optimize=False, **kwargs):
+        if not os.path.exists(file_path):
+            raise FileNotFoundError(f"The file {file_path} does not exist.")
+        key = self._key(file_path, column_name, model_type, steps, optimize, kwargs)
+        task = self._in_flight.get(key)
+        if task is None:
+            call = functools.partial(main_forecasting, file_path, column_name, model_type=model_type, steps=steps,
+                                     optimize=optimize, **kwargs)
+            task = asyncio.ensure_future(self._run(call))
+            self._in_flight[key] = task
+            task.add_done_callback(lambda _: self._in_flight.pop(key, None))
+        # A caller that is cancelled stops waiting without cancelling the
+        # computation the other callers share
+        return await asyncio.shield(task)
+
+    # Number of distinct forecasts currently queued or running
+    def __len__(self):
+        return len(self._in_flight)
+
+    async def close(self):
+        if self._in_flight:
+            await asyncio.gather(*self._in_flight.values(), return_exceptions=True)
+        if self._owns_executor:
+            self._executor.shutdown()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self.close()
+
+# forecast_async's default services: one per event loop, since a service's
+# semaphore belongs to the loop that first waits on it, all sharing one process
+# pool that is shut down at exit. Services are keyed by id(loop) with a weak
+# reference to their loop; a semaphore that has been waited on holds its loop,
+# so the services of closed loops are dropped on the next lookup, and those of
+# loops that are collected by a finalizer.
+_default_services = {}
+_default_executor = None
+_default_lock = threading.Lock()
+
+def _forget_loop(key):
+    entry = _default_services.get(key)
+    if entry is not None and entry[0]() is None:
+        _default_services.pop(key, None)
+
+def _default_service():
+    global _default_executor
+    loop = asyncio.get_running_loop()
+    with _default_lock:
+        for key, (loop_ref, _) in list(_default_services.items()):
+            other = loop_ref()
+            if other is None or other.is_closed():
+                del _default_services[key]
+        entry = _default_services.get(id(loop))
+        if entry is not None and entry[0]() is loop:
+            return entry[1]
+        if _default_executor is None:
+            _default_executor = ProcessPoolExecutor(max_workers=_resolve_n_jobs(-1))
+        service = ForecastService(executor=_default_executor)
+        _default_services[id(loop)] = (weakref.ref(loop), service)
+        weakref.finalize(loop, _forget_loop, id(loop))
+    return service
+
+# Shuts down the process pool of forecast_async's default services; a later call
+# starts a new one
+@atexit.register
+def shutdown_default_service():
+    global _default_executor
+    with _default_lock:
+        executor, _default_executor = _default_executor, None
+        _default_services.clear()
+    if executor is not None:
+        executor.shutdown()
+
+# main_forecasting as a coroutine, through a default ForecastService shared by
+# every call on the running event loop that does not pass its own
+async def forecast_async(file_path, column_name, model_type='arima', steps=1, optimize=False, service=None,
+                         **kwargs):
+    if service is None:
+        service = _default_service()
+    return await service.forecast(file_path, column_name, model_type=model_type, steps=steps, optimize=optimize,
+                                  **kwargs)
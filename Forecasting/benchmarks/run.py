@@ -0,0 +1,139 @@
+import argparse
+import fnmatch
+import json
+import os
+import platform
+import statistics
+import sys
+import tempfile
+import time
+import tracemalloc
+import warnings
+from contextlib import contextmanager
+
+from statsmodels.tsa.holtwinters import ExponentialSmoothing
+from statsmodels.tsa.statespace.mlemodel import MLEModel
+
+from .suites import BENCHMARKS
+
+DEFAULT_THRESHOLD = 1.25
+
+# Counts model fits while active by wrapping the fit methods of the statsmodels
+# base classes, so every ARIMA, SARIMAX and Holt-Winters fit made in this process
+# is counted once whichever code path makes it
+@contextmanager
+def count_fits():
+    counter = {'fits': 0}
+    originals = {cls: cls.fit for cls in (MLEModel, ExponentialSmoothing)}
+
+    def counting(fit):
+        def wrapper(*args, **kwargs):
+            counter['fits'] += 1
+            return fit(*args, **kwargs)
+        return wrapper
+
+    for cls, fit in originals.items():
+        cls.fit = counting(fit)
+    try:
+        yield counter
+    finally:
+        for cls, fit in originals.items():
+            cls.fit = fit
+
+# Times one benchmark: one untimed warm-up call, then `repeat` timed calls, then
+# one more call under tracemalloc for the peak memory, which is kept out of the
+# timed calls since tracing slows allocation down
+def measure(benchmark, scale=1.0, repeat=3, workdir=None):
+    with warnings.catch_warnings():
+        warnings.simplefilter('ignore')
+        state = benchmark.setup(scale, workdir)
+        benchmark.run(state)
+
+        times = []
+        with count_fits() as counter:
+            for _ in range(repeat):
+                start = time.perf_counter()
+                benchmark.run(state)
+                times.append(time.perf_counter() - start)
+
+        tracemalloc.start()
+        try:
+            benchmark.run(state)
+            peak = tracemalloc.get_traced_memory()[1]
+        finally:
+            tracemalloc.stop()
+
+    wall_time = statistics.median(times)
+    fits = counter['fits'] / repeat
+    return {
+        'wall_time': wall_time,
+        'min_time': min(times),
+        'fits': fits,
+        'fits_per_second': fits / wall_time if wall_time > 0 else None,
+        'peak_memory': peak,
+    }
+
+def run(pattern='*', scale=1.0, repeat=3, workdir=None, log=None):
+    selected = [benchmark for benchmark in BENCHMARKS if fnmatch.fnmatch(benchmark.name, pattern)]
+    results = {}
+    with tempfile.TemporaryDirectory() as tmp:
+        for benchmark in selected:
+            results[benchmark.name] = measure(benchmark, scale, repeat, workdir or tmp)
+            if log is not None:
+                log.write(format_result(benchmark.name, results[benchmark.name]) + '\n')
+                log.flush()
+    return {
+        'machine': {'python': platform.python_version(), 'platform': platform.platform(),
+                    'processor': platform.processor(), 'cpus': os.cpu_count()},
+        'scale': scale,
+        'repeat': repeat,
+        'results': results,
+    }
+
+def format_result(name, result):
+    fits_per_second = result['fits_per_second']
+    rate = f"{fits_per_second:9.1f} fits/s" if fits_per_second else ' ' * 15
+    return f"{name:48s} {result['wall_time'] * 1000:10.1f} ms  {rate}  {result['peak_memory'] / 2 ** 20:8.1f} MiB"
+
+# Benchmarks whose median wall time or peak memory grew by more than `threshold`
+# times the baseline's; benchmarks missing from either side are skipped
+def compare(current, baseline, threshold=DEFAULT_THRESHOLD):
+    if current['scale'] != baseline['scale']:
+        raise ValueError(f"Cannot compare results at scale {current['scale']} with a baseline at scale {baseline['scale']}.")
+    regressions = []
+    for name, result in current['results'].items():
+        reference = baseline['results'].get(name)
+        if reference is None:
+            continue
+        for metric in ('wall_time', 'peak_memory'):
+            if reference[metric] and result[metric] / reference[metric] > threshold:
+                regressions.append((name, metric, result[metric] / reference[metric]))
+    return regressions
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Run the forecasting benchmarks.')
+    parser.add_argument('--bench', default='*', help='glob over benchmark names, e.g. "optimize.*"')
+    parser.add_argument('--scale', type=float, default=1.0, help='input size relative to the full benchmarks')
+    parser.add_argument('--repeat', type=int, default=3)
+    parser.add_argument('--save', default=None, help='write the results to this JSON file')
+    parser.add_argument('--compare', default=None, help='baseline JSON file to compare against')
+    parser.add_argument('--threshold', type=float, default=DEFAULT_THRESHOLD,
+                        help='slowdown ratio reported as a regression')
+    args = parser.parse_args(argv)
+
+    import optuna
+    optuna.logging.set_verbosity(optuna.logging.WARNING)
+    results = run(args.bench, args.scale, args.repeat, log=sys.stdout)
+    if args.save:
+        with open(args.save, 'w') as f:
+            json.dump(results, f, indent=2)
+    if args.compare:
+        with open(args.compare) as f:
+            regressions = compare(results, json.load(f), args.threshold)
+        for name, metric, ratio in regressions:
+            print(f"REGRESSION {name} {metric}: {ratio:.2f}x baseline")
+        return 1 if regressions else 0
+    return 0
+
+if __name__ == '__main__':
+    sys.exit(main())
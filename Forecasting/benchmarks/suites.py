@@ -0,0 +1,79 @@
+import os
+
+from Forecasting.batch import batch_forecasting
+from Forecasting.forecast import (
+    forecast_arima,
+    forecast_exponential_smoothing,
+    forecast_sarima,
+    load_dataset,
+)
+
+from .synthetic import make_series, write_metrics_csv
+
+
+# One benchmark: `setup(scale, workdir)` builds its input outside the timed
+# region and `run(state)` is the timed call. Names carry the full-scale sizes;
+# `scale` shrinks the inputs for quick runs and is saved with the results.
+class Benchmark:
+
+    def __init__(self, name, setup, run):
+        self.name = name
+        self.setup = setup
+        self.run = run
+
+def _scaled(length, scale):
+    return max(48, int(length * scale))
+
+def _series_benchmark(group, forecaster, length, periods, optimize, **kwargs):
+    def setup(scale, workdir):
+        return make_series(_scaled(length, scale), periods=periods)
+
+    def run(series):
+        return forecaster(series, steps=12, optimize=optimize, seed=0, **kwargs)
+
+    name = f"{group}.{forecaster.__name__.replace('forecast_', '')}.n{length}"
+    return Benchmark(name, setup, run)
+
+def _load_benchmark(n_vms, length, **load_kwargs):
+    def setup(scale, workdir):
+        path = os.path.join(workdir, f'metrics_{n_vms}x{length}_{scale}.csv')
+        if not os.path.exists(path):
+            write_metrics_csv(path, max(1, int(n_vms * scale)), length)
+        return path
+
+    def run(path):
+        return load_dataset(path, 'value', **load_kwargs)
+
+    suffix = '.filtered' if load_kwargs.get('filters') else ''
+    return Benchmark(f'load_dataset.{n_vms}x{length}{suffix}', setup, run)
+
+def _batch_benchmark(n_vms, length, model_type, engine='statsmodels'):
+    def setup(scale, workdir):
+        path = os.path.join(workdir, f'batch_{n_vms}x{length}_{scale}.csv')
+        if not os.path.exists(path):
+            write_metrics_csv(path, max(1, int(n_vms * scale)), _scaled(length, scale), metrics=('Percentage CPU',))
+        return path
+
+    def run(path):
+        return batch_forecasting(path, 'value', group_by=['vm_id'], model_type=model_type, steps=12, engine=engine)
+
+    suffix = '' if engine == 'statsmodels' else f'.{engine}'
+    return Benchmark(f'batch.{model_type}{suffix}.{n_vms}x{length}', setup, run)
+
+BENCHMARKS = [
+    _series_benchmark('fit', forecast_arima, 240, (), False),
+    _series_benchmark('fit', forecast_arima, 2000, (), False),
+    _series_benchmark('fit', forecast_sarima, 240, (12,), False),
+    _series_benchmark('fit', forecast_sarima, 960, (24,), False),
+    _series_benchmark('fit', forecast_exponential_smoothing, 240, (12,), False),
+    _series_benchmark('fit', forecast_exponential_smoothing, 2000, (24, 168), False),
+    _series_benchmark('optimize', forecast_arima, 240, (), True, n_trials=10),
+    _series_benchmark('optimize', forecast_sarima, 240, (12,), True, n_trials=10),
+    _series_benchmark('optimize', forecast_exponential_smoothing, 240, (12,), True, n_trials=10),
+    _load_benchmark(200, 2000),
+    _load_benchmark(200, 2000, filters={'vm_id': 'vm-0007', 'name': 'Percentage CPU'}),
+    _batch_benchmark(16, 240, 'arima'),
+    _batch_benchmark(16, 240, 'exponential_smoothing'),
+    _batch_benchmark(16, 240, 'exponential_smoothing', engine='numpy'),
+    _batch_benchmark(256, 240, 'exponential_smoothing', engine='numpy'),
+]
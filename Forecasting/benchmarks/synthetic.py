@@ -0,0 +1,34 @@
+import numpy as np
+import pandas as pd
+
+
+# Synthetic series with a linear trend, optional seasonal components and Gaussian
+# noise. `periods` lists the seasonal periods, each with amplitude `amplitude`;
+# `offset` keeps the values positive so multiplicative models stay valid.
+def make_series(n, periods=(), trend=0.01, amplitude=5.0, noise=1.0, offset=50.0, seed=0):
+    rng = np.random.default_rng(seed)
+    t = np.arange(n)
+    values = offset + trend * t + noise * rng.standard_normal(n)
+    for period in periods:
+        values = values + amplitude * np.sin(2 * np.pi * t / period)
+    return pd.Series(values)
+
+# A long-format export in the layout of data/metrics.csv: one row per VM, metric
+# and hour, with `n_vms` VMs times `metrics` series of `length` points each
+def make_metrics_frame(n_vms, length, metrics=('Percentage CPU', 'Available Memory Bytes'), period=24, seed=0):
+    timestamps = pd.date_range('2024-04-03 16:00', periods=length, freq='h').strftime('%m/%d/%Y %H:%M')
+    frames = []
+    for i in range(n_vms):
+        for j, name in enumerate(metrics):
+            frames.append(pd.DataFrame({
+                'collection_id': 'c1',
+                'vm_id': f'vm-{i:04d}',
+                'name': name,
+                'value': make_series(length, periods=(period,), seed=seed + i * len(metrics) + j).to_numpy(),
+                'time_stamp': timestamps,
+            }))
+    return pd.concat(frames, ignore_index=True)
+
+def write_metrics_csv(path, n_vms, length, **kwargs):
+    make_metrics_frame(n_vms, length, **kwargs).to_csv(path, index=False)
+    return path
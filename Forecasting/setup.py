@@ -9,18 +9,17 @@ def read_readme():
 setup(
     name='forecastify',
     version='0.1',
-    packages=find_packages(),
+    packages=find_packages(exclude=['benchmarks', 'benchmarks.*']),
     install_requires=[
         'pandas',
         'statsmodels',
         'optuna',
         'matplotlib',
-        'numpy',
-        'scikit-learn'
+        'numpy'
     ],
     entry_points={
         'console_scripts': [
-            'forecasting=forecasting.forecast:main_forecasting',
+            'forecasting=Forecasting.cli:main',
         ],
     },
     test_suite='tests',
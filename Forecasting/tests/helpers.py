@@ -0,0 +1,7 @@
+from benchmarks.synthetic import make_series
+
+
+# The series most tests fit: a period-12 season on a gentle trend with Gaussian
+# noise, built like the benchmark series so both exercise the same data
+def seasonal_series(n=96, trend=0.05, amplitude=3.0, noise=0.5, offset=20.0, seed=0):
+    return make_series(n, periods=(12,), trend=trend, amplitude=amplitude, noise=noise, offset=offset, seed=seed)
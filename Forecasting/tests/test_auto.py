@@ -0,0 +1,83 @@
+import tempfile
+import unittest
+
+import pandas as pd
+
+from Forecasting.cache import ModelCache
+from Forecasting.forecast import forecast_auto, select_model
+from Forecasting.instrumentation import Instrumentation
+
+from helpers import seasonal_series
+
+
+class TestAutoSelection(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.series = seasonal_series()
+
+    def test_default_params_leaderboard(self):
+        model_type, params, model_fit, leaderboard = select_model(self.series, steps=6)
+        self.assertEqual(sorted(leaderboard['model_type']), ['arima', 'exponential_smoothing', 'sarima'])
+        self.assertTrue(leaderboard['score'].is_monotonic_increasing)
+        self.assertEqual(model_type, leaderboard['model_type'][0])
+        self.assertEqual(params, leaderboard['params'][0])
+        self.assertTrue((leaderboard['seconds'] > 0).all())
+        self.assertEqual(len(model_fit.forecast(6)), 6)
+
+    def test_default_sarima_is_fitted(self):
+        _, _, _, leaderboard = select_model(self.series, steps=12)
+        sarima = leaderboard.set_index('model_type').loc['sarima']
+        self.assertEqual(sarima['status'], 'complete')
+        self.assertLess(sarima['score'], float('inf'))
+
+        # The default params warm-start the search instead of being rejected
+        instrumentation = Instrumentation(keep_events=True)
+        _, _, _, leaderboard = select_model(self.series, steps=12, optimize=True, n_trials=3, seed=0,
+                                            model_types=('sarima',), instrumentation=instrumentation)
+        self.assertEqual(leaderboard['status'][0], 'complete')
+        first = next(event for event in instrumentation.events if event['event'] == 'trial')
+        self.assertEqual(first['state'], 'complete')
+
+    def test_forecast_auto(self):
+        forecast = forecast_auto(self.series, steps=6, model_types=('exponential_smoothing', 'arima'))
+        self.assertEqual(len(forecast), 6)
+        self.assertIn(forecast.attrs['model_type'], ('exponential_smoothing', 'arima'))
+        self.assertEqual(len(forecast.attrs['leaderboard']), 2)
+
+    def test_shared_trial_budget(self):
+        instrumentation = Instrumentation()
+        _, _, _, leaderboard = select_model(self.series, steps=6, optimize=True, n_trials=12, seed=0,
+                                            model_types=('exponential_smoothing', 'arima'),
+                                            instrumentation=instrumentation)
+        self.assertLessEqual(leaderboard['trials'].sum(), 12)
+        self.assertTrue(set(leaderboard['status']) <= {'complete', 'abandoned', 'failed'})
+        studies = [event['model_type'] for event in instrumentation.events if event['event'] == 'study']
+        self.assertEqual(studies, ['exponential_smoothing', 'arima'])
+
+    def test_abandons_family_that_cannot_win(self):
+        _, _, _, leaderboard = select_model(self.series, steps=6, optimize=True, n_trials=40, seed=0,
+                                            model_types=('exponential_smoothing', 'arima'))
+        arima = leaderboard.set_index('model_type').loc['arima']
+        self.assertEqual(arima['status'], 'abandoned')
+        self.assertLess(arima['trials'], 20)
+        self.assertGreater(arima['score'], leaderboard['score'].min())
+
+    def test_timeout_skips_remaining_families(self):
+        model_type, _, _, leaderboard = select_model(self.series, steps=6, timeout=0)
+        self.assertEqual(model_type, 'exponential_smoothing')
+        self.assertEqual(list(leaderboard['status']), ['complete', 'skipped', 'skipped'])
+
+    def test_cache_and_errors(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            cache = ModelCache(temp_dir)
+            first = select_model(self.series, steps=6, model_types=('arima',), cache=cache)
+            second = select_model(self.series, steps=6, model_types=('arima',), cache=cache)
+            self.assertEqual(first[1], second[1])
+            pd.testing.assert_frame_equal(first[3], second[3])
+        with self.assertRaises(ValueError):
+            select_model(self.series, model_types=('prophet',))
+
+
+if __name__ == '__main__':
+    unittest.main()
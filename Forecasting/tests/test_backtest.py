@@ -0,0 +1,74 @@
+import unittest
+
+import numpy as np
+from statsmodels.tsa.arima.model import ARIMA
+from statsmodels.tsa.holtwinters import ExponentialSmoothing
+
+from Forecasting.backtest import backtest, evaluate_origins, rolling_origins
+from Forecasting.forecast import optimize_arima, _score
+
+from helpers import seasonal_series
+
+
+class TestBacktest(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.series = seasonal_series(240, trend=0.02, amplitude=2.0, noise=0.3, offset=30.0, seed=7)
+
+    def test_rolling_origins(self):
+        np.testing.assert_array_equal(rolling_origins(100, 5, 3), [85, 90, 95])
+        np.testing.assert_array_equal(rolling_origins(100, 5, 3, stride=1), [93, 94, 95])
+        with self.assertRaises(ValueError):
+            rolling_origins(10, 5, 3)
+
+    def test_state_space_folds_match_forecasts_from_each_origin(self):
+        origins = rolling_origins(len(self.series), 6, 4)
+        model_fit = ARIMA(self.series[:origins[0]], order=(2, 1, 1)).fit()
+        metrics = evaluate_origins(model_fit, self.series, origins, 6)
+
+        for origin, mse in zip(origins, metrics['mse']):
+            forecast = model_fit.apply(self.series[:origin]).forecast(6)
+            expected = np.mean((self.series[origin:origin + 6].to_numpy() - forecast.to_numpy()) ** 2)
+            self.assertAlmostEqual(mse, expected)
+
+    def test_holt_winters_folds_match_forecasts_from_each_origin(self):
+        origins = rolling_origins(len(self.series), 12, 3)
+        model_fit = ExponentialSmoothing(self.series[:origins[0]], trend='add', seasonal='mul',
+                                         seasonal_periods=12).fit()
+        metrics = evaluate_origins(model_fit, self.series, origins, 12)
+
+        params = model_fit.params
+        for origin, mae in zip(origins, metrics['mae']):
+            refiltered = ExponentialSmoothing(self.series[:origin], trend='add', seasonal='mul', seasonal_periods=12,
+                                              initialization_method='known', initial_level=params['initial_level'],
+                                              initial_trend=params['initial_trend'],
+                                              initial_seasonal=params['initial_seasons'])
+            refiltered = refiltered.fit(smoothing_level=params['smoothing_level'],
+                                        smoothing_trend=params['smoothing_trend'],
+                                        smoothing_seasonal=params['smoothing_seasonal'], optimized=False)
+            expected = np.mean(np.abs(self.series[origin:origin + 12].to_numpy() - refiltered.forecast(12).to_numpy()))
+            self.assertAlmostEqual(mae, expected)
+
+    def test_backtest_returns_per_fold_metrics(self):
+        metrics = backtest(self.series, 'exponential_smoothing', steps=12, folds=5)
+        self.assertEqual(list(metrics.columns), ['fold', 'origin', 'mse', 'mae', 'mape'])
+        self.assertEqual(len(metrics), 5)
+        self.assertTrue(np.isfinite(metrics[['mse', 'mae', 'mape']].to_numpy()).all())
+
+    def test_single_fold_backtest_is_the_holdout(self):
+        holdout, _ = _score('arima', self.series, {'p': 1, 'd': 1, 'q': 1}, 6)
+        model_fit = ARIMA(self.series[:-6], order=(1, 1, 1)).fit()
+        metrics = evaluate_origins(model_fit, self.series, [len(self.series) - 6], 6)
+        self.assertAlmostEqual(holdout, metrics['mse'].iloc[0])
+
+        multi_fold, _ = _score('arima', self.series, {'p': 1, 'd': 1, 'q': 1}, 6, folds=4)
+        self.assertTrue(np.isfinite(multi_fold))
+
+    def test_backtest_as_optimizer_objective(self):
+        model_fit = optimize_arima(self.series, steps=6, n_trials=3, seed=0, folds=4)
+        self.assertEqual(len(model_fit.forecast(6)), 6)
+
+
+if __name__ == '__main__':
+    unittest.main()
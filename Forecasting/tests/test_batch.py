@@ -0,0 +1,63 @@
+import os
+import tempfile
+import unittest
+
+import numpy as np
+import pandas as pd
+
+from Forecasting.batch import batch_forecasting, main
+
+
+class TestBatchForecasting(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.temp_dir = tempfile.TemporaryDirectory()
+        cls.file_path = os.path.join(cls.temp_dir.name, 'metrics.csv')
+        t = np.arange(60)
+        frames = []
+        for vm_id, offset in [('vm-a', 5.0), ('vm-b', 50.0)]:
+            frames.append(pd.DataFrame({
+                'collection_id': 'c1',
+                'vm_id': vm_id,
+                'name': 'Percentage CPU',
+                'value': offset + np.sin(t / 3.0),
+            }))
+        pd.concat(frames).to_csv(cls.file_path, index=False)
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.temp_dir.cleanup()
+
+    def test_batch_forecasting_one_block_per_group(self):
+        forecasts = batch_forecasting(self.file_path, 'value', group_by=['vm_id', 'name'], steps=3)
+        self.assertEqual(list(forecasts.columns), ['vm_id', 'name', 'step', 'forecast', 'error'])
+        self.assertEqual(len(forecasts), 6)
+        self.assertEqual(sorted(forecasts['vm_id'].unique()), ['vm-a', 'vm-b'])
+        means = forecasts.groupby('vm_id')['forecast'].mean()
+        self.assertLess(means['vm-a'], means['vm-b'])
+
+    def test_batch_forecasting_process_pool_matches_serial(self):
+        serial = batch_forecasting(self.file_path, 'value', group_by=['vm_id'], steps=2, n_jobs=1)
+        parallel = batch_forecasting(self.file_path, 'value', group_by=['vm_id'], steps=2, n_jobs=2)
+        pd.testing.assert_frame_equal(serial, parallel)
+
+    def test_batch_forecasting_missing_group_column(self):
+        with self.assertRaises(ValueError):
+            batch_forecasting(self.file_path, 'value', group_by=['host'])
+
+    def test_batch_cli_writes_csv(self):
+        output = os.path.join(self.temp_dir.name, 'forecasts.csv')
+        self.assertEqual(main([self.file_path, '--group-by', 'vm_id', '--steps', '2', '--output', output]), 0)
+        self.assertEqual(len(pd.read_csv(output)), 4)
+
+    def test_batch_cli_is_the_forecasting_command_grouped_by_default(self):
+        output = os.path.join(self.temp_dir.name, 'grouped.json')
+        self.assertEqual(main([self.file_path, '--steps', '2', '--filter', 'vm_id=vm-b', '--output', output]), 0)
+        forecasts = pd.read_json(output)
+        self.assertEqual(list(forecasts.columns), ['file', 'vm_id', 'name', 'step', 'forecast', 'error'])
+        self.assertEqual(set(forecasts['vm_id']), {'vm-b'})
+
+
+if __name__ == '__main__':
+    unittest.main()
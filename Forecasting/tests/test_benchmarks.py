@@ -0,0 +1,56 @@
+import unittest
+
+import numpy as np
+from statsmodels.tsa.arima.model import ARIMA
+
+from benchmarks.run import compare, count_fits, measure
+from benchmarks.suites import BENCHMARKS, Benchmark
+from benchmarks.synthetic import make_metrics_frame, make_series
+
+
+class TestBenchmarks(unittest.TestCase):
+
+    def test_make_series_is_seasonal_and_reproducible(self):
+        series = make_series(240, periods=(12,), noise=0.1)
+        self.assertEqual(len(series), 240)
+        self.assertGreater(series.min(), 0)
+        self.assertGreater(np.corrcoef(series[:-12], series[12:])[0, 1], 0.9)
+        np.testing.assert_array_equal(series, make_series(240, periods=(12,), noise=0.1))
+
+    def test_make_metrics_frame_layout(self):
+        df = make_metrics_frame(3, 10)
+        self.assertEqual(list(df.columns), ['collection_id', 'vm_id', 'name', 'value', 'time_stamp'])
+        self.assertEqual(len(df), 3 * 2 * 10)
+
+    def test_count_fits(self):
+        series = make_series(60)
+        with count_fits() as counter:
+            ARIMA(series, order=(1, 0, 0)).fit()
+            ARIMA(series, order=(0, 0, 1)).fit()
+        self.assertEqual(counter['fits'], 2)
+        ARIMA(series, order=(1, 0, 0)).fit()
+        self.assertEqual(counter['fits'], 2)
+
+    def test_measure(self):
+        benchmark = Benchmark('arima', lambda scale, workdir: make_series(60),
+                              lambda series: ARIMA(series, order=(1, 0, 0)).fit())
+        result = measure(benchmark, repeat=2)
+        self.assertEqual(result['fits'], 1)
+        self.assertGreater(result['wall_time'], 0)
+        self.assertGreater(result['peak_memory'], 0)
+
+    def test_compare_reports_regressions(self):
+        baseline = {'scale': 1.0, 'results': {'a': {'wall_time': 1.0, 'peak_memory': 100}}}
+        current = {'scale': 1.0, 'results': {'a': {'wall_time': 1.5, 'peak_memory': 100},
+                                             'b': {'wall_time': 1.0, 'peak_memory': 100}}}
+        self.assertEqual(compare(current, baseline), [('a', 'wall_time', 1.5)])
+        with self.assertRaises(ValueError):
+            compare(dict(current, scale=0.1), baseline)
+
+    def test_benchmark_names_are_unique(self):
+        names = [benchmark.name for benchmark in BENCHMARKS]
+        self.assertEqual(len(names), len(set(names)))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,89 @@
+import tempfile
+import unittest
+from unittest import mock
+
+from Forecasting import forecast
+from Forecasting.cache import ModelCache
+from Forecasting.forecast import SARIMA_SEARCH_SPACE, _fit_sarima, _run_study, optimize_arima, select_model
+from Forecasting.instrumentation import Instrumentation
+
+from helpers import seasonal_series
+
+
+class TestBudgets(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.series = seasonal_series()
+
+    def test_fit_timeout_aborts_fit(self):
+        params = {'p': 1, 'd': 1, 'q': 1, 'P': 1, 'D': 1, 'Q': 0, 's': 12}
+        with self.assertRaises(TimeoutError):
+            _fit_sarima(self.series, params, timeout=0)
+        self.assertEqual(len(_fit_sarima(self.series, params, timeout=60).forecast(3)), 3)
+
+    def test_study_timeout_keeps_best_so_far(self):
+        study = _run_study('arima', self.series, 6, n_trials=30, seed=0, timeout=0)
+        self.assertTrue(study.user_attrs['timed_out'])
+        self.assertEqual(len(study.trials), 1)
+        self.assertLess(study.best_value, float('inf'))
+
+        model_fit = optimize_arima(self.series, steps=6, n_trials=30, seed=0, timeout=0)
+        self.assertEqual(len(model_fit.forecast(6)), 6)
+
+    def test_timed_out_fits_fail_their_trials(self):
+        instrumentation = Instrumentation()
+        _run_study('arima', self.series, 6, n_trials=3, seed=0, fit_timeout=0, instrumentation=instrumentation)
+        self.assertEqual(instrumentation.summary()['arima']['trials']['failed'], 3)
+        errors = [event['error'] for event in instrumentation.events if event['event'] == 'fit']
+        self.assertTrue(all('fit timeout' in error for error in errors))
+
+    def test_fit_maxiter_caps_iterations(self):
+        instrumentation = Instrumentation()
+        _run_study('arima', self.series, 6, n_trials=4, seed=0, fit_maxiter=3, instrumentation=instrumentation)
+        iterations = [event['iterations'] for event in instrumentation.events if event['event'] == 'fit']
+        self.assertTrue(all(count <= 3 for count in iterations))
+
+    def test_budgets_cap_final_fit(self):
+        instrumentation = Instrumentation(keep_events=True)
+        optimize_arima(self.series, steps=6, n_trials=3, seed=0, fit_maxiter=3, instrumentation=instrumentation)
+        select_model(self.series, steps=6, model_types=('sarima',), fit_maxiter=3, instrumentation=instrumentation)
+        final = [event for event in instrumentation.events if event['event'] == 'fit' and event['stage'] == 'final']
+        self.assertEqual([event['model_type'] for event in final], ['arima', 'sarima'])
+        self.assertTrue(all(event['iterations'] <= 3 for event in final))
+
+        # The fit scoring the default params ends in time, the refit on the whole series does not
+        def fit_sarima(train, params, maxiter=None, start_params=None, timeout=None):
+            return _fit_sarima(train, params, maxiter, start_params, 0 if len(train) == len(self.series) else timeout)
+
+        with mock.patch.dict(forecast._SEARCH_SPACES, {'sarima': (SARIMA_SEARCH_SPACE, fit_sarima, True)}):
+            with self.assertRaises(TimeoutError):
+                select_model(self.series, steps=6, model_types=('sarima',), fit_timeout=60)
+
+    def test_auto_shares_remaining_time(self):
+        _, _, _, leaderboard = select_model(self.series, steps=6, optimize=True, n_trials=30, timeout=0, seed=0)
+        statuses = leaderboard.set_index('model_type')['status']
+        self.assertEqual(statuses['exponential_smoothing'], 'timed_out')
+        self.assertEqual(statuses['arima'], 'skipped')
+        self.assertEqual(statuses['sarima'], 'skipped')
+
+    def test_timed_out_results_are_not_cached(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            cache = ModelCache(temp_dir)
+            optimize_arima(self.series, steps=6, n_trials=5, seed=0, timeout=0, cache=cache)
+            select_model(self.series, steps=6, optimize=True, n_trials=6, timeout=0, seed=0, cache=cache)
+            with mock.patch.object(forecast, '_run_study', wraps=forecast._run_study) as run_study:
+                optimize_arima(self.series, steps=6, n_trials=5, seed=0, timeout=0, cache=cache)
+                optimize_arima(self.series, steps=6, n_trials=5, seed=0, cache=cache)
+                select_model(self.series, steps=6, optimize=True, n_trials=6, timeout=0, seed=0, cache=cache)
+            self.assertEqual(run_study.call_count, 3)
+
+            # A complete search is cached, but only for the same number of trials
+            with mock.patch.object(forecast, '_run_study', wraps=forecast._run_study) as run_study:
+                optimize_arima(self.series, steps=6, n_trials=5, seed=0, cache=cache)
+                optimize_arima(self.series, steps=6, n_trials=6, seed=0, cache=cache)
+            self.assertEqual(run_study.call_count, 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,94 @@
+import tempfile
+import unittest
+from unittest import mock
+
+import numpy as np
+import pandas as pd
+
+from Forecasting import forecast
+from Forecasting.cache import ModelCache
+from Forecasting.forecast import ARIMA_SEARCH_SPACE, forecast_arima
+
+
+class TestModelCache(unittest.TestCase):
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.temp_dir.cleanup)
+        rng = np.random.default_rng(1)
+        self.series = pd.Series(np.cumsum(rng.normal(0, 1, 80)))
+
+    def test_key_depends_on_values_model_and_steps(self):
+        cache = ModelCache(self.temp_dir.name)
+        key = cache.key(self.series, 'arima', 5, ARIMA_SEARCH_SPACE)
+        self.assertEqual(key, cache.key(self.series.copy(), 'arima', 5, ARIMA_SEARCH_SPACE))
+        self.assertNotEqual(key, cache.key(self.series + 1, 'arima', 5, ARIMA_SEARCH_SPACE))
+        self.assertNotEqual(key, cache.key(self.series, 'sarima', 5, ARIMA_SEARCH_SPACE))
+        self.assertNotEqual(key, cache.key(self.series, 'arima', 6, ARIMA_SEARCH_SPACE))
+
+    def test_key_depends_on_index(self):
+        cache = ModelCache(self.temp_dir.name)
+        hourly = self.series.set_axis(pd.date_range('2024-01-01', periods=80, freq='h'))
+        irregular = hourly.set_axis(pd.DatetimeIndex(list(hourly.index)))
+        keys = {cache.key(series, 'arima', 3, ARIMA_SEARCH_SPACE)
+                for series in (self.series, hourly, hourly.shift(1, freq='D'), irregular)}
+        self.assertEqual(len(keys), 4)
+
+        forecast_arima(self.series, steps=3, optimize=True, seed=0, n_trials=3, cache=cache)
+        forecast = forecast_arima(hourly, steps=3, optimize=True, seed=0, n_trials=3, cache=cache)
+        self.assertTrue(forecast.index.equals(pd.date_range('2024-01-04 08:00', periods=3, freq='h')))
+
+    def test_cache_hit_skips_search(self):
+        cache = ModelCache(self.temp_dir.name)
+        first = forecast_arima(self.series, steps=3, optimize=True, seed=0, cache=cache)
+        # The fitted model and the warm-start params for the same series
+        self.assertEqual(len(cache), 2)
+
+        with mock.patch.object(forecast, '_run_study', side_effect=AssertionError('search ran')):
+            second = forecast_arima(self.series, steps=3, optimize=True, seed=0, cache=cache)
+        pd.testing.assert_series_equal(first, second)
+
+    def test_cache_miss_warm_starts_from_previous_params(self):
+        cache = ModelCache(self.temp_dir.name)
+        forecast_arima(self.series, steps=3, optimize=True, seed=0, n_trials=3, cache=cache)
+        previous = cache.get(cache.key(self.series, 'arima', None, None))['params']
+
+        with mock.patch.object(forecast, '_run_study', wraps=forecast._run_study) as run_study:
+            forecast_arima(self.series, steps=4, optimize=True, seed=0, n_trials=3, cache=cache)
+        self.assertEqual(run_study.call_args.kwargs['warm_start'], previous)
+
+    def test_unloadable_entries_are_misses_and_removed(self):
+        cache = ModelCache(self.temp_dir.name)
+        cache.put('truncated', {'params': 1})
+        with open(cache._path('truncated'), 'r+b') as f:
+            f.truncate(5)
+        # Pickles of a class and of a module that no longer exist
+        cache.put('class', {'params': 1})
+        with open(cache._path('class'), 'wb') as f:
+            f.write(b'cForecasting.cache\nRemovedClass\n.')
+        cache.put('module', {'params': 1})
+        with open(cache._path('module'), 'wb') as f:
+            f.write(b'cForecasting.removed_module\nModelFit\n.')
+
+        for key in ('truncated', 'class', 'module'):
+            self.assertIsNone(cache.get(key))
+        self.assertEqual(len(cache), 0)
+
+    def test_eviction_keeps_most_recently_used(self):
+        cache = ModelCache(self.temp_dir.name, max_entries=2)
+        cache.put('a', {'params': 1})
+        cache.put('b', {'params': 2})
+        cache.get('a')
+        cache.put('c', {'params': 3})
+        self.assertEqual(len(cache), 2)
+        self.assertIsNone(cache.get('b'))
+        self.assertEqual(cache.get('a'), {'params': 1})
+
+    def test_eviction_by_size(self):
+        cache = ModelCache(self.temp_dir.name, max_entries=None, max_bytes=1)
+        cache.put('a', {'params': 1})
+        self.assertEqual(len(cache), 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
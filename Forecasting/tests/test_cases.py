@@ -1,7 +1,12 @@
 import unittest
+from unittest import mock
 import os
+from Forecasting import forecast
 from Forecasting.forecast import main_forecasting, load_dataset, forecast_arima, plot_forecast, forecast_sarima
+from Forecasting.forecast import optimize_arima, optimize_exponential_smoothing, _is_valid, _run_study
+import numpy as np
 import pandas as pd
+from helpers import seasonal_series
 class TestForecasting(unittest.TestCase):
 
     @classmethod
@@ -95,6 +100,62 @@ class TestForecasting(unittest.TestCase):
 
 
 
-    
+class TestParallelOptimization(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.series = seasonal_series(120, trend=0.0, amplitude=1.0, noise=0.1, offset=10.0)
+
+    def test_optimize_arima_parallel_is_deterministic(self):
+        first = optimize_arima(self.series, steps=5, n_trials=6, n_jobs=2, seed=42)
+        second = optimize_arima(self.series, steps=5, n_trials=6, n_jobs=2, seed=42)
+        self.assertEqual(first.model.order, second.model.order)
+        np.testing.assert_allclose(first.forecast(5), second.forecast(5))
+
+    def test_optimize_exponential_smoothing_parallel_matches_serial(self):
+        serial = optimize_exponential_smoothing(self.series, steps=5, n_trials=4, n_jobs=1, seed=7)
+        parallel = optimize_exponential_smoothing(self.series, steps=5, n_trials=4, n_jobs=4, seed=7)
+        np.testing.assert_allclose(serial.forecast(5), parallel.forecast(5))
+
+
+class TestPrunedSearch(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        rng = np.random.default_rng(5)
+        cls.series = pd.Series(np.cumsum(rng.normal(0, 1, 100)))
+
+    def test_invalid_sarima_combinations_are_rejected(self):
+        params = {'p': 1, 'd': 1, 'q': 1, 'P': 1, 'D': 1, 'Q': 2, 's': 12}
+        self.assertTrue(_is_valid('sarima', params, self.series, 5))
+        self.assertFalse(_is_valid('sarima', dict(params, Q=1), self.series, 5))
+        self.assertFalse(_is_valid('sarima', dict(params, p=12), self.series, 5))
+        self.assertFalse(_is_valid('sarima', dict(params, D=2, s=50), self.series, 5))
+        self.assertFalse(_is_valid('exponential_smoothing', {'seasonal': 'mul', 'seasonal_periods': 4},
+                                   self.series - 100, 5))
+
+    def test_invalid_trials_do_not_use_up_the_budget(self):
+        space = {'p': (0, 1), 'd': (0, 1), 'q': (0, 1), 'P': (0, 0), 'D': (0, 0), 'Q': (0, 1), 's': (4, 4)}
+        with mock.patch.dict(forecast._SEARCH_SPACES, {'sarima': (space, forecast._fit_sarima, True)}):
+            study = _run_study('sarima', self.series, 5, n_trials=4, seed=0)
+        evaluated = [trial for trial in study.trials if not trial.user_attrs.get("invalid", False)]
+        self.assertEqual(len(evaluated), 4)
+
+    def test_pruned_search_with_warm_start(self):
+        warm_start = {'p': 1, 'd': 1, 'q': 0}
+        study = _run_study('arima', self.series, 5, n_trials=12, seed=0, search='pruned', warm_start=warm_start)
+        self.assertEqual(study.trials[0].params, warm_start)
+        self.assertLessEqual(len(study.trials), 12)
+        self.assertIsNotNone(study.best_params)
+
+    def test_pruned_search_stops_on_plateau(self):
+        study = _run_study('arima', self.series, 5, n_trials=30, seed=0, search='pruned', patience=3)
+        self.assertLess(len(study.trials), 30)
+
+    def test_unknown_search(self):
+        with self.assertRaises(ValueError):
+            _run_study('arima', self.series, 5, n_trials=1, search='grid')
+
+
 if __name__ == '__main__':
     unittest.main()
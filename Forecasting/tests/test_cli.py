@@ -0,0 +1,87 @@
+import json
+import os
+import tempfile
+import unittest
+from unittest import mock
+
+import numpy as np
+import pandas as pd
+
+from Forecasting.cli import expand_inputs, main
+
+
+class TestCli(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.temp_dir = tempfile.TemporaryDirectory()
+        t = np.arange(60)
+        for vm_id, offset in [('vm-a', 5.0), ('vm-b', 50.0)]:
+            pd.DataFrame({
+                'vm_id': vm_id,
+                'name': 'Percentage CPU',
+                'value': offset + np.sin(t / 3.0),
+            }).to_csv(os.path.join(cls.temp_dir.name, f'{vm_id}.csv'), index=False)
+        cls.pattern = os.path.join(cls.temp_dir.name, 'vm-*.csv')
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.temp_dir.cleanup()
+
+    def _path(self, name):
+        return os.path.join(self.temp_dir.name, name)
+
+    def test_expand_inputs(self):
+        files = expand_inputs([self.pattern, self._path('vm-a.csv')])
+        self.assertEqual(files, [self._path('vm-a.csv'), self._path('vm-b.csv')])
+        with self.assertRaises(FileNotFoundError):
+            expand_inputs([self._path('missing-*.csv')])
+
+    def test_glob_to_csv(self):
+        output = self._path('forecasts.csv')
+        self.assertEqual(main([self.pattern, '--steps', '3', '--output', output]), 0)
+        forecasts = pd.read_csv(output)
+        self.assertEqual(list(forecasts.columns), ['file', 'step', 'forecast', 'error'])
+        self.assertEqual(len(forecasts), 6)
+        self.assertTrue(forecasts['error'].isna().all())
+
+    def test_json_output_follows_extension(self):
+        output = self._path('forecasts.json')
+        main([self._path('vm-a.csv'), '--steps', '2', '--output', output])
+        with open(output) as f:
+            records = json.load(f)
+        self.assertEqual([record['step'] for record in records], [1, 2])
+
+    def test_parquet_output_with_jobs(self):
+        output = self._path('forecasts.parquet')
+        self.assertEqual(main([self.pattern, '--steps', '2', '--jobs', '2', '--output', output]), 0)
+        forecasts = pd.read_parquet(output)
+        self.assertEqual(sorted(forecasts['file'].unique()), [self._path('vm-a.csv'), self._path('vm-b.csv')])
+
+    def test_group_by_and_filter(self):
+        output = self._path('grouped.csv')
+        main([self.pattern, '--group-by', 'vm_id', '--filter', 'name=Percentage CPU', '--output', output])
+        forecasts = pd.read_csv(output)
+        self.assertEqual(list(forecasts.columns), ['file', 'vm_id', 'step', 'forecast', 'error'])
+        self.assertEqual(len(forecasts), 2)
+
+    def test_failures_set_exit_status(self):
+        output = self._path('failed.csv')
+        self.assertEqual(main([self._path('vm-a.csv'), '--column', 'missing', '--output', output]), 1)
+        self.assertIn('not found', pd.read_csv(output)['error'][0])
+
+    def test_numpy_engine_only_for_default_exponential_smoothing(self):
+        for args in (['--model', 'arima'], ['--model', 'exponential_smoothing', '--optimize']):
+            with mock.patch('sys.stderr'), self.assertRaises(SystemExit):
+                main([self._path('vm-a.csv'), '--engine', 'numpy', *args])
+
+    def test_plots_are_saved_without_show(self):
+        plot_dir = self._path('plots')
+        with mock.patch('matplotlib.pyplot.show') as show:
+            main([self._path('vm-a.csv'), '--plot-dir', plot_dir, '--output', self._path('plotted.csv')])
+        show.assert_not_called()
+        self.assertTrue(os.path.exists(os.path.join(plot_dir, 'vm-a_forecast.png')))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,84 @@
+import os
+import tempfile
+import unittest
+
+import numpy as np
+import pandas as pd
+
+from Forecasting.dataset import iter_dataset, load_series, read_dataset
+from Forecasting.forecast import load_dataset
+
+
+class TestDataset(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.temp_dir = tempfile.TemporaryDirectory()
+        t = np.arange(50)
+        frames = []
+        for vm_id, offset in [('vm-a', 0.0), ('vm-b', 100.0)]:
+            for name in ['Percentage CPU', 'Available Memory Bytes']:
+                frames.append(pd.DataFrame({
+                    'collection_id': 'c1',
+                    'vm_id': vm_id,
+                    'name': name,
+                    'value': offset + t,
+                    'time_stamp': pd.date_range('2024-04-03 16:00', periods=len(t), freq='h').strftime('%m/%d/%Y %H:%M'),
+                }))
+        cls.df = pd.concat(frames, ignore_index=True)
+        cls.csv_path = os.path.join(cls.temp_dir.name, 'metrics.csv')
+        cls.df.to_csv(cls.csv_path, index=False)
+        cls.parquet_path = os.path.join(cls.temp_dir.name, 'metrics.parquet')
+        cls.df.to_parquet(cls.parquet_path, index=False)
+        cls.filters = {'vm_id': 'vm-b', 'name': 'Percentage CPU'}
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.temp_dir.cleanup()
+
+    def test_chunks_hold_only_requested_columns(self):
+        chunks = list(iter_dataset(self.csv_path, 'value', key_columns=['vm_id'], chunksize=30))
+        self.assertEqual(len(chunks), int(np.ceil(len(self.df) / 30)))
+        for chunk in chunks:
+            self.assertEqual(list(chunk.columns), ['vm_id', 'value'])
+            self.assertEqual(chunk['value'].dtype, np.float64)
+            self.assertIsInstance(chunk['vm_id'].dtype, pd.CategoricalDtype)
+
+    def test_filters_select_one_series(self):
+        series = load_series(self.csv_path, 'value', filters=self.filters, chunksize=17)
+        np.testing.assert_array_equal(series.to_numpy(), 100.0 + np.arange(50))
+        self.assertIsInstance(series.index, pd.RangeIndex)
+
+    def test_filter_accepts_several_values(self):
+        df = read_dataset(self.csv_path, 'value', key_columns=['vm_id'],
+                          filters={'vm_id': ['vm-a', 'vm-b'], 'name': 'Percentage CPU'})
+        self.assertEqual(len(df), 100)
+        self.assertEqual(sorted(df['vm_id'].cat.categories), ['vm-a', 'vm-b'])
+
+    def test_time_column_becomes_datetime_index(self):
+        series = load_series(self.csv_path, 'value', time_column='time_stamp', filters=self.filters)
+        self.assertIsInstance(series.index, pd.DatetimeIndex)
+        self.assertEqual(series.index[0], pd.Timestamp('2024-04-03 16:00'))
+        self.assertEqual(series.index[-1] - series.index[0], pd.Timedelta(hours=49))
+
+    def test_parquet_matches_csv(self):
+        from_csv = load_series(self.csv_path, 'value', filters=self.filters)
+        from_parquet = load_series(self.parquet_path, 'value', filters=self.filters, chunksize=20)
+        np.testing.assert_array_equal(from_parquet.to_numpy(), from_csv.to_numpy())
+
+    def test_missing_column(self):
+        with self.assertRaises(ValueError):
+            list(iter_dataset(self.csv_path, 'value', key_columns=['region']))
+
+    def test_load_dataset_keeps_default_behavior(self):
+        series = load_dataset(self.csv_path, 'value')
+        pd.testing.assert_series_equal(series, self.df['value'])
+
+    def test_load_dataset_with_filters(self):
+        series = load_dataset(self.csv_path, 'value', time_column='time_stamp', filters=self.filters)
+        self.assertEqual(len(series), 50)
+        self.assertIsInstance(series.index, pd.DatetimeIndex)
+
+
+if __name__ == '__main__':
+    unittest.main()
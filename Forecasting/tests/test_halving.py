@@ -0,0 +1,56 @@
+import unittest
+
+from Forecasting.forecast import (ARIMA_SEARCH_SPACE, SARIMA_SEARCH_SPACE, _halving_windows, _run_study,
+                                  optimize_arima)
+from Forecasting.instrumentation import Instrumentation
+
+from helpers import seasonal_series
+
+
+class TestHalving(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.series = seasonal_series(600, trend=0.01)
+
+    def test_windows(self):
+        self.assertEqual(_halving_windows(ARIMA_SEARCH_SPACE, 600, 6), [66, 200, 600])
+        self.assertEqual(_halving_windows(SARIMA_SEARCH_SPACE, 600, 6), [66, 200, 600])
+        self.assertEqual(_halving_windows({**SARIMA_SEARCH_SPACE, 's': [24]}, 600, 6), [200, 600])
+        self.assertEqual(_halving_windows(ARIMA_SEARCH_SPACE, 100, 6), [100])
+
+    def test_promotes_best_candidates(self):
+        instrumentation = Instrumentation(keep_events=True)
+        study = _run_study('arima', self.series, 6, n_trials=9, seed=0, search='halving',
+                           instrumentation=instrumentation)
+        self.assertEqual(instrumentation.summary()['arima']['trials'],
+                         {'complete': 1, 'pruned': 8, 'invalid': 0, 'failed': 0})
+        self.assertLess(study.best_value, float('inf'))
+
+        # 9 fits on 66 points, the best 3 on 200 and the best of those on all 600
+        fits = [event for event in instrumentation.events if event['event'] == 'fit']
+        self.assertEqual([event['stage'] for event in fits], ['partial'] * 12 + ['full'])
+        pruned = [trial for trial in study.trials if trial.state.name == 'PRUNED']
+        self.assertEqual(sorted(len(trial.intermediate_values) for trial in pruned), [1] * 6 + [2] * 2)
+
+    def test_reproducible(self):
+        first, second = (_run_study('arima', self.series, 6, n_trials=6, seed=1, search='halving') for _ in range(2))
+        self.assertEqual(first.best_params, second.best_params)
+        self.assertEqual(first.best_value, second.best_value)
+
+    def test_timeout_promotes_best_to_full_series(self):
+        study = _run_study('arima', self.series, 6, n_trials=6, seed=0, search='halving', timeout=0)
+        self.assertTrue(study.user_attrs['timed_out'])
+        self.assertEqual(len([trial for trial in study.trials if trial.state.name == 'COMPLETE']), 1)
+
+    def test_optimize(self):
+        model_fit = optimize_arima(self.series, steps=6, n_trials=6, seed=0, search='halving')
+        self.assertEqual(len(model_fit.forecast(6)), 6)
+
+    def test_unknown_search(self):
+        with self.assertRaises(ValueError):
+            _run_study('arima', self.series, 6, search='grid')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,94 @@
+import os
+import tempfile
+import unittest
+import warnings
+
+import numpy as np
+import pandas as pd
+from statsmodels.tsa.holtwinters import ExponentialSmoothing
+
+from Forecasting.batch import batch_forecasting
+from Forecasting.forecast import forecast_exponential_smoothing
+from Forecasting.holt_winters import fit_holt_winters
+
+
+def _series(n, period, seed, trend=0.0):
+    rng = np.random.default_rng(seed)
+    t = np.arange(n)
+    return 50 + trend * t + 5 * np.sin(2 * np.pi * t / period) + rng.normal(0, 1, n)
+
+
+class TestHoltWinters(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.values = np.vstack([_series(120, 12, seed) for seed in range(8)])
+
+    def test_matches_statsmodels_with_the_same_parameters(self):
+        for seasonal in ['add', 'mul']:
+            for trend in [None, 'add']:
+                batch = fit_holt_winters(self.values, seasonal, 12, trend=trend)
+                for i in [0, 5]:
+                    model_fit = batch.to_statsmodels(i)
+                    np.testing.assert_allclose(np.asarray(model_fit.fittedvalues), batch.fittedvalues[i])
+                    self.assertAlmostEqual(model_fit.sse, batch.sse[i], places=6)
+                    np.testing.assert_allclose(np.asarray(model_fit.forecast(30)), batch.forecast(30)[i])
+
+    def test_close_to_statsmodels_fit(self):
+        batch = fit_holt_winters(self.values, 'add', 12)
+        with warnings.catch_warnings():
+            warnings.simplefilter('ignore')
+            sse = np.array([ExponentialSmoothing(row, seasonal='add', seasonal_periods=12).fit().sse
+                            for row in self.values])
+        self.assertLess(np.median(batch.sse / sse), 1.3)
+
+    def test_parameters_within_statsmodels_bounds(self):
+        batch = fit_holt_winters(self.values + 0.3 * np.arange(120), 'add', 12, trend='add')
+        params = batch.params
+        self.assertTrue(np.all((params['smoothing_level'] >= 0) & (params['smoothing_level'] <= 1)))
+        self.assertTrue(np.all(params['smoothing_trend'] <= params['smoothing_level']))
+        self.assertTrue(np.all(params['smoothing_seasonal'] <= 1 - params['smoothing_level']))
+        self.assertEqual(params['initial_seasons'].shape, (8, 12))
+
+    def test_single_series(self):
+        batch = fit_holt_winters(self.values[0], 'add', 12)
+        self.assertEqual(len(batch), 1)
+        self.assertEqual(batch.forecast(5).shape, (1, 5))
+
+    def test_invalid_input(self):
+        with self.assertRaises(ValueError):
+            fit_holt_winters(self.values[:, :20], 'add', 12)
+        with self.assertRaises(ValueError):
+            fit_holt_winters(self.values - 100, 'mul', 12)
+
+    def test_forecast_engine(self):
+        series = pd.Series(self.values[0])
+        forecast = forecast_exponential_smoothing(series, steps=6, engine='numpy')
+        self.assertEqual(len(forecast), 6)
+        self.assertLess(np.abs(forecast - forecast_exponential_smoothing(series, steps=6)).max(), 2.0)
+        with self.assertRaises(ValueError):
+            forecast_exponential_smoothing(series, steps=6, engine='numba')
+        with self.assertRaises(ValueError):
+            forecast_exponential_smoothing(series, steps=6, optimize=True, engine='numpy')
+
+    def test_batch_engine(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            file_path = os.path.join(temp_dir, 'metrics.csv')
+            pd.DataFrame({
+                'vm_id': np.repeat(['vm-a', 'vm-b', 'vm-c'], 120)[:-20],
+                'value': np.concatenate([self.values[0], self.values[1], self.values[2][:100]]),
+            }).to_csv(file_path, index=False)
+
+            vectorized = batch_forecasting(file_path, 'value', group_by=['vm_id'], model_type='exponential_smoothing',
+                                           steps=3, engine='numpy')
+            default = batch_forecasting(file_path, 'value', group_by=['vm_id'], model_type='exponential_smoothing',
+                                        steps=3)
+            self.assertEqual(list(vectorized.columns), list(default.columns))
+            self.assertTrue(vectorized['error'].isna().all())
+            np.testing.assert_allclose(vectorized['forecast'], default['forecast'], atol=2.0)
+            with self.assertRaises(ValueError):
+                batch_forecasting(file_path, 'value', group_by=['vm_id'], engine='numpy')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,57 @@
+import os
+import subprocess
+import sys
+import unittest
+
+PACKAGE_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Dependencies every forecast needs; the import benchmark preloads them so that
+# it measures what importing the package adds on top
+REQUIRED_MODULES = [
+    'numpy',
+    'pandas',
+    'statsmodels.tsa.arima.model',
+    'statsmodels.tsa.statespace.sarimax',
+    'statsmodels.tsa.holtwinters',
+]
+
+# Budget for importing the package modules once the required dependencies are
+# loaded; pulling matplotlib back in alone costs more than this
+IMPORT_BUDGET_SECONDS = 0.25
+
+
+def _run(code):
+    env = dict(os.environ, PYTHONPATH=PACKAGE_ROOT)
+    env.pop('MPLBACKEND', None)
+    return subprocess.run([sys.executable, '-X', 'importtime', '-c', code], env=env, capture_output=True,
+                          text=True, check=True)
+
+
+class TestImports(unittest.TestCase):
+
+    def test_heavy_dependencies_are_not_imported(self):
+        result = _run("import sys\n"
+                      "import Forecasting.forecast, Forecasting.batch, Forecasting.incremental\n"
+                      "print(' '.join(m for m in ('optuna', 'sklearn', 'matplotlib') if m in sys.modules))")
+        self.assertEqual(result.stdout.strip(), '')
+
+    def test_import_time(self):
+        result = _run(f"import {', '.join(REQUIRED_MODULES)}\nimport Forecasting.forecast")
+        cumulative = None
+        for line in result.stderr.splitlines():
+            fields = line.split('|')
+            if len(fields) == 3 and fields[2].strip() == 'Forecasting.forecast':
+                cumulative = int(fields[1]) / 1e6
+        self.assertIsNotNone(cumulative)
+        self.assertLess(cumulative, IMPORT_BUDGET_SECONDS)
+
+    def test_pyplot_defaults_to_headless_backend(self):
+        result = _run("from Forecasting.forecast import _pyplot\n"
+                      "import matplotlib\n"
+                      "_pyplot()\n"
+                      "print(matplotlib.get_backend())")
+        self.assertEqual(result.stdout.strip().lower(), 'agg')
+
+
+if __name__ == '__main__':
+    unittest.main()
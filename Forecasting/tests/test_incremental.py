@@ -0,0 +1,78 @@
+import unittest
+
+import numpy as np
+import pandas as pd
+from statsmodels.tsa.arima.model import ARIMA
+from statsmodels.tsa.holtwinters import ExponentialSmoothing
+
+from Forecasting.incremental import IncrementalForecaster, RefitPolicy, refit_model, update_model
+
+from helpers import seasonal_series
+
+
+class TestIncrementalUpdates(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.series = seasonal_series(200, trend=0.0, amplitude=1.0, noise=0.2, seed=3)
+
+    def test_update_model_arima_matches_full_filter(self):
+        model_fit = ARIMA(self.series[:180], order=(1, 1, 1)).fit()
+        updated = update_model(model_fit, self.series[180:])
+        full = ARIMA(self.series, order=(1, 1, 1)).filter(model_fit.params)
+        np.testing.assert_allclose(updated.forecast(3), full.forecast(3))
+
+    def test_update_model_holt_winters_single_points(self):
+        model_fit = ExponentialSmoothing(self.series[:180], seasonal='add', seasonal_periods=12).fit()
+        updated = model_fit
+        for value in self.series[180:]:
+            updated = update_model(updated, [value])
+
+        params = model_fit.params
+        full = ExponentialSmoothing(self.series, seasonal='add', seasonal_periods=12, initialization_method='known',
+                                    initial_level=params['initial_level'],
+                                    initial_seasonal=params['initial_seasons'])
+        full = full.fit(smoothing_level=params['smoothing_level'], smoothing_seasonal=params['smoothing_seasonal'],
+                        optimized=False)
+        np.testing.assert_allclose(updated.forecast(3), full.forecast(3))
+        self.assertEqual(list(updated.forecast(3).index), [200, 201, 202])
+
+    def test_refit_policy(self):
+        policy = RefitPolicy(max_appended=24, max_ratio=0.5)
+        self.assertFalse(policy.should_refit(10, 100))
+        self.assertTrue(policy.should_refit(24, 100))
+        self.assertTrue(policy.should_refit(10, 20))
+
+    def test_incremental_forecaster_refits_when_policy_requires(self):
+        forecaster = IncrementalForecaster('arima', policy=RefitPolicy(max_appended=10)).fit(self.series[:180])
+        for start in range(180, 200, 5):
+            forecaster.update(self.series[start:start + 5])
+        self.assertEqual(forecaster.refits, 2)
+        self.assertEqual(len(forecaster.history), 200)
+        self.assertEqual(list(forecaster.forecast(2).index), [200, 201])
+
+    def test_refit_holt_winters_starts_from_current_parameters(self):
+        model_fit = ExponentialSmoothing(self.series[:180], seasonal='add', seasonal_periods=12).fit()
+        refit = refit_model(update_model(model_fit, self.series[180:]), self.series)
+        full = ExponentialSmoothing(self.series, seasonal='add', seasonal_periods=12).fit()
+        self.assertLessEqual(refit.sse, full.sse * 1.01)
+
+    def test_incremental_forecaster_keeps_datetime_index(self):
+        series = self.series.set_axis(pd.date_range('2024-01-01', periods=200, freq='h'))
+        for model_type in ('arima', 'exponential_smoothing'):
+            forecaster = IncrementalForecaster(model_type, policy=RefitPolicy(max_appended=12)).fit(series[:180])
+            forecaster.update(series[180:185])
+            for start in range(185, 200, 5):
+                forecaster.update(series[start:start + 5].to_numpy())
+            self.assertEqual(forecaster.refits, 1)
+            self.assertTrue(forecaster.history.index.equals(series.index))
+            expected = pd.date_range('2024-01-09 08:00', periods=2, freq='h')
+            self.assertTrue(forecaster.forecast(2).index.equals(expected))
+
+    def test_update_before_fit(self):
+        with self.assertRaises(ValueError):
+            IncrementalForecaster('arima').update([1.0])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,85 @@
+import unittest
+
+from Forecasting.forecast import optimize_arima, optimize_exponential_smoothing, _run_study
+from Forecasting.instrumentation import Instrumentation, fit_event, recording
+
+from helpers import seasonal_series
+
+
+class TestInstrumentation(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.series = seasonal_series()
+
+    def test_fit_trial_and_study_events(self):
+        received = []
+        instrumentation = Instrumentation(callbacks=[received.append])
+        optimize_arima(self.series, steps=6, n_trials=4, seed=0, instrumentation=instrumentation)
+
+        self.assertEqual(received, instrumentation.events)
+        kinds = [event['event'] for event in instrumentation.events]
+        self.assertEqual(kinds.count('study'), 1)
+        self.assertEqual(kinds.count('trial'), 4)
+        fits = [event for event in instrumentation.events if event['event'] == 'fit']
+        self.assertEqual([event['stage'] for event in fits], ['full'] * 4 + ['final'])
+        for event in fits:
+            self.assertGreater(event['duration'], 0)
+            self.assertIsNotNone(event['iterations'])
+
+        summary = instrumentation.summary()['arima']
+        self.assertEqual(summary['fits'], 5)
+        self.assertEqual(summary['trials']['complete'] + summary['trials']['failed'], 4)
+
+    def test_pruned_search_reports_partial_fits(self):
+        instrumentation = Instrumentation()
+        _run_study('arima', self.series, 6, n_trials=10, seed=0, search='pruned', instrumentation=instrumentation)
+        stages = {event['stage'] for event in instrumentation.events if event['event'] == 'fit'}
+        self.assertEqual(stages, {'partial', 'full'})
+        trials = [event for event in instrumentation.events if event['event'] == 'trial']
+        self.assertEqual(len(trials), 10)
+        for event in trials:
+            self.assertGreaterEqual(event['duration'], 0)
+
+    def test_invalid_trials_are_reported(self):
+        instrumentation = Instrumentation()
+        optimize_exponential_smoothing(self.series - 30, steps=6, n_trials=6, seed=0,
+                                       instrumentation=instrumentation)
+        self.assertGreater(instrumentation.summary()['exponential_smoothing']['trials']['invalid'], 0)
+
+    def test_events_match_with_process_pool(self):
+        instrumentation = Instrumentation()
+        _run_study('arima', self.series, 6, n_trials=4, n_jobs=2, seed=0, instrumentation=instrumentation)
+        self.assertEqual(instrumentation.summary()['arima']['fits'], 4)
+
+    def test_recording_keeps_errors_and_warnings(self):
+        record = {}
+        with self.assertRaises(ValueError):
+            with recording(record):
+                import warnings
+                warnings.warn('slow', RuntimeWarning)
+                raise ValueError('bad fit')
+        self.assertEqual(record['error'], 'bad fit')
+        self.assertEqual(record['warnings'], ['RuntimeWarning: slow'])
+
+        instrumentation = Instrumentation(keep_events=False)
+        instrumentation.emit(fit_event('sarima', {}, 'full', 0, record))
+        self.assertEqual(instrumentation.events, [])
+        self.assertEqual(instrumentation.summary()['sarima']['failed_fits'], 1)
+
+    def test_prometheus_export(self):
+        instrumentation = Instrumentation()
+        instrumentation.emit(fit_event('arima', {}, 'full', 0, {'duration': 0.5, 'iterations': 12,
+                                                               'warnings': ['ConvergenceWarning: no']}))
+        instrumentation.emit({'event': 'trial', 'model_type': 'arima', 'trial': 0, 'state': 'complete',
+                              'value': 1.0, 'duration': 0.5})
+        text = instrumentation.to_prometheus()
+        self.assertIn('# TYPE forecasting_fits_total counter', text)
+        self.assertIn('forecasting_fits_total{model_type="arima"} 1', text)
+        self.assertIn('forecasting_fit_iterations_total{model_type="arima"} 12', text)
+        self.assertIn('forecasting_convergence_warnings_total{model_type="arima"} 1', text)
+        self.assertIn('forecasting_trials_total{model_type="arima",state="complete"} 1', text)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,83 @@
+import io
+import os
+import tempfile
+import unittest
+from contextlib import redirect_stdout
+
+import numpy as np
+import pandas as pd
+from statsmodels.tsa.arima.model import ARIMA
+
+from Forecasting.forecast import (fit_model, forecast_arima, forecast_exponential_smoothing, forecast_intervals,
+                                  forecast_sarima, main_forecasting, prediction_frame)
+
+from helpers import seasonal_series
+
+
+class TestIntervals(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.series = seasonal_series(120, trend=0.02, amplitude=2.0, noise=0.3, offset=30.0, seed=3)
+
+    def test_state_space_intervals_match_get_forecast(self):
+        model_fit = ARIMA(self.series, order=(1, 1, 1)).fit()
+        frame = prediction_frame(model_fit, [1, 6, 24], levels=[0.8, 0.95])
+        self.assertEqual(list(frame.columns),
+                         ['horizon', 'forecast', 'lower_80', 'upper_80', 'lower_95', 'upper_95'])
+        self.assertEqual(list(frame['horizon']), [1, 6, 24])
+
+        expected = model_fit.get_forecast(24).summary_frame(alpha=0.05)
+        np.testing.assert_allclose(frame['forecast'], expected['mean'].to_numpy()[[0, 5, 23]])
+        np.testing.assert_allclose(frame['lower_95'], expected['mean_ci_lower'].to_numpy()[[0, 5, 23]])
+        self.assertEqual(list(frame.index), list(expected.index[[0, 5, 23]]))
+        self.assertTrue((frame['lower_95'] < frame['lower_80']).all())
+        self.assertTrue((frame['upper_80'] < frame['upper_95']).all())
+
+    def test_holt_winters_intervals_from_simulation(self):
+        model_fit = fit_model(self.series, 'exponential_smoothing')
+        frame = prediction_frame(model_fit, 12, levels=[0.9], random_state=0)
+        self.assertEqual(len(frame), 12)
+        np.testing.assert_allclose(frame['forecast'], model_fit.forecast(12))
+        self.assertTrue((frame['lower_90'] < frame['forecast']).all())
+        self.assertTrue((frame['forecast'] < frame['upper_90']).all())
+        pd.testing.assert_frame_equal(frame, prediction_frame(model_fit, 12, levels=[0.9], random_state=0))
+
+    def test_one_fit_for_every_horizon(self):
+        frame = forecast_intervals(self.series, 'arima', horizons=[24, 1, 6])
+        full = forecast_intervals(self.series, 'arima', horizons=24)
+        pd.testing.assert_frame_equal(frame, full[full['horizon'].isin([1, 6, 24])])
+
+    def test_invalid_arguments(self):
+        model_fit = ARIMA(self.series, order=(1, 1, 1)).fit()
+        with self.assertRaises(ValueError):
+            prediction_frame(model_fit, [0, 3])
+        with self.assertRaises(ValueError):
+            prediction_frame(model_fit, 3, levels=[95])
+        with self.assertRaises(ValueError):
+            fit_model(self.series, 'prophet')
+
+    def test_forecast_functions_forecast_from_fit_model(self):
+        for model_type, forecaster in [('arima', forecast_arima), ('sarima', forecast_sarima),
+                                       ('exponential_smoothing', forecast_exponential_smoothing)]:
+            np.testing.assert_allclose(forecaster(self.series, steps=6),
+                                       fit_model(self.series, model_type).forecast(6))
+
+        with self.assertRaises(ValueError):
+            fit_model(self.series[:20], 'exponential_smoothing')
+        with redirect_stdout(io.StringIO()) as output:
+            forecast = forecast_exponential_smoothing(self.series[:20], steps=3)
+        self.assertTrue(forecast.isna().all())
+        self.assertIn('Insufficient data', output.getvalue())
+
+    def test_main_forecasting_levels(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            file_path = os.path.join(temp_dir, 'metrics.csv')
+            self.series.to_frame('value').to_csv(file_path, index=False)
+            frame = main_forecasting(file_path, 'value', model_type='sarima', steps=6, levels=[0.5])
+            self.assertEqual(list(frame.columns), ['horizon', 'forecast', 'lower_50', 'upper_50'])
+            self.assertEqual(len(frame), 6)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,81 @@
+import os
+import re
+import tempfile
+import unittest
+
+import matplotlib
+matplotlib.use('Agg')
+import matplotlib.pyplot as plt
+import numpy as np
+import pandas as pd
+
+from Forecasting.forecast import plot_forecast, prediction_frame
+from Forecasting.plotting import PlotRenderer, draw_forecast, new_figure, render_grid, render_pdf
+from statsmodels.tsa.arima.model import ARIMA
+
+
+def _page_count(path):
+    with open(path, 'rb') as f:
+        return len(re.findall(rb'/Type\s*/Page[^s]', f.read()))
+
+
+class TestPlotting(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        rng = np.random.default_rng(1)
+        cls.plots = []
+        for i in range(5):
+            series = pd.Series(10 * i + rng.normal(0, 1, 48).cumsum())
+            forecast = pd.Series(np.full(6, series.iloc[-1]), index=range(48, 54), name='Forecast')
+            cls.plots.append((f'series {i}', series, forecast))
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def _path(self, name):
+        return os.path.join(self.temp_dir.name, name)
+
+    def test_plot_forecast_leaves_no_open_figures(self):
+        _, series, forecast = self.plots[0]
+        plt.close('all')
+        plot_forecast(series, forecast, save_path=self._path('one.png'))
+        figure = plot_forecast(series, forecast)
+        self.assertTrue(os.path.exists(self._path('one.png')))
+        self.assertEqual(plt.get_fignums(), [])
+        self.assertEqual(len(figure.axes[0].lines), 2)
+
+    def test_intervals_are_shaded(self):
+        _, series, _ = self.plots[0]
+        frame = prediction_frame(ARIMA(series, order=(1, 1, 0)).fit(), 6, levels=[0.8, 0.95])
+        ax = new_figure().add_subplot()
+        draw_forecast(ax, series, frame)
+        self.assertEqual(len(ax.collections), 2)
+        self.assertEqual(len(ax.lines), 2)
+
+    def test_multi_page_pdf_and_grid(self):
+        render_pdf(self.plots, self._path('all.pdf'))
+        self.assertEqual(_page_count(self._path('all.pdf')), 5)
+        render_pdf(self.plots, self._path('grid.pdf'), rows=2, columns=2)
+        self.assertEqual(_page_count(self._path('grid.pdf')), 2)
+        render_grid(self.plots, self._path('grid.png'), columns=2)
+        self.assertTrue(os.path.getsize(self._path('grid.png')) > 0)
+
+    def test_background_renderer(self):
+        with PlotRenderer(max_workers=2) as renderer:
+            futures = [renderer.submit(series, forecast, self._path(f'{i}.png'), title=title)
+                       for i, (title, series, forecast) in enumerate(self.plots)]
+            pdf = renderer.submit_pdf(self.plots, self._path('all.pdf'))
+            grid = renderer.submit_grid(self.plots, self._path('grid.png'))
+        self.assertEqual([future.result() for future in futures], [self._path(f'{i}.png') for i in range(5)])
+        for i in range(5):
+            self.assertTrue(os.path.getsize(self._path(f'{i}.png')) > 0)
+        self.assertEqual(_page_count(pdf.result()), 5)
+        self.assertTrue(os.path.exists(grid.result()))
+
+
+if __name__ == '__main__':
+    unittest.main()
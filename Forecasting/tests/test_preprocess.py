@@ -0,0 +1,90 @@
+import os
+import tempfile
+import unittest
+import warnings
+
+import numpy as np
+import pandas as pd
+
+from Forecasting.batch import batch_forecasting
+from Forecasting.forecast import load_dataset, main_forecasting
+from Forecasting.preprocess import infer_interval, regularize, with_frequency
+
+
+def _frame(vm_id, times, values):
+    return pd.DataFrame({'vm_id': vm_id, 'time_stamp': pd.to_datetime(times), 'value': values})
+
+
+class TestPreprocess(unittest.TestCase):
+
+    def setUp(self):
+        self.df = pd.concat([
+            _frame('vm-b', ['2024-01-01 00:10', '2024-01-01 00:40', '2024-01-01 01:20', '2024-01-01 03:05'],
+                   [1.0, 3.0, 5.0, 11.0]),
+            _frame('vm-a', ['2024-01-01 02:00', '2024-01-01 00:00', '2024-01-01 01:00', '2024-01-01 01:30'],
+                   [30.0, 10.0, np.nan, 20.0]),
+        ], ignore_index=True)
+        self.df['vm_id'] = self.df['vm_id'].astype('category')
+
+    def test_matches_pandas_resample_per_group(self):
+        result = regularize(self.df, 'value', 'time_stamp', ['vm_id'], freq='h', fill=None)
+        self.assertEqual(list(result.columns), ['vm_id', 'time_stamp', 'value'])
+        self.assertIsInstance(result['vm_id'].dtype, pd.CategoricalDtype)
+        for vm_id, group in self.df.dropna().groupby('vm_id', observed=True):
+            expected = group.set_index('time_stamp')['value'].resample('h').mean()
+            actual = result[result['vm_id'] == vm_id].set_index('time_stamp')['value']
+            np.testing.assert_array_equal(actual.index, expected.index)
+            np.testing.assert_allclose(actual, expected)
+
+    def test_fill_methods_stay_within_groups(self):
+        interpolated = regularize(self.df, 'value', 'time_stamp', ['vm_id'], freq='h')
+        self.assertEqual(list(interpolated['value']), [10.0, 20.0, 30.0, 2.0, 5.0, 8.0, 11.0])
+        filled = regularize(self.df, 'value', 'time_stamp', ['vm_id'], freq='h', fill='ffill')
+        self.assertEqual(list(filled['value']), [10.0, 20.0, 30.0, 2.0, 5.0, 5.0, 11.0])
+        zeros = regularize(self.df, 'value', 'time_stamp', ['vm_id'], freq='h', fill='zero', aggregation='sum')
+        self.assertEqual(list(zeros['value']), [10.0, 20.0, 30.0, 4.0, 5.0, 0.0, 11.0])
+
+    def test_infer_interval(self):
+        times = pd.date_range('2024-01-01', periods=50, freq='15min').delete([3, 10, 11])
+        df = pd.DataFrame({'time_stamp': times, 'value': 1.0})
+        self.assertEqual(infer_interval(df, 'time_stamp'), pd.Timedelta('15min'))
+        self.assertEqual(len(regularize(df, 'value', 'time_stamp')), 50)
+        with self.assertRaises(ValueError):
+            regularize(df, 'value', 'time_stamp', freq='MS')
+        with self.assertRaises(ValueError):
+            regularize(df, 'value', 'time_stamp', aggregation='mode')
+
+    def test_with_frequency(self):
+        series = pd.Series(np.arange(5.0), index=pd.date_range('2024-01-01', periods=5, freq='h')._with_freq(None))
+        self.assertEqual(with_frequency(series).index.freqstr, 'h')
+        self.assertIsNone(with_frequency(series.iloc[[0, 1, 3]]).index.freq)
+
+    def test_loading_and_forecasting_on_a_regular_index(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            file_path = os.path.join(temp_dir, 'metrics.csv')
+            t = pd.date_range('2024-01-01', periods=96 * 4, freq='15min')
+            pd.DataFrame({'vm_id': np.repeat(['vm-a', 'vm-b'], len(t) // 2)[:len(t)],
+                          'time_stamp': np.tile(t[:len(t) // 2], 2),
+                          'value': np.sin(np.arange(len(t)) / 8.0) + 5}).drop(index=[7, 8]).to_csv(file_path,
+                                                                                                   index=False)
+
+            series = load_dataset(file_path, 'value', time_column='time_stamp', filters={'vm_id': 'vm-a'},
+                                  freq='h')
+            self.assertEqual(len(series), 48)
+            self.assertEqual(series.index.freqstr, 'h')
+            with warnings.catch_warnings():
+                warnings.simplefilter('error', UserWarning)
+                forecast = main_forecasting(file_path, 'value', steps=3, time_column='time_stamp',
+                                            filters={'vm_id': 'vm-a'}, freq='auto')
+            self.assertEqual(forecast.index[0], t[len(t) // 2 - 1] + pd.Timedelta('15min'))
+
+            forecasts = batch_forecasting(file_path, 'value', group_by=['vm_id'], steps=2, time_column='time_stamp',
+                                          freq='h')
+            self.assertTrue(forecasts['error'].isna().all())
+            self.assertEqual(len(forecasts), 4)
+            with self.assertRaises(ValueError):
+                batch_forecasting(file_path, 'value', group_by=['vm_id'], freq='h')
+
+
+if __name__ == '__main__':
+    unittest.main()
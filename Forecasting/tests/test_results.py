@@ -0,0 +1,109 @@
+import glob
+import json
+import os
+import tempfile
+import unittest
+
+import numpy as np
+import pandas as pd
+from statsmodels.tsa.arima.model import ARIMA
+from statsmodels.tsa.holtwinters import ExponentialSmoothing
+from statsmodels.tsa.statespace.sarimax import SARIMAX
+
+from Forecasting.batch import batch_forecasting
+from Forecasting.cli import main
+from Forecasting.results import ResultWriter, describe_fit, fit_details, read_results
+
+
+class TestResults(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.temp_dir = tempfile.TemporaryDirectory()
+        cls.file_path = os.path.join(cls.temp_dir.name, 'metrics.csv')
+        t = np.arange(60)
+        frames = [pd.DataFrame({'vm_id': vm_id, 'name': 'Percentage CPU', 'value': offset + np.sin(t / 3.0)})
+                  for vm_id, offset in [('vm-a', 5.0), ('vm-b', 50.0)]]
+        pd.concat(frames).to_csv(cls.file_path, index=False)
+        cls.series = pd.Series(10 + np.sin(2 * np.pi * t / 12) + 0.1 * t)
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.temp_dir.cleanup()
+
+    def _path(self, name):
+        return os.path.join(self.temp_dir.name, name)
+
+    def test_describe_fit(self):
+        self.assertEqual(describe_fit(ARIMA(self.series, order=(2, 1, 0)).fit()),
+                         ('arima', {'p': 2, 'd': 1, 'q': 0}))
+        model_fit = SARIMAX(self.series, order=(1, 0, 0), seasonal_order=(0, 1, 1, 12)).fit(disp=False)
+        self.assertEqual(describe_fit(model_fit),
+                         ('sarima', {'p': 1, 'd': 0, 'q': 0, 'P': 0, 'D': 1, 'Q': 1, 's': 12}))
+        model_fit = ExponentialSmoothing(self.series, seasonal='add', seasonal_periods=12).fit()
+        details = fit_details(model_fit, 0.5)
+        self.assertEqual(details['model_type'], 'exponential_smoothing')
+        self.assertEqual(json.loads(details['order']), {'seasonal': 'add', 'seasonal_periods': 12})
+        self.assertAlmostEqual(details['mse'], model_fit.sse / len(self.series))
+        self.assertEqual(details['fit_seconds'], 0.5)
+
+    def test_compact_types_and_append(self):
+        path = self._path('compact')
+        frame = pd.DataFrame({'vm_id': ['vm-a'] * 3, 'step': [1, 2, 3], 'forecast': [1.0, 2.0, 3.0], 'error': None,
+                              'time': pd.date_range('2024-01-01', periods=3, freq='h')})
+        with ResultWriter(path, run_id='first', run_date='2024-01-01') as sink:
+            sink.write(frame)
+        with ResultWriter(path, run_id='second', run_date='2024-01-02') as sink:
+            sink.write(frame)
+
+        results = read_results(path)
+        self.assertEqual(len(results), 6)
+        self.assertEqual(results['step'].dtype, np.int16)
+        self.assertEqual(results['forecast'].dtype, np.float32)
+        self.assertIsInstance(results['vm_id'].dtype, pd.CategoricalDtype)
+        self.assertEqual(str(results['time'].dt.tz), 'UTC')
+        self.assertEqual(sorted(set(results['run_id'])), ['first', 'second'])
+
+        results = read_results(path, filters={'run_date': '2024-01-02'}, columns=['run_id', 'forecast'])
+        self.assertEqual(list(results.columns), ['run_id', 'forecast'])
+        self.assertEqual(set(results['run_id']), {'second'})
+
+    def test_batches_and_partitions(self):
+        path = self._path('batches')
+        frame = pd.DataFrame({'vm_id': ['vm-a', 'vm-b'], 'step': [1, 1], 'forecast': [1.0, 2.0]})
+        with ResultWriter(path, partition_by=('run_date', 'vm_id'), batch_rows=4, run_date='2024-01-01') as sink:
+            for _ in range(3):
+                sink.write(frame)
+            # Two frames fill the first batch, the third is written on close
+            self.assertEqual(len(glob.glob(os.path.join(path, '*', '*', '*.parquet'))), 2)
+        self.assertTrue(os.path.isdir(os.path.join(path, 'run_date=2024-01-01', 'vm_id=vm-b')))
+        self.assertEqual(len(glob.glob(os.path.join(path, '*', '*', '*.parquet'))), 4)
+        self.assertEqual(len(read_results(path, filters={'vm_id': 'vm-b'})), 3)
+
+        with self.assertRaises(ValueError):
+            ResultWriter(path, partition_by=('host',)).write(frame)
+
+    def test_batch_forecasting_sink(self):
+        path = self._path('batch')
+        with ResultWriter(path) as sink:
+            forecasts = batch_forecasting(self.file_path, 'value', group_by=['vm_id'], steps=2, sink=sink)
+        self.assertEqual(forecasts['model_type'].tolist(), ['arima'] * 4)
+        self.assertEqual(set(forecasts['order']), {'{"d": 1, "p": 1, "q": 1}'})
+        self.assertTrue((forecasts['fit_seconds'] > 0).all())
+
+        results = read_results(path, filters={'vm_id': 'vm-b'})
+        np.testing.assert_allclose(results['forecast'], forecasts['forecast'][2:], rtol=1e-6)
+
+    def test_cli_results(self):
+        path = self._path('cli')
+        main([self.file_path, '--steps', '2', '--group-by', 'vm_id', '--results', path,
+              '--output', self._path('cli.csv')])
+        main([self.file_path, '--steps', '2', '--results', path, '--output', self._path('cli.csv')])
+        results = read_results(path)
+        self.assertEqual(len(results), 6)
+        self.assertEqual(results['vm_id'].isna().sum(), 2)
+        self.assertFalse(results['order'].isna().any())
+
+
+if __name__ == '__main__':
+    unittest.main()
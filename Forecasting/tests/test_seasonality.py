@@ -0,0 +1,52 @@
+import unittest
+from unittest import mock
+
+import numpy as np
+import pandas as pd
+
+from Forecasting import forecast
+from Forecasting.forecast import optimize_exponential_smoothing, _search_space
+from Forecasting.seasonality import autocorrelation, detect_seasonality, seasonal_candidates
+
+
+class TestSeasonality(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.rng = np.random.default_rng(11)
+        cls.t = np.arange(1000)
+
+    def seasonal_series(self, period, trend=0.01):
+        return 10 + trend * self.t + np.sin(2 * np.pi * self.t / period) + self.rng.normal(0, 0.3, len(self.t))
+
+    def test_autocorrelation_matches_direct_computation(self):
+        values = self.rng.normal(size=50)
+        centered = values - values.mean()
+        expected = [np.dot(centered[:len(values) - k], centered[k:]) / np.dot(centered, centered) for k in range(5)]
+        np.testing.assert_allclose(autocorrelation(values)[:5], expected)
+
+    def test_detects_periods_beyond_twelve(self):
+        for period in (7, 24, 52, 168):
+            self.assertEqual(detect_seasonality(self.seasonal_series(period, trend=0.001), max_period=200), period)
+
+    def test_no_season_in_noise_or_short_series(self):
+        self.assertEqual(seasonal_candidates(np.cumsum(self.rng.normal(size=400))), [])
+        self.assertIsNone(detect_seasonality(range(5)))
+
+    def test_search_space_is_narrowed_to_detected_period(self):
+        series = pd.Series(self.seasonal_series(24))
+        self.assertEqual(_search_space('sarima', series, 'auto')['s'], [24])
+        self.assertEqual(_search_space('sarima', series, None)['s'], (4, 12))
+        self.assertEqual(_search_space('exponential_smoothing', series, [12, 24])['seasonal_periods'], [12, 24])
+        self.assertEqual(_search_space('arima', series, 'auto'), forecast.ARIMA_SEARCH_SPACE)
+
+    def test_optimizer_searches_detected_period(self):
+        series = pd.Series(self.seasonal_series(24)[:200])
+        with mock.patch.object(forecast, '_run_study', wraps=forecast._run_study) as run_study:
+            model_fit = optimize_exponential_smoothing(series, steps=5, n_trials=2, seed=0)
+        self.assertEqual(run_study.call_args.kwargs['space']['seasonal_periods'], [24])
+        self.assertEqual(model_fit.model.seasonal_periods, 24)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,76 @@
+import os
+import unittest
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+import pandas as pd
+
+from Forecasting import batch
+from Forecasting.series_store import SeriesStore
+
+
+def _attached_sums(handle):
+    store = SeriesStore.attach(handle)
+    try:
+        return [float(store[i].sum()) for i in range(len(store))]
+    finally:
+        store.close()
+
+
+class TestSeriesStore(unittest.TestCase):
+
+    def setUp(self):
+        self.df = pd.DataFrame({
+            'vm_id': pd.Categorical(['b', 'a', 'b', 'a', 'c', 'b']),
+            'name': pd.Categorical(['cpu'] * 6),
+            'value': [1.0, 2.0, 3.0, 4.0, 5.0, 6.0],
+        })
+
+    def test_from_frame_matches_groupby(self):
+        store = SeriesStore.from_frame(self.df, 'value', ['vm_id', 'name'])
+        self.assertEqual(store.keys, [('a', 'cpu'), ('b', 'cpu'), ('c', 'cpu')])
+        self.assertEqual(list(store.offsets), [0, 2, 5, 6])
+        for (key, values), (group_key, group) in zip(store.items(), self.df.groupby(['vm_id', 'name'],
+                                                                                    observed=True)):
+            self.assertEqual(key, group_key)
+            np.testing.assert_array_equal(values, group['value'].to_numpy())
+        self.assertTrue(np.shares_memory(store[1], store.values))
+
+    def test_ungrouped_and_empty(self):
+        store = SeriesStore.from_frame(self.df, 'value')
+        self.assertEqual(store.keys, [()])
+        np.testing.assert_array_equal(store[0], self.df['value'].to_numpy())
+        self.assertEqual(len(SeriesStore.from_frame(self.df.iloc[:0], 'value', ['vm_id'])), 0)
+        with SeriesStore.from_frame(self.df.iloc[:0], 'value', ['vm_id'], shared=True) as empty:
+            self.assertEqual(empty.items(), [])
+
+    def test_workers_attach_to_shared_store(self):
+        groups = [(('a',), np.arange(3.0)), (('b',), np.arange(10.0)), (('c',), np.array([7.0]))]
+        with SeriesStore.from_groups(groups, shared=True) as store:
+            with ProcessPoolExecutor(max_workers=2) as executor:
+                sums = executor.submit(_attached_sums, store.handle).result()
+            self.assertEqual(sums, [3.0, 45.0, 7.0])
+            name = store.handle[0]
+        self.assertIsNone(store.values)
+        self.assertFalse(os.path.exists(os.path.join('/dev/shm', name)))
+        store.close()
+
+    def test_handle_requires_shared_store(self):
+        with self.assertRaises(ValueError):
+            SeriesStore.from_frame(self.df, 'value', ['vm_id']).handle
+
+    def test_batch_reads_series_from_store(self):
+        with SeriesStore.from_frame(self.df, 'value', ['vm_id'], shared=True) as store:
+            batch._attach_store(store.handle)
+            try:
+                key, forecast, error, details = batch._forecast_stored_group(1, 'arima', 2, False, {})
+            finally:
+                batch._worker_store.close()
+                batch._worker_store = None
+        self.assertEqual(key, 1)
+        self.assertEqual(len(forecast), 2)
+        self.assertIsNone(details)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,135 @@
+import asyncio
+import gc
+import os
+import tempfile
+import threading
+import time
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from unittest import mock
+
+import numpy as np
+import pandas as pd
+
+from Forecasting.forecast import main_forecasting
+from Forecasting.service import ForecastService, _default_services, forecast_async, shutdown_default_service
+
+
+class TestForecastService(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.temp_dir = tempfile.TemporaryDirectory()
+        cls.file_path = os.path.join(cls.temp_dir.name, 'metrics.csv')
+        t = np.arange(60)
+        pd.DataFrame({'value': 20 + np.sin(t / 3.0) + 0.01 * t}).to_csv(cls.file_path, index=False)
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.temp_dir.cleanup()
+
+    def _counting_forecast(self):
+        lock = threading.Lock()
+        state = {'calls': 0, 'running': 0, 'peak': 0}
+
+        def forecast(file_path, column_name, model_type='arima', steps=1, optimize=False, **kwargs):
+            with lock:
+                state['calls'] += 1
+                state['running'] += 1
+                state['peak'] = max(state['peak'], state['running'])
+            time.sleep(0.1)
+            with lock:
+                state['running'] -= 1
+            return pd.Series(np.full(steps, float(steps)), name='Forecast')
+        return forecast, state
+
+    def test_coalesces_duplicate_requests(self):
+        forecast, state = self._counting_forecast()
+
+        async def run():
+            with ThreadPoolExecutor(max_workers=4) as executor:
+                async with ForecastService(executor=executor) as service:
+                    results = await asyncio.gather(*[service.forecast(self.file_path, 'value', steps=3)
+                                                     for _ in range(5)])
+                    self.assertEqual(len(service), 0)
+                    return results
+
+        with mock.patch('Forecasting.service.main_forecasting', forecast):
+            results = asyncio.run(run())
+        self.assertEqual(state['calls'], 1)
+        for result in results:
+            self.assertEqual(list(result), [3.0, 3.0, 3.0])
+
+    def test_bounded_concurrency(self):
+        forecast, state = self._counting_forecast()
+
+        async def run():
+            with ThreadPoolExecutor(max_workers=4) as executor:
+                async with ForecastService(executor=executor, max_concurrency=2) as service:
+                    return await asyncio.gather(*[service.forecast(self.file_path, 'value', steps=steps)
+                                                  for steps in range(1, 6)])
+
+        with mock.patch('Forecasting.service.main_forecasting', forecast):
+            results = asyncio.run(run())
+        self.assertEqual(state['calls'], 5)
+        self.assertEqual(state['peak'], 2)
+        self.assertEqual([len(result) for result in results], [1, 2, 3, 4, 5])
+
+    def test_cancelled_caller_does_not_cancel_shared_forecast(self):
+        forecast, state = self._counting_forecast()
+
+        async def run():
+            with ThreadPoolExecutor(max_workers=1) as executor:
+                async with ForecastService(executor=executor) as service:
+                    first = asyncio.ensure_future(service.forecast(self.file_path, 'value', steps=2))
+                    second = asyncio.ensure_future(service.forecast(self.file_path, 'value', steps=2))
+                    await asyncio.sleep(0.01)
+                    first.cancel()
+                    return await second
+
+        with mock.patch('Forecasting.service.main_forecasting', forecast):
+            self.assertEqual(len(asyncio.run(run())), 2)
+        self.assertEqual(state['calls'], 1)
+
+    def test_default_service_per_event_loop(self):
+        forecast, state = self._counting_forecast()
+
+        async def run(requests=3):
+            results = await asyncio.gather(*[forecast_async(self.file_path, 'value', steps=steps)
+                                             for steps in range(1, requests + 1)])
+            return [len(result) for result in results], len(_default_services)
+
+        # A single worker makes requests wait on the semaphore in every loop, which
+        # then holds on to its loop; the services of closed loops are dropped
+        with mock.patch('Forecasting.service.main_forecasting', forecast), \
+                mock.patch('Forecasting.service.ProcessPoolExecutor', ThreadPoolExecutor), \
+                mock.patch('Forecasting.service._resolve_n_jobs', return_value=1):
+            self.addCleanup(shutdown_default_service)
+            for _ in range(3):
+                self.assertEqual(asyncio.run(run()), ([1, 2, 3], 1))
+            self.assertEqual(state['calls'], 9)
+            self.assertEqual(state['peak'], 1)
+
+            # Without contention the service is collected with its loop
+            shutdown_default_service()
+            self.assertEqual(asyncio.run(run(requests=1)), ([1], 1))
+            gc.collect()
+            self.assertEqual(len(_default_services), 0)
+
+    def test_process_pool_matches_main_forecasting(self):
+        async def run():
+            async with ForecastService(max_workers=1) as service:
+                forecast = await forecast_async(self.file_path, 'value', model_type='exponential_smoothing',
+                                                steps=4, service=service)
+                with self.assertRaises(FileNotFoundError):
+                    await service.forecast(os.path.join(self.temp_dir.name, 'missing.csv'), 'value')
+                with self.assertRaises(ValueError):
+                    await service.forecast(self.file_path, 'value', model_type='prophet')
+                return forecast
+
+        expected = main_forecasting(self.file_path, 'value', model_type='exponential_smoothing', steps=4)
+        np.testing.assert_allclose(asyncio.run(run()), expected)
+
+
+if __name__ == '__main__':
+    unittest.main()
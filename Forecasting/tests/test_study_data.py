@@ -0,0 +1,68 @@
+import unittest
+
+import numpy as np
+import pandas as pd
+
+from Forecasting.forecast import _StudyData, _evaluate, _nested_start, _order_key, _run_study, _score
+
+from helpers import seasonal_series
+
+
+class TestStudyData(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        series = seasonal_series()
+        cls.series = series.set_axis(pd.date_range('2024-01-01', periods=len(series), freq='h'))
+
+    def test_slices_are_contiguous_views(self):
+        data = _StudyData(self.series, 6)
+        self.assertEqual(data.values.dtype, np.float64)
+        for part in (data.train, data.test):
+            self.assertTrue(part.flags['C_CONTIGUOUS'])
+            self.assertTrue(np.shares_memory(part, data.values))
+        self.assertEqual(len(data.train), 90)
+
+        data = _StudyData(self.series, 6, folds=3)
+        self.assertEqual(len(data.train), data.origins[0])
+        self.assertIsNone(data.test)
+
+    def test_score_matches_series(self):
+        params = {'p': 1, 'd': 1, 'q': 1}
+        for folds in (1, 3):
+            expected, _ = _score('arima', self.series, params, 6, folds=folds)
+            value, _ = _score('arima', _StudyData(self.series, 6, folds), params, 6, folds=folds)
+            self.assertAlmostEqual(value, expected)
+
+    def test_nested_start(self):
+        fitted = {_order_key('arima', {'p': 1, 'd': 1, 'q': 0}): {'ar.L1': 0.5, 'sigma2': 1.0},
+                  _order_key('arima', {'p': 1, 'd': 1, 'q': 1}): {'ar.L1': 0.4, 'ma.L1': 0.2, 'sigma2': 0.9},
+                  _order_key('arima', {'p': 0, 'd': 0, 'q': 1}): {'const': 1.0, 'ma.L1': 0.3, 'sigma2': 2.0}}
+        start = _nested_start('arima', {'p': 2, 'd': 1, 'q': 1}, fitted)
+        self.assertEqual(start['ma.L1'], 0.2)
+        self.assertIsNone(_nested_start('arima', {'p': 0, 'd': 1, 'q': 2}, fitted))
+        self.assertIsNone(_nested_start('arima', {'p': 2, 'd': 2, 'q': 2}, fitted))
+        self.assertIsNone(_nested_start('exponential_smoothing', {'seasonal': 'add', 'seasonal_periods': 12}, {}))
+
+    def test_nested_start_fits_larger_order(self):
+        data = _StudyData(self.series, 6)
+        small = {'p': 1, 'd': 1, 'q': 0}
+        _, error, fitted_params, _ = _evaluate('arima', data, small, 6)
+        self.assertIsNone(error)
+        self.assertEqual(set(fitted_params), {'ar.L1', 'sigma2'})
+
+        start = _nested_start('arima', {'p': 2, 'd': 1, 'q': 1}, {_order_key('arima', small): fitted_params})
+        value, error, fitted_params, _ = _evaluate('arima', data, {'p': 2, 'd': 1, 'q': 1}, 6, start_params=start)
+        self.assertIsNone(error)
+        self.assertLess(value, float('inf'))
+        self.assertEqual(set(fitted_params), {'ar.L1', 'ar.L2', 'ma.L1', 'sigma2'})
+
+    def test_pooled_study_is_reproducible(self):
+        first, second = (_run_study('arima', self.series, 6, n_trials=6, n_jobs=2, seed=0, search='pruned')
+                         for _ in range(2))
+        self.assertEqual([t.params for t in first.trials], [t.params for t in second.trials])
+        self.assertEqual([t.value for t in first.trials], [t.value for t in second.trials])
+
+
+if __name__ == '__main__':
+    unittest.main()